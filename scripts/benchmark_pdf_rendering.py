@@ -0,0 +1,486 @@
+"""
+PDF rendering benchmark (no database).
+
+Builds synthetic LocationReport / LocationReportYoY models and
+operational-matrix DataFrames at a configurable scale, times the PDF
+builders and full runners, and compares against a stored baseline.
+
+Each case runs in its own child process so peak RSS is per case.
+Timings are machine-specific, so the baseline is local and not committed
+(scripts/pdf_benchmark_baseline.json, git-ignored): the first run at a
+scale on a machine saves it, later runs compare against it. Exits 1 when
+a case errors or regresses (slower by --tolerance and --min-delta, the
+same 0.5s floor as report_perf).
+
+Usage:
+    python scripts/benchmark_pdf_rendering.py --sites 40 --modalities 8
+    python scripts/benchmark_pdf_rendering.py --save-baseline
+    python scripts/benchmark_pdf_rendering.py --case combined_pdf
+"""
+
+import argparse
+import io
+import json
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+BASELINE = ROOT / "scripts" / "pdf_benchmark_baseline.json"
+
+REPORT_DATE = date(2026, 1, 15)
+MODALITY_NAMES = [
+    "CT", "MRI", "ULTRASOUND", "X-RAY", "MAMMOGRAPHY", "NUCLEAR MEDICINE",
+    "PET", "DEXA", "FLUORO", "INTERVENTIONAL", "ECHO", "VASCULAR",
+]
+
+
+# ============================================================
+# SYNTHETIC DATA
+# ============================================================
+
+def _modalities(count: int) -> list[str]:
+    names = MODALITY_NAMES[:count]
+    names += [f"MODALITY {i}" for i in range(len(names), count)]
+    return names
+
+
+def _sites(count: int) -> list[str]:
+    return [f"Synthetic Imaging Center {i:03d}" for i in range(count)]
+
+
+def _status(enum, delta, band):
+    if delta is None:
+        return enum.INFO
+    return enum.GREEN if delta >= 0 else enum.YELLOW if delta >= -band else enum.RED
+
+
+def make_location_reports(sites: int, modalities: int, seed: int = 7):
+    from radiology_reports.reports.models.location_report import (
+        LocationReport, PeriodMetrics, ModalityMetrics, Status,
+    )
+
+    rng = random.Random(seed)
+
+    def period(label, scale, band):
+        rows = []
+        for name in _modalities(modalities):
+            budget = rng.randint(5, 60) * scale
+            completed = max(0, budget + rng.randint(-15, 15) * scale)
+            delta = completed - budget
+            rows.append(ModalityMetrics(name, completed, budget, delta, _status(Status, delta, band)))
+        completed = sum(r.completed_exams for r in rows)
+        budget = sum(r.budget_exams for r in rows)
+        return PeriodMetrics(
+            label=label,
+            is_business_day=True,
+            business_days_elapsed=scale if label == "MTD" else 0,
+            business_days_total=21 if label == "MTD" else None,
+            completed_exams=completed,
+            budget_exams=budget,
+            delta=completed - budget,
+            status=_status(Status, completed - budget, band * 2),
+            modalities=rows,
+        )
+
+    return [
+        LocationReport(
+            location_name=site,
+            report_date=REPORT_DATE,
+            daily=period("DAILY", 1, 5),
+            mtd=period("MTD", 10, 10),
+        )
+        for site in _sites(sites)
+    ]
+
+
+def make_location_yoy_reports(sites: int, modalities: int, seed: int = 7):
+    from radiology_reports.reports.models.location_report_yoy import (
+        LocationReportYoY, PeriodMetricsYoY, ModalityMetricsYoY, Status,
+    )
+
+    rng = random.Random(seed)
+
+    def pct_status(pct):
+        if pct is None:
+            return Status.INFO
+        return Status.GREEN if pct >= 0.05 else Status.RED if pct <= -0.05 else Status.YELLOW
+
+    def period(label, scale):
+        rows = []
+        for name in _modalities(modalities):
+            prev = rng.randint(5, 60) * scale
+            completed = max(0, prev + rng.randint(-15, 15) * scale)
+            delta = completed - prev
+            pct = delta / prev if prev else None
+            rows.append(ModalityMetricsYoY(name, prev, completed, delta, pct, pct_status(pct)))
+        prev = sum(r.prev_year_exams for r in rows)
+        completed = sum(r.completed_exams for r in rows)
+        pct = (completed - prev) / prev if prev else None
+        return PeriodMetricsYoY(
+            label=label,
+            is_business_day=True,
+            business_days_elapsed=scale if label == "MTD" else 1,
+            business_days_total=21 if label == "MTD" else None,
+            prev_year_exams=prev,
+            completed_exams=completed,
+            delta=completed - prev,
+            pct=pct,
+            status=pct_status(pct),
+            modalities=rows,
+        )
+
+    return [
+        LocationReportYoY(
+            location_name=site,
+            report_date=REPORT_DATE,
+            prev_year=REPORT_DATE.year - 1,
+            curr_year=REPORT_DATE.year,
+            daily=period("DAILY", 1),
+            mtd=period("MTD", 10),
+        )
+        for site in _sites(sites)
+    ]
+
+
+def make_operational_matrix(sites: int, modalities: int, seed: int = 7):
+    """
+    Modality × Location variance matrix (index = modality), like the
+    operational reports feed to build_operational_matrix_table.
+    """
+    import pandas as pd
+
+    rng = random.Random(seed)
+    columns = [s.replace(" ", "_") for s in _sites(sites)]
+    data = {
+        col: [rng.randint(-40, 40) for _ in range(modalities)]
+        for col in columns
+    }
+    df = pd.DataFrame(data, index=_modalities(modalities))
+    df["Total_Result"] = df.sum(axis=1)
+    return df
+
+
+# ============================================================
+# HELPERS
+# ============================================================
+
+_PAGE_RE = re.compile(rb"/Type\s*/Page(?![a-zA-Z])")
+
+
+def _count_pages(pdf_bytes: bytes) -> int:
+    return len(_PAGE_RE.findall(pdf_bytes))
+
+
+def _render(elements, pagesize=None) -> int:
+    """
+    Lay out flowables into an in-memory PDF; returns page count.
+    """
+    from reportlab.platypus import SimpleDocTemplate
+    from reportlab.lib.pagesizes import LETTER
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=pagesize or LETTER,
+        rightMargin=36,
+        leftMargin=36,
+        topMargin=36,
+        bottomMargin=36,
+    )
+    doc.build(elements)
+    return doc.page
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return psutil.Process().memory_info().peak_wset / (1024 * 1024)
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS reports bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ============================================================
+# CASES
+# ============================================================
+# Each case prepares its inputs and returns a callable that does the timed
+# work and returns the number of pages it produced (0 = flowables only).
+
+def case_location_elements(args):
+    from reportlab.platypus import PageBreak
+    from radiology_reports.reports.pdf.manager_location_page import (
+        build_manager_location_elements,
+    )
+
+    reports = make_location_reports(args.sites, args.modalities)
+
+    def work():
+        elements = []
+        for report in reports:
+            elements.extend(build_manager_location_elements(report))
+            elements.append(PageBreak())
+        return _render(elements) if args.render else 0
+
+    return work
+
+
+def case_summary_page(args):
+    from radiology_reports.reports.pdf.manager_summary_page import (
+        build_manager_summary_page,
+    )
+
+    reports = make_location_reports(args.sites, args.modalities)
+
+    def work():
+        elements = build_manager_summary_page(reports)
+        return _render(elements) if args.render else 0
+
+    return work
+
+
+def case_summary_yoy_page(args):
+    from radiology_reports.reports.pdf.manager_summary_yoy_page import (
+        build_manager_summary_yoy_page,
+    )
+
+    reports = make_location_yoy_reports(args.sites, args.modalities)
+
+    def work():
+        elements = build_manager_summary_yoy_page(reports)
+        return _render(elements) if args.render else 0
+
+    return work
+
+
+def case_operational_matrix(args):
+    from reportlab.lib.pagesizes import LETTER, landscape
+    from radiology_reports.pdf.table_builder import build_operational_matrix_table
+
+    df = make_operational_matrix(args.sites, args.modalities)
+    pagesize = landscape(LETTER)
+
+    def work():
+        table = build_operational_matrix_table(df, "Modality", pagesize)
+        return _render([table], pagesize) if args.render else 0
+
+    return work
+
+
+def _runner_case(make_reports, runner_name, module):
+    def case(args):
+        import importlib
+
+        runner = getattr(importlib.import_module(module), runner_name)
+        reports = make_reports(args.sites, args.modalities)
+        out_dir = Path(tempfile.mkdtemp(prefix="pdf_bench_"))
+
+        def work():
+            result = runner(
+                target_date=REPORT_DATE,
+                output_root=out_dir,
+                force=True,
+                reports=reports,
+            )
+            paths = result if isinstance(result, list) else [result]
+            return sum(_count_pages(Path(p).read_bytes()) for p in paths)
+
+        return work
+
+    return case
+
+
+BUDGET_RUNNER = "radiology_reports.reports.pdf.manager_report_runner"
+YOY_RUNNER = "radiology_reports.reports.pdf.manager_yoy_report_runner"
+
+CASES = {
+    "location_elements": case_location_elements,
+    "summary_page": case_summary_page,
+    "summary_yoy_page": case_summary_yoy_page,
+    "operational_matrix": case_operational_matrix,
+    "location_pdfs": _runner_case(make_location_reports, "run_manager_pdf_report", BUDGET_RUNNER),
+    "combined_pdf": _runner_case(make_location_reports, "run_manager_combined_pdf", BUDGET_RUNNER),
+    "location_pdfs_yoy": _runner_case(make_location_yoy_reports, "run_manager_pdf_yoy_report", YOY_RUNNER),
+    "combined_pdf_yoy": _runner_case(make_location_yoy_reports, "run_manager_combined_yoy_pdf", YOY_RUNNER),
+}
+
+
+def run_case(name: str, args) -> dict:
+    """
+    Run one case in this process (best of --repeat).
+    """
+    work = CASES[name](args)
+    work()  # warm-up: imports, font metrics, caches
+
+    best = None
+    pages = 0
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        pages = work()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return {
+        "seconds": round(best, 4),
+        "pages": pages,
+        "pages_per_sec": round(pages / best, 1) if pages and best else None,
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_case_isolated(name: str, args) -> dict:
+    cmd = [
+        sys.executable, __file__,
+        "--case", name,
+        "--json",
+        "--sites", str(args.sites),
+        "--modalities", str(args.modalities),
+        "--repeat", str(args.repeat),
+    ]
+    if not args.render:
+        cmd.append("--no-render")
+
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        return {"error": result.stderr.strip().splitlines()[-1] if result.stderr else "failed"}
+    return json.loads(result.stdout)
+
+
+# ============================================================
+# BASELINE
+# ============================================================
+
+def scale_key(args) -> str:
+    return f"sites={args.sites},modalities={args.modalities},render={int(args.render)}"
+
+
+def load_baseline() -> dict:
+    if not BASELINE.exists():
+        return {}
+    return json.loads(BASELINE.read_text(encoding="utf-8"))
+
+
+def compare(name: str, current: dict, baseline: dict, tolerance: float, min_delta: float = 0.0) -> list[str]:
+    problems = []
+    if "error" in current:
+        return [f"{name}: ERROR {current['error']}"]
+    base = baseline.get(name)
+    if not base:
+        return [f"{name}: no baseline for this case (run with --save-baseline)"]
+
+    # slower than tolerance AND by min_delta seconds, so sub-second cases don't flag on jitter
+    if (
+        current["seconds"] > base["seconds"] * (1 + tolerance)
+        and current["seconds"] - base["seconds"] >= min_delta
+    ):
+        problems.append(
+            f"{name}: {current['seconds']:.3f}s vs baseline {base['seconds']:.3f}s"
+        )
+    if (
+        current.get("peak_rss_mb") and base.get("peak_rss_mb")
+        and current["peak_rss_mb"] > base["peak_rss_mb"] * (1 + tolerance)
+    ):
+        problems.append(
+            f"{name}: peak RSS {current['peak_rss_mb']:.0f} MB "
+            f"vs baseline {base['peak_rss_mb']:.0f} MB"
+        )
+    return problems
+
+
+def print_table(results: dict, baseline: dict) -> None:
+    print(f"{'case':<22}{'seconds':>10}{'pages':>8}{'pages/s':>10}{'RSS MB':>9}{'vs base':>10}")
+    for name, r in results.items():
+        if "error" in r:
+            print(f"{name:<22}  ERROR: {r['error']}")
+            continue
+        base = baseline.get(name)
+        ratio = f"{r['seconds'] / base['seconds']:.2f}x" if base else "-"
+        pps = f"{r['pages_per_sec']:.1f}" if r["pages_per_sec"] else "-"
+        rss = f"{r['peak_rss_mb']:.0f}" if r["peak_rss_mb"] else "-"
+        print(f"{name:<22}{r['seconds']:>10.3f}{r['pages']:>8}{pps:>10}{rss:>9}{ratio:>10}")
+
+
+# ============================================================
+# MAIN
+# ============================================================
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark PDF rendering with synthetic reports.")
+    parser.add_argument("--sites", type=int, default=40)
+    parser.add_argument("--modalities", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--case", choices=sorted(CASES), action="append",
+                        help="Run only these cases (repeatable).")
+    parser.add_argument("--no-render", dest="render", action="store_false",
+                        help="Time flowable builders only, without laying out pages.")
+    parser.add_argument("--tolerance", type=float, default=0.20,
+                        help="Allowed slowdown / RSS growth vs baseline (default 20%%).")
+    parser.add_argument("--min-delta", type=float, default=0.5,
+                        help="...and at least this many seconds slower (default 0.5).")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="Replace this machine's baseline for this scale with these results.")
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    # Child mode: one case, JSON on stdout
+    if args.json:
+        print(json.dumps(run_case(args.case[0], args)))
+        return 0
+
+    names = args.case or list(CASES)
+    results = {name: run_case_isolated(name, args) for name in names}
+
+    stored = load_baseline()
+    baseline = stored.get(scale_key(args), {})
+
+    print(f"PDF benchmark ({scale_key(args)}, best of {args.repeat})")
+    print_table(results, baseline)
+
+    errors = [name for name, r in results.items() if "error" in r]
+
+    # Cases with no baseline yet on this machine: their timings become it
+    new = [name for name, r in results.items() if name not in baseline and "error" not in r]
+    if args.save_baseline or new:
+        if args.save_baseline and errors:
+            print(f"❌ Baseline NOT saved: case(s) failed: {', '.join(errors)}")
+            return 1
+        saved = results if args.save_baseline else {name: results[name] for name in new}
+        baseline = stored[scale_key(args)] = {**baseline, **saved}
+        BASELINE.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baseline saved for {', '.join(saved)}: {BASELINE}")
+        if args.save_baseline:
+            return 0
+
+    problems = []
+    for name, r in results.items():
+        problems.extend(compare(name, r, baseline, args.tolerance, args.min_delta))
+
+    if problems:
+        print("❌ Regressions:")
+        for p in problems:
+            print(f"  {p}")
+        return 1
+
+    print("✅ No regressions vs baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
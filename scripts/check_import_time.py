@@ -0,0 +1,125 @@
+"""
+Import-time check for the entry-point CLIs (no database).
+
+Imports each entry module in a fresh interpreter with `-X importtime`,
+reports the total and the slowest cumulative imports, and fails when an
+entry module pulls in a heavy dependency it should only load on demand
+(pyodbc, reportlab, pydantic-settings, matplotlib, sklearn, prophet) or
+exceeds the startup budget (DEFAULT_BUDGET_MS, --budget-ms to override,
+0 to disable). Suitable as a CI step.
+
+Usage:
+    python scripts/check_import_time.py
+    python scripts/check_import_time.py --top 15 --budget-ms 800
+    python scripts/check_import_time.py --module radiology_reports.cli.manager_pdf
+"""
+
+import argparse
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+
+ENTRY_MODULES = [
+    "radiology_reports.capacity_reporting.cli",
+    "radiology_reports.capacity_reporting.ops.cli",
+    "radiology_reports.cli.manager_pdf",
+    "radiology_reports.cli.manager_pdf_yoy",
+    "radiology_reports.cli.daily_capacity_executive_summary",
+]
+
+# Entry modules measured ~470-550 ms (pandas dominates); headroom for jitter
+DEFAULT_BUDGET_MS = 750.0
+
+# Loaded on first use (query, PDF render, email, chart, model fit) — never at import
+DEFERRED = ["pyodbc", "reportlab", "pydantic_settings", "matplotlib", "sklearn", "prophet"]
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+# ============================================================
+# MEASURE
+# ============================================================
+
+def measure(module: str) -> dict:
+    """Import `module` in a child interpreter; cumulative µs per imported module."""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT / "src"), env.get("PYTHONPATH")]))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=ROOT,
+    )
+    cumulative = {}
+    for m in LINE.finditer(proc.stderr):
+        name = m.group(4)
+        cumulative[name] = max(cumulative.get(name, 0), int(m.group(2)))
+
+    error = None
+    if proc.returncode != 0:
+        error = (proc.stderr.strip().splitlines() or ["import failed"])[-1]
+    return {"cumulative": cumulative, "total_us": cumulative.get(module, 0), "error": error}
+
+
+def violations(module: str, result: dict, budget_ms: float | None) -> list[str]:
+    problems = []
+    if result["error"]:
+        problems.append(f"{module}: {result['error']}")
+    loaded = {name.split(".")[0] for name in result["cumulative"]}
+    for heavy in DEFERRED:
+        if heavy in loaded:
+            problems.append(f"{module}: imports {heavy} at import time")
+    if budget_ms and result["total_us"] / 1000 > budget_ms:
+        problems.append(f"{module}: {result['total_us'] / 1000:.0f} ms exceeds budget {budget_ms:.0f} ms")
+    return problems
+
+
+# ============================================================
+# REPORT
+# ============================================================
+
+def print_report(module: str, result: dict, top: int) -> None:
+    print(f"{module}: {result['total_us'] / 1000:.1f} ms")
+    top_level = {}
+    for name, us in result["cumulative"].items():
+        root = name.split(".")[0]
+        if root != "radiology_reports":
+            top_level[root] = max(top_level.get(root, 0), us)
+    for name, us in sorted(top_level.items(), key=lambda kv: kv[1], reverse=True)[:top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Check import time of the entry-point CLIs.")
+    parser.add_argument("--module", action="append", help="Entry module to check (repeatable; default: all CLIs).")
+    parser.add_argument("--top", type=int, default=10, help="Slowest top-level packages to list per module.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help=f"Fail when an entry module takes longer than this (default {DEFAULT_BUDGET_MS:.0f}; 0 disables).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    problems = []
+    for module in args.module or ENTRY_MODULES:
+        result = measure(module)
+        print_report(module, result, args.top)
+        problems += violations(module, result, args.budget_ms)
+
+    if problems:
+        print()
+        for problem in problems:
+            print(f"FAIL: {problem}", file=sys.stderr)
+        return 1
+    budget = f"all within {args.budget_ms:.0f} ms" if args.budget_ms else "no time budget"
+    print(f"\nOK: no deferred dependency imported at startup, {budget}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,206 @@
+"""
+Delivery check for utils/mail_queue.py, in-process (no real relay).
+
+Drives MailQueue through its smtp_factory with fake sessions and with a
+local SMTP stand-in on 127.0.0.1 (plain smtplib on the client side):
+
+    reuse      consecutive messages for one relay share one session
+    backoff    a message waiting out a retry backoff does not hold up
+               mail queued behind it, and is delivered on its retry
+    permanent  a 5xx reply fails the message at once (no retry)
+    relay      the default factory delivers to the local stand-in
+
+Usage:
+    python scripts/verify_mail_queue.py
+"""
+
+import smtplib
+import socketserver
+import sys
+import threading
+import time
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from radiology_reports.utils.mail_queue import MailQueue, SmtpSettings  # noqa: E402
+
+SETTINGS = SmtpSettings(server="relay.test", sender="reports@example.com")
+TIMEOUT = 10
+
+
+def _message(subject: str) -> EmailMessage:
+    msg = EmailMessage()
+    msg["Subject"] = subject
+    msg["From"] = SETTINGS.sender
+    msg["To"] = "ops@example.com"
+    msg.set_content(f"{subject} body")
+    return msg
+
+
+# =====================================================
+# Fake sessions
+# =====================================================
+class FakeRelay:
+    """smtp_factory stand-in: records sessions and sends; `fail` picks a reply per send."""
+
+    def __init__(self, fail: Callable[[str, int], Exception | None] = lambda subject, attempt: None):
+        self.fail = fail
+        self.sessions = 0
+        self.sent: List[Tuple[str, float]] = []
+        self.tries: dict = {}
+
+    def __call__(self, settings: SmtpSettings) -> "FakeSession":
+        self.sessions += 1
+        return FakeSession(self)
+
+
+class FakeSession:
+    def __init__(self, relay: FakeRelay):
+        self.relay = relay
+
+    def send_message(self, msg, from_addr=None, to_addrs=None):
+        subject = msg["Subject"]
+        attempt = self.relay.tries[subject] = self.relay.tries.get(subject, 0) + 1
+        exc = self.relay.fail(subject, attempt)
+        if exc is not None:
+            raise exc
+        self.relay.sent.append((subject, time.monotonic()))
+
+    def quit(self):
+        pass
+
+
+# =====================================================
+# Local SMTP stand-in
+# =====================================================
+class _SmtpStandIn(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib.send_message; DATA payloads go to server.messages."""
+
+    def handle(self):
+        self.wfile.write(b"220 stand-in ready\r\n")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            verb = line[:4].upper()
+            if verb in (b"EHLO", b"HELO"):
+                self.wfile.write(b"250 stand-in\r\n")
+            elif verb == b"DATA":
+                self.wfile.write(b"354 end with <CRLF>.<CRLF>\r\n")
+                data = []
+                while (chunk := self.rfile.readline()) not in (b".\r\n", b""):
+                    data.append(chunk)
+                self.server.messages.append(b"".join(data))
+                self.wfile.write(b"250 queued\r\n")
+            elif verb == b"QUIT":
+                self.wfile.write(b"221 bye\r\n")
+                return
+            else:  # MAIL / RCPT / RSET / NOOP
+                self.wfile.write(b"250 OK\r\n")
+
+
+class _StandInServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _SmtpStandIn)
+        self.messages: List[bytes] = []
+
+
+# =====================================================
+# Checks
+# =====================================================
+def check_reuse() -> str:
+    relay = FakeRelay()
+    mq = MailQueue(smtp_factory=relay, linger_seconds=5)
+    for i in range(3):
+        mq.submit(SETTINGS, _message(f"reuse {i}"), ["ops@example.com"])
+    failures = mq.flush(TIMEOUT)
+    assert not failures, failures
+    assert len(relay.sent) == 3, relay.sent
+    assert relay.sessions == 1, f"{relay.sessions} sessions for 3 messages"
+    return "3 messages, 1 session"
+
+
+def check_backoff() -> str:
+    backoff = 1.0
+    relay = FakeRelay(
+        lambda subject, attempt: smtplib.SMTPServerDisconnected("dropped")
+        if subject == "flaky" and attempt == 1 else None
+    )
+    mq = MailQueue(smtp_factory=relay, backoff_seconds=backoff, linger_seconds=5)
+    start = time.monotonic()
+    flaky = mq.submit(SETTINGS, _message("flaky"), ["ops@example.com"])
+    behind = mq.submit(SETTINGS, _message("behind"), ["ops@example.com"])
+    behind.result(TIMEOUT)
+    waited = time.monotonic() - start
+    assert waited < backoff / 2, f"queued mail waited {waited:.2f}s behind a {backoff}s backoff"
+    flaky.result(TIMEOUT)
+    sent = dict(relay.sent)
+    assert sent["flaky"] - start >= backoff, "retry went out before its backoff"
+    assert [s for s, _ in relay.sent] == ["behind", "flaky"], relay.sent
+    assert relay.tries["flaky"] == 2, relay.tries
+    return f"queued mail sent after {waited * 1000:.0f} ms; retry after {sent['flaky'] - start:.2f}s"
+
+
+def check_permanent() -> str:
+    relay = FakeRelay(
+        lambda subject, attempt: smtplib.SMTPDataError(550, b"mailbox unavailable")
+        if subject == "rejected" else None
+    )
+    mq = MailQueue(smtp_factory=relay, backoff_seconds=30, linger_seconds=5)
+    rejected = mq.submit(SETTINGS, _message("rejected"), ["nobody@example.com"])
+    ok = mq.submit(SETTINGS, _message("ok"), ["ops@example.com"])
+    failures = mq.flush(TIMEOUT)
+    assert ok.done() and ok.exception() is None
+    assert len(failures) == 1 and rejected.exception() is failures[0], failures
+    assert relay.tries["rejected"] == 1, relay.tries
+    return "550 failed without retry"
+
+
+def check_relay() -> str:
+    server = _StandInServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        host, port = server.server_address
+        settings = SmtpSettings(server=host, port=port, sender=SETTINGS.sender)
+        mq = MailQueue(linger_seconds=0.2)
+        for i in range(2):
+            mq.submit(settings, _message(f"relay {i}"), ["ops@example.com"])
+        failures = mq.flush(TIMEOUT)
+        assert not failures, failures
+        assert len(server.messages) == 2, server.messages
+        assert b"Subject: relay 1" in server.messages[1]
+    finally:
+        server.shutdown()
+        server.server_close()
+    return f"2 messages accepted by stand-in on port {port}"
+
+
+CHECKS = {
+    "reuse": check_reuse,
+    "backoff": check_backoff,
+    "permanent": check_permanent,
+    "relay": check_relay,
+}
+
+
+def main() -> int:
+    failed = 0
+    for name, check in CHECKS.items():
+        try:
+            print(f"✅ {name}: {check()}")
+        except Exception as exc:
+            failed += 1
+            print(f"❌ {name}: {type(exc).__name__}: {exc}")
+    print(f"{len(CHECKS)} mail queue checks, {failed} failed")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
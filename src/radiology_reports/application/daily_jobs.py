@@ -0,0 +1,295 @@
+# src/radiology_reports/application/daily_jobs.py
+"""
+Run the daily report jobs as one process.
+
+The morning jobs (manager PDFs, YoY PDFs, scheduling capacity, OPS
+capacity) used to start one Python process each, each paying interpreter
+start-up, imports, the DB server probe and the same reference loads.
+Here they are a declared DAG of Jobs run on a thread pool:
+
+- a job starts once everything in its `after` list succeeded; jobs
+  without dependencies run concurrently (the work is mostly DB waits)
+- everything runs inside data.shared_cache.shared_scope(): one server
+  probe, one connection per worker thread, and reference data / loaded
+  DataFrames fetched once and shared (each job gets its own copy)
+- failures are isolated: a failed job is reported, its dependents are
+  skipped, unrelated jobs carry on
+- each job's console output is captured and printed as one block when
+  it finishes, so concurrent reports don't interleave. Capture follows
+  the job's context: threads a job starts must run their work in a copy
+  of it (contextvars.copy_context(), as reporting_service's concurrent
+  loads do) or their output goes straight to the console
+- shared process-wide state the jobs touch (business-day and operating
+  calendars) is built under a lock, once
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from radiology_reports.data.shared_cache import shared_scope
+from radiology_reports.utils.logger import get_logger
+from radiology_reports.utils.tracing import span
+
+log = get_logger(__name__)
+
+
+@dataclass
+class Job:
+    name: str
+    run: Callable[[], None]
+    after: Tuple[str, ...] = ()
+
+
+@dataclass
+class JobResult:
+    name: str
+    status: str  # ok | failed | skipped
+    seconds: float = 0.0
+    error: Optional[str] = None
+    output: str = ""
+
+
+# =====================================================
+# DAG
+# =====================================================
+def topological_order(jobs: Iterable[Job]) -> List[str]:
+    """Job names in dependency order; ValueError on unknown names or cycles."""
+    jobs = {job.name: job for job in jobs}
+    for job in jobs.values():
+        unknown = set(job.after) - set(jobs)
+        if unknown:
+            raise ValueError(f"Job {job.name} depends on unknown job(s): {', '.join(sorted(unknown))}")
+
+    order: List[str] = []
+    state: Dict[str, str] = {}
+
+    def visit(name, path):
+        if state.get(name) == "done":
+            return
+        if state.get(name) == "visiting":
+            raise ValueError(f"Job dependency cycle: {' -> '.join(path + [name])}")
+        state[name] = "visiting"
+        for dep in jobs[name].after:
+            visit(dep, path + [name])
+        state[name] = "done"
+        order.append(name)
+
+    for name in jobs:
+        visit(name, [])
+    return order
+
+
+def select_jobs(jobs: List[Job], only: Iterable[str] = (), skip: Iterable[str] = ()) -> List[Job]:
+    """Subset of jobs; dependencies on jobs left out are dropped."""
+    names = [job.name for job in jobs]
+    for name in list(only) + list(skip):
+        if name not in names:
+            raise ValueError(f"Unknown job: {name} (choose from {', '.join(names)})")
+
+    keep = set(only or names) - set(skip)
+    return [
+        Job(job.name, job.run, tuple(d for d in job.after if d in keep))
+        for job in jobs
+        if job.name in keep
+    ]
+
+
+# =====================================================
+# Per-thread stdout
+# =====================================================
+class _ThreadStdout:
+    """sys.stdout stand-in sending writes made in a job's context to that job's buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._buffer: ContextVar[Optional[StringIO]] = ContextVar("job_stdout", default=None)
+
+    def capture(self, buffer: Optional[StringIO]) -> None:
+        self._buffer.set(buffer)
+
+    def write(self, text):
+        return (self._buffer.get() or self._stream).write(text)
+
+    def flush(self):
+        if self._buffer.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+# =====================================================
+# Runner
+# =====================================================
+def _run_one(job: Job, stdout: _ThreadStdout) -> JobResult:
+    buffer = StringIO()
+    stdout.capture(buffer)
+    start = time.perf_counter()
+    try:
+        with span(f"job.{job.name}"):
+            job.run()
+        status, error = "ok", None
+    except Exception as exc:
+        log.error("Job %s failed: %s\n%s", job.name, exc, traceback.format_exc())
+        status, error = "failed", f"{type(exc).__name__}: {exc}"
+    finally:
+        stdout.capture(None)
+    return JobResult(job.name, status, time.perf_counter() - start, error, buffer.getvalue())
+
+
+def run_jobs(
+    jobs: List[Job],
+    max_workers: int = 4,
+    on_done: Optional[Callable[[JobResult], None]] = None,
+) -> Dict[str, JobResult]:
+    """
+    Run the DAG; returns results in dependency order. on_done is called on
+    the calling thread as each job finishes (or is skipped).
+    """
+    order = topological_order(jobs)
+    by_name = {job.name: job for job in jobs}
+    waiting = {name: set(by_name[name].after) for name in order}
+    dependents: Dict[str, List[str]] = {name: [] for name in order}
+    for name in order:
+        for dep in by_name[name].after:
+            dependents[dep].append(name)
+
+    results: Dict[str, JobResult] = {}
+
+    def finish(result: JobResult) -> List[str]:
+        """Record a result; returns jobs that became ready."""
+        results[result.name] = result
+        if on_done:
+            on_done(result)
+        ready = []
+        for child in dependents[result.name]:
+            if child in results:
+                continue
+            if result.status != "ok":
+                ready += finish(JobResult(child, "skipped", error=f"{result.name} {result.status}"))
+            else:
+                waiting[child].discard(result.name)
+                if not waiting[child]:
+                    ready.append(child)
+        return ready
+
+    stdout = _ThreadStdout(sys.stdout)
+    previous, sys.stdout = sys.stdout, stdout
+    try:
+        with shared_scope() as scope, ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            running = {
+                pool.submit(_run_one, by_name[name], stdout): name
+                for name in order
+                if not waiting[name]
+            }
+            while running:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    running.pop(future)
+                    for name in finish(future.result()):
+                        running[pool.submit(_run_one, by_name[name], stdout)] = name
+            log.info("Shared cache: %s loads, %s reused", scope.misses, scope.hits)
+    finally:
+        sys.stdout = previous
+
+    return {name: results[name] for name in order if name in results}
+
+
+# =====================================================
+# The daily jobs
+# =====================================================
+@dataclass
+class DailyRunOptions:
+    report_date: date = field(default_factory=lambda: date.today() - timedelta(days=1))
+    dos: date = field(default_factory=lambda: date.today() + timedelta(days=1))
+    ops_dos: date = field(default_factory=lambda: date.today() - timedelta(days=1))
+    email: bool = False
+    audience: str = "scheduling"
+    manager_output: Path = Path("output/manager_reports")
+    yoy_output: Path = Path("output/manager_reports_yoy")
+    force: bool = False
+    cleanup: bool = False
+
+
+def build_daily_jobs(opts: DailyRunOptions) -> List[Job]:
+    """The DAG behind run_daily_report.bat / daily_commands.txt."""
+    from radiology_reports.utils.config import config
+
+    def manager_pdf():
+        from radiology_reports.application.manager_daily_app import ManagerDailyReportApplication
+
+        ManagerDailyReportApplication().run(
+            target_date=opts.report_date,
+            output_root=opts.manager_output,
+            combined=True,
+            email=opts.email,
+            force=opts.force,
+        )
+        print("Manager PDF reports generated successfully.")
+
+    def manager_pdf_yoy():
+        from radiology_reports.application.manager_daily_yoy_app import ManagerDailyYoYReportApplication
+
+        ManagerDailyYoYReportApplication().run(
+            target_date=opts.report_date,
+            output_root=opts.yoy_output,
+            combined=True,
+            email=False,
+            force=opts.force,
+        )
+        print("Manager PDF YoY reports generated successfully.")
+
+    def capacity_scheduling():
+        from radiology_reports.capacity_reporting.daily_capacity_usecase import run_daily_capacity_report
+        from radiology_reports.presentation.console import render_daily_capacity
+        from radiology_reports.presentation.email import send_executive_capacity_email
+
+        with span("compute.daily_capacity"):
+            result = run_daily_capacity_report(opts.dos)
+        with span("render.console"):
+            report_text = render_daily_capacity(result)
+        if opts.email:
+            send_executive_capacity_email(
+                result=result,
+                report_text=report_text,
+                recipients=config.DEFAULT_RECIPIENTS,
+                audience=opts.audience,
+            )
+
+    def capacity_ops():
+        from radiology_reports.capacity_reporting.ops.ops_daily_capacity_usecase import build_ops_daily_capacity
+        from radiology_reports.capacity_reporting.ops.renderers import render_ops_capacity_text
+        from radiology_reports.presentation.ops_email import send_ops_capacity_email
+
+        with span("compute.ops_capacity"):
+            result = build_ops_daily_capacity(dos=opts.ops_dos)
+        with span("render.ops_text"):
+            body = render_ops_capacity_text(result)
+        print(body)
+        if opts.email:
+            send_ops_capacity_email(report_text=body, recipients=config.OPS_RECIPIENTS)
+
+    def cleanup():
+        from radiology_reports.utils.file_utils import cleanup_old_files
+
+        if opts.cleanup:
+            cleanup_old_files(str(opts.manager_output))
+            cleanup_old_files(str(opts.yoy_output))
+
+    return [
+        Job("manager_pdf", manager_pdf),
+        Job("manager_pdf_yoy", manager_pdf_yoy),
+        Job("capacity_scheduling", capacity_scheduling),
+        Job("capacity_ops", capacity_ops),
+        Job("cleanup", cleanup, after=("manager_pdf", "manager_pdf_yoy")),
+    ]
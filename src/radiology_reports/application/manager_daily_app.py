@@ -1,24 +1,20 @@
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
 from radiology_reports.data.workload import budget_exists_for_month
 
-from radiology_reports.reports.pdf.manager_report_runner import (
-    run_manager_pdf_report,
-    run_manager_combined_pdf,
-)
-from radiology_reports.reports.pdf.manager_yoy_report_runner import (
-    run_manager_pdf_yoy_report,
-    run_manager_combined_yoy_pdf,
-)
-
 from radiology_reports.reports.adapters.manager_location_adapter import (
     build_manager_location_reports,
 )
 from radiology_reports.reports.adapters.manager_location_yoy_adapter import (
     build_manager_location_yoy_reports,
 )
+from radiology_reports.reports.adapters.workload_source import (
+    WorkloadSource,
+    PrefetchedWorkloadSource,
+    iter_dates,
+)
 
 from radiology_reports.reports.email.manager_daily_body_builder import (
     build_manager_daily_email_body,
@@ -27,7 +23,8 @@ from radiology_reports.reports.email.manager_daily_yoy_body_builder import (
     build_manager_daily_yoy_email_body,
 )
 
-from radiology_reports.utils.email_sender import EmailConfig, send_email
+from radiology_reports.utils.email_sender import send_email
+from radiology_reports.utils.tracing import span
 
 
 class ManagerDailyReportApplication:
@@ -46,40 +43,26 @@ class ManagerDailyReportApplication:
         output_root: Path,
         combined: bool,
         email: bool,
+        force: bool = False,
     ) -> Optional[Path]:
 
-        use_budget = budget_exists_for_month(
-            target_date.year,
-            target_date.month,
-        )
+        with span("data.budget_check"):
+            use_budget = budget_exists_for_month(
+                target_date.year,
+                target_date.month,
+            )
 
         # -------------------------
         # PDF GENERATION
         # -------------------------
-        if use_budget:
-            run_manager_pdf_report(
-                target_date=target_date,
-                output_root=output_root,
-            )
-        else:
-            run_manager_pdf_yoy_report(
-                target_date=target_date,
-                output_root=output_root,
-            )
-
-        combined_pdf: Optional[Path] = None
-        if combined:
-            combined_pdf = (
-                run_manager_combined_pdf(
-                    target_date=target_date,
-                    output_root=output_root,
-                )
-                if use_budget
-                else run_manager_combined_yoy_pdf(
-                    target_date=target_date,
-                    output_root=output_root,
-                )
-            )
+        reports, combined_pdf = self._render(
+            target_date=target_date,
+            output_root=output_root,
+            combined=combined,
+            force=force,
+            use_budget=use_budget,
+            source=PrefetchedWorkloadSource(target_date, target_date),
+        )
 
         # -------------------------
         # EMAIL
@@ -88,6 +71,8 @@ class ManagerDailyReportApplication:
             if not combined_pdf:
                 raise RuntimeError("--email requires --combined")
 
+            from radiology_reports.utils.email_sender import EmailConfig
+
             config = EmailConfig()
             if not config.default_recipients:
                 raise RuntimeError("DEFAULT_RECIPIENTS not set in .env")
@@ -97,26 +82,25 @@ class ManagerDailyReportApplication:
                 for r in config.default_recipients.split(",")
             ]
 
-            if use_budget:
-                reports = build_manager_location_reports(target_date)
-                body = build_manager_daily_email_body(
-                    reports,
-                    target_date,
-                )
-                subject = (
-                    f"Radiology Regional - Daily Operations Report "
-                    f"({target_date.strftime('%b %d, %Y')})"
-                )
-            else:
-                reports = build_manager_location_yoy_reports(target_date)
-                body = build_manager_daily_yoy_email_body(
-                    reports,
-                    target_date,
-                )
-                subject = (
-                    f"Radiology Regional - Daily Operations Report (YoY) "
-                    f"({target_date.strftime('%b %d, %Y')})"
-                )
+            with span("render.email_body"):
+                if use_budget:
+                    body = build_manager_daily_email_body(
+                        reports,
+                        target_date,
+                    )
+                    subject = (
+                        f"Radiology Regional - Daily Operations Report "
+                        f"({target_date.strftime('%b %d, %Y')})"
+                    )
+                else:
+                    body = build_manager_daily_yoy_email_body(
+                        reports,
+                        target_date,
+                    )
+                    subject = (
+                        f"Radiology Regional - Daily Operations Report (YoY) "
+                        f"({target_date.strftime('%b %d, %Y')})"
+                    )
 
             send_email(
                 config=config,
@@ -127,3 +111,112 @@ class ManagerDailyReportApplication:
             )
 
         return combined_pdf
+
+    def run_range(
+        self,
+        *,
+        start_date: date,
+        end_date: date,
+        output_root: Path,
+        combined: bool,
+        force: bool = False,
+    ) -> List[Path]:
+        """
+        Generate reports for every day in [start_date, end_date].
+
+        Workload for the whole range is loaded once into cumulative cubes
+        and MTD is a prefix-sum lookup. No email in range mode.
+        """
+        if end_date < start_date:
+            raise RuntimeError("--end must not be before --start")
+
+        source = PrefetchedWorkloadSource(start_date, end_date)
+        budget_months: Dict[Tuple[int, int], bool] = {}
+        combined_pdfs: List[Path] = []
+
+        for target_date in iter_dates(start_date, end_date):
+            key = (target_date.year, target_date.month)
+            if key not in budget_months:
+                with span("data.budget_check"):
+                    budget_months[key] = budget_exists_for_month(*key)
+
+            _, combined_pdf = self._render(
+                target_date=target_date,
+                output_root=output_root,
+                combined=combined,
+                force=force,
+                use_budget=budget_months[key],
+                source=source,
+            )
+            if combined_pdf:
+                combined_pdfs.append(combined_pdf)
+
+        return combined_pdfs
+
+    def _render(
+        self,
+        *,
+        target_date: date,
+        output_root: Path,
+        combined: bool,
+        force: bool,
+        use_budget: bool,
+        source: WorkloadSource,
+    ):
+        """
+        Build the report models once and render per-location (and optionally
+        combined) PDFs from them. Returns (reports, combined_pdf).
+        """
+        # PDF runners pull in reportlab; import them only when rendering
+        from radiology_reports.reports.pdf.manager_report_runner import (
+            run_manager_pdf_report,
+            run_manager_combined_pdf,
+        )
+        from radiology_reports.reports.pdf.manager_yoy_report_runner import (
+            run_manager_pdf_yoy_report,
+            run_manager_combined_yoy_pdf,
+        )
+
+        with span("compute.location_reports"):
+            reports = (
+                build_manager_location_reports(target_date, source)
+                if use_budget
+                else build_manager_location_yoy_reports(target_date, source)
+            )
+
+        with span("render.pdf"):
+            if use_budget:
+                run_manager_pdf_report(
+                    target_date=target_date,
+                    output_root=output_root,
+                    force=force,
+                    reports=reports,
+                )
+            else:
+                run_manager_pdf_yoy_report(
+                    target_date=target_date,
+                    output_root=output_root,
+                    force=force,
+                    reports=reports,
+                )
+
+        combined_pdf: Optional[Path] = None
+        if combined:
+            with span("render.pdf_combined"):
+                combined_pdf = (
+                    run_manager_combined_pdf(
+                        target_date=target_date,
+                        output_root=output_root,
+                        force=force,
+                        reports=reports,
+                    )
+                    if use_budget
+                    else run_manager_combined_yoy_pdf(
+                        target_date=target_date,
+                        output_root=output_root,
+                        force=force,
+                        reports=reports,
+                    )
+                )
+
+        return reports, combined_pdf
@@ -1,16 +1,14 @@
 # src/radiology_reports/application/manager_daily_yoy_app.py
 from datetime import date
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 import os
 
-from radiology_reports.reports.pdf.manager_yoy_report_runner import (
-    run_manager_pdf_yoy_report,
-    run_manager_combined_yoy_pdf,
-)
 from radiology_reports.reports.adapters.manager_location_yoy_adapter import build_manager_location_yoy_reports
+from radiology_reports.reports.adapters.workload_source import PrefetchedWorkloadSource, iter_dates
 from radiology_reports.reports.email.manager_daily_yoy_body_builder import build_manager_daily_yoy_email_body
-from radiology_reports.utils.email_sender import EmailConfig, send_email
+from radiology_reports.utils.email_sender import send_email
+from radiology_reports.utils.tracing import span
 
 class ManagerDailyYoYReportApplication:
     def run(
@@ -20,38 +18,37 @@ class ManagerDailyYoYReportApplication:
         output_root: Path,
         combined: bool,
         email: bool,
+        force: bool = False,
     ) -> Optional[Path]:
 
-        # Generate per-location PDFs
-        run_manager_pdf_yoy_report(
+        # Build report models once (PDFs + email body)
+        with span("compute.location_reports"):
+            reports = build_manager_location_yoy_reports(target_date)
+
+        combined_pdf = self._render(
             target_date=target_date,
             output_root=output_root,
+            combined=combined,
+            force=force,
+            reports=reports,
         )
 
-        # Combined PDF (optional)
-        combined_pdf: Optional[Path] = None
-        if combined:
-            combined_pdf = run_manager_combined_yoy_pdf(
-                target_date=target_date,
-                output_root=output_root,
-            )
-
         # Email (optional)
         if email:
             if not combined_pdf:
                 raise RuntimeError("--email requires --combined")
 
+            from radiology_reports.utils.email_sender import EmailConfig
+
             config = EmailConfig()
             if not config.default_recipient:
                 raise RuntimeError("DEFAULT_RECIPIENTS not set in .env")
 
             recipients = [r.strip() for r in config.default_recipient.split(",")]
 
-            # Fetch reports for body
-            reports = build_manager_location_yoy_reports(target_date)
-
             subject = f"Radiology Regional - Daily Operations Report YoY ({target_date.strftime('%b %d, %Y')})"
-            body = build_manager_daily_yoy_email_body(reports, target_date)
+            with span("render.email_body"):
+                body = build_manager_daily_yoy_email_body(reports, target_date)
             attachments = [combined_pdf]
 
             send_email(
@@ -62,4 +59,66 @@ class ManagerDailyYoYReportApplication:
                 attachments=attachments,
             )
 
-        return combined_pdf
\ No newline at end of file
+        return combined_pdf
+
+    def run_range(
+        self,
+        *,
+        start_date: date,
+        end_date: date,
+        output_root: Path,
+        combined: bool,
+        force: bool = False,
+    ) -> List[Path]:
+        """
+        Generate YoY reports for every day in [start_date, end_date] from one
+        prefetch of the current and prior-year windows. No email in range mode.
+        """
+        if end_date < start_date:
+            raise RuntimeError("--end must not be before --start")
+
+        source = PrefetchedWorkloadSource(start_date, end_date)
+
+        combined_pdfs: List[Path] = []
+        for target_date in iter_dates(start_date, end_date):
+            with span("compute.location_reports"):
+                reports = build_manager_location_yoy_reports(target_date, source)
+            combined_pdf = self._render(
+                target_date=target_date,
+                output_root=output_root,
+                combined=combined,
+                force=force,
+                reports=reports,
+            )
+            if combined_pdf:
+                combined_pdfs.append(combined_pdf)
+
+        return combined_pdfs
+
+    def _render(self, *, target_date, output_root, combined, force, reports) -> Optional[Path]:
+        # PDF runners pull in reportlab; import them only when rendering
+        from radiology_reports.reports.pdf.manager_yoy_report_runner import (
+            run_manager_pdf_yoy_report,
+            run_manager_combined_yoy_pdf,
+        )
+
+        # Generate per-location PDFs
+        with span("render.pdf"):
+            run_manager_pdf_yoy_report(
+                target_date=target_date,
+                output_root=output_root,
+                force=force,
+                reports=reports,
+            )
+
+        # Combined PDF (optional)
+        if not combined:
+            return None
+
+        with span("render.pdf_combined"):
+            return run_manager_combined_yoy_pdf(
+                target_date=target_date,
+                output_root=output_root,
+                force=force,
+                reports=reports,
+            )
@@ -11,6 +11,9 @@ from radiology_reports.presentation.email import (
     send_executive_capacity_email,
 )
 from radiology_reports.utils.config import config
+from radiology_reports.utils.mail_queue import drain_mail
+from radiology_reports.utils.run_metrics import recorded_run
+from radiology_reports.utils.tracing import add_profile_argument, profiled, span
 
 
 def _default_dos() -> date:
@@ -42,6 +45,12 @@ def main() -> None:
         default="scheduling",
         help="Email audience (controls content depth)",
     )
+    parser.add_argument(
+        "--no-console",
+        action="store_true",
+        help="Don't print the console report (e.g. email-only runs)",
+    )
+    add_profile_argument(parser)
 
     args = parser.parse_args()
 
@@ -51,16 +60,24 @@ def main() -> None:
         else _default_dos()
     )
 
-    result = run_daily_capacity_report(dos)
+    with recorded_run("capacity_reporting"), profiled(args.profile, "capacity_reporting.cli"):
+        with span("compute.daily_capacity"):
+            result = run_daily_capacity_report(dos)
 
-    report_text = render_daily_capacity(result)
+        report_text = None
+        if not args.no_console:
+            with span("render.console"):
+                report_text = render_daily_capacity(result)
 
-    if args.email:
-        send_executive_capacity_email(
-            report_text=report_text,
-            recipients=config.DEFAULT_RECIPIENTS,
-            audience=args.audience,   # 🔹 NEW (passed through)
-        )
+        if args.email:
+            # rendered from the result; reuses the console text if printed
+            send_executive_capacity_email(
+                result=result,
+                report_text=report_text,
+                recipients=config.DEFAULT_RECIPIENTS,
+                audience=args.audience,   # 🔹 NEW (passed through)
+            )
+            drain_mail()
 
 
 if __name__ == "__main__":
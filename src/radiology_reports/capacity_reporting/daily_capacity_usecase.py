@@ -29,7 +29,7 @@ from radiology_reports.data.capacity import (
     get_capacity_weighted_90th_by_location,
     get_capacity_weighted_90th_by_modality,
 )
-from radiology_reports.utils.logger import get_logger
+from radiology_reports.utils.logger import get_logger, log_stage
 
 from radiology_reports.capacity_reporting.capacity_models import (
     DailyCapacityResult,
@@ -51,13 +51,15 @@ def run_daily_capacity_report(dos: date) -> DailyCapacityResult:
     # ------------------------------------------------------------
     # Load capacity benchmarks (legacy-aligned)
     # ------------------------------------------------------------
-    cap_loc: Dict[str, float] = get_capacity_weighted_90th_by_location()
-    cap_mod: Dict[Tuple[str, str], float] = get_capacity_weighted_90th_by_modality()
+    with log_stage("data.capacity", logger):
+        cap_loc: Dict[str, float] = get_capacity_weighted_90th_by_location()
+        cap_mod: Dict[Tuple[str, str], float] = get_capacity_weighted_90th_by_modality()
 
     # ------------------------------------------------------------
     # Load scheduled snapshot (intent)
     # ------------------------------------------------------------
-    df_sched = get_scheduled_snapshot(dos)
+    with log_stage("data.scheduled", logger):
+        df_sched = get_scheduled_snapshot(dos)
 
     # Snapshot metadata
     snapshot_date = None
@@ -208,7 +210,8 @@ def run_daily_capacity_report(dos: date) -> DailyCapacityResult:
     delta_pct_points = None
 
     if dos <= date.today():
-        df_completed = get_completed_snapshot(dos)
+        with log_stage("data.completed", logger):
+            df_completed = get_completed_snapshot(dos)
 
         if df_completed is not None and not df_completed.empty:
             completed_weighted = round(float(df_completed["weighted_units"].sum()), 2)
@@ -11,6 +11,9 @@ from radiology_reports.capacity_reporting.ops.renderers import (
 )
 from radiology_reports.presentation.ops_email import send_ops_capacity_email
 from radiology_reports.utils.config import config
+from radiology_reports.utils.mail_queue import drain_mail
+from radiology_reports.utils.run_metrics import recorded_run
+from radiology_reports.utils.tracing import add_profile_argument, profiled, span
 
 
 def main() -> None:
@@ -27,27 +30,32 @@ def main() -> None:
         action="store_true",
         help="Send OPS execution email",
     )
+    add_profile_argument(parser)
 
     args = parser.parse_args()
 
     # Normalize input at boundary
     dos = date.fromisoformat(args.dos)
 
-    # Domain use case
-    result = build_ops_daily_capacity(dos=dos)
-
-    # Presentation layer
-    body = render_ops_capacity_text(result)
-
-    # Always print
-    print(body)
-
-    # Optional email
-    if args.email:
-        send_ops_capacity_email(
-            report_text=body,
-            recipients=config.OPS_RECIPIENTS,
-        )
+    with recorded_run("ops_capacity"), profiled(args.profile, "ops.cli"):
+        # Domain use case
+        with span("compute.ops_capacity"):
+            result = build_ops_daily_capacity(dos=dos)
+
+        # Presentation layer
+        with span("render.ops_text"):
+            body = render_ops_capacity_text(result)
+
+        # Always print
+        print(body)
+
+        # Optional email
+        if args.email:
+            send_ops_capacity_email(
+                report_text=body,
+                recipients=config.OPS_RECIPIENTS,
+            )
+            drain_mail()
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-import smtplib
+from concurrent.futures import Future
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from datetime import date
@@ -11,6 +11,7 @@ from radiology_reports.capacity_reporting.ops.ops_capacity_models import (
 )
 from radiology_reports.utils.config import config
 from radiology_reports.utils.logger import get_logger
+from radiology_reports.utils.mail_queue import SmtpSettings, deliver
 
 log = get_logger(__name__)
 
@@ -69,7 +70,7 @@ def send_ops_capacity_email(
     body_text: str,
     recipients: List[str],
     subject: str = "Daily Radiology Capacity – OPS (Execution)",
-) -> None:
+) -> Future:
     """
     Send OPS email (plain text).
 
@@ -87,13 +88,13 @@ def send_ops_capacity_email(
     # plain text only for v1 (stable + readable)
     msg.attach(MIMEText(body_text, "plain"))
 
-    try:
-        with smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT) as server:
-            server.sendmail(config.SENDER_EMAIL, recipients, msg.as_string())
-        log.info(f"OPS capacity report sent to: {', '.join(recipients)}")
-    except Exception:
-        log.error("Failed to send OPS capacity email", exc_info=True)
-        raise
+    future = deliver(
+        SmtpSettings(config.SMTP_SERVER, config.SMTP_PORT, config.SENDER_EMAIL),
+        msg,
+        recipients,
+    )
+    log.info(f"OPS capacity report queued for: {', '.join(recipients)}")
+    return future
 
 
 def _parse_recipients(value: str) -> List[str]:
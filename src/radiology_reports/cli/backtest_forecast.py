@@ -0,0 +1,76 @@
+# src/radiology_reports/cli/backtest_forecast.py
+
+from datetime import date, timedelta
+from pathlib import Path
+import argparse
+import sys
+import time
+
+from radiology_reports.data.workload import get_daily_units_by_range
+from radiology_reports.forecasting.backtest import (
+    DEFAULT_CACHE,
+    FORECASTERS,
+    backtest,
+    rolling_origins,
+    summarize,
+)
+from radiology_reports.forecasting.baseline import SeriesPanel, history_window
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Walk-forward backtest of forecasters over every location/modality."
+    )
+
+    parser.add_argument("--through", type=str, help="Last actuals date (YYYY-MM-DD). Defaults to yesterday.")
+    parser.add_argument("--weeks", type=int, default=52, help="Weeks of weekly origins to evaluate.")
+    parser.add_argument("--step", type=int, default=7, help="Days between origins.")
+    parser.add_argument("--horizon", type=int, default=14)
+    parser.add_argument(
+        "--forecaster",
+        action="append",
+        choices=sorted(FORECASTERS),
+        help="Forecaster(s) to evaluate (repeatable). Default: all registered.",
+    )
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores).")
+    parser.add_argument("--cache", type=str, default=str(DEFAULT_CACHE))
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--output", type=str, default="output/backtest_summary.csv")
+
+    return parser.parse_args()
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        through = date.fromisoformat(args.through) if args.through else date.today() - timedelta(days=1)
+        first_origin = through - timedelta(days=args.horizon + 7 * args.weeks)
+        start, _ = history_window(first_origin)
+
+        panel = SeriesPanel.from_frame(get_daily_units_by_range(start, through), start=start, end=through)
+        origins = rolling_origins(panel, args.horizon, first_origin, step_days=args.step)
+
+        t0 = time.perf_counter()
+        folds = backtest(
+            panel,
+            origins,
+            args.horizon,
+            forecasters=args.forecaster or (),
+            workers=args.workers,
+            cache_dir=None if args.no_cache else Path(args.cache),
+        )
+        elapsed = time.perf_counter() - t0
+
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        summarize(folds).to_csv(output, index=False)
+
+        print(f"Backtest: {len(origins)} origins, {len(panel.keys)} series in {elapsed:.2f}s -> {output}")
+        print(summarize(folds, by=("Forecaster", "Horizon")).to_string(index=False))
+        return 0
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,59 @@
+# src/radiology_reports/cli/baseline_forecast.py
+
+from datetime import date, timedelta
+from pathlib import Path
+import argparse
+import sys
+import time
+
+from radiology_reports.data.workload import get_daily_units_by_range
+from radiology_reports.forecasting.baseline import (
+    DEFAULT_METHOD,
+    METHODS,
+    baseline_forecast,
+    history_window,
+)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Baseline (NumPy) forecast for every location/modality."
+    )
+
+    parser.add_argument("--through", type=str, help="Last history date (YYYY-MM-DD). Defaults to yesterday.")
+    parser.add_argument("--days", type=int, default=14, help="Forecast horizon in days.")
+    parser.add_argument(
+        "--method",
+        action="append",
+        choices=sorted(METHODS),
+        help=f"Method(s) to run (repeatable). Default: {DEFAULT_METHOD}.",
+    )
+    parser.add_argument("--output", type=str, default="output/baseline_forecast.csv")
+
+    return parser.parse_args()
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        through = date.fromisoformat(args.through) if args.through else date.today() - timedelta(days=1)
+        start, end = history_window(through)
+
+        history = get_daily_units_by_range(start, end)
+
+        t0 = time.perf_counter()
+        forecast = baseline_forecast(history, through, args.days, methods=args.method or [DEFAULT_METHOD])
+        elapsed = time.perf_counter() - t0
+
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        forecast.to_csv(output, index=False)
+
+        print(f"Baseline forecast: {len(forecast)} rows in {elapsed:.3f}s -> {output}")
+        return 0
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,14 +4,27 @@ daily_capacity_executive_summary.py
 
 Refactored to use rrc.data.workload, rrc.services.capacity, and rrc.services.executive_report.
 Only necessary changes applied.
+
+Range mode (--start/--end) loads the whole window with one scheduled and
+one completed range query and summarizes every DOS in one pass.
 """
 import argparse
 from datetime import date, timedelta
 
-from utils.logger import get_logger
-from rrc.data.workload import get_daily_completed_workload, get_scheduled_snapshot, get_capacity_by_location
-from rrc.services.capacity import compute_capacity_summary
-from rrc.services.executive_report import build_text_report
+import pandas as pd
+
+from radiology_reports.utils.logger import get_logger
+from radiology_reports.data.workload import (
+    get_daily_completed_workload,
+    get_daily_completed_workload_by_range,
+    get_location_capacity_90th,
+    get_scheduled_snapshot,
+    get_scheduled_snapshots_by_range,
+)
+from radiology_reports.services.capacity import compute_capacity_summary
+from radiology_reports.services.executive_report import build_text_report
+from radiology_reports.utils.run_metrics import recorded_run
+from radiology_reports.utils.tracing import add_profile_argument, profiled, span
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -22,6 +35,10 @@ def parse_args() -> argparse.Namespace:
         "-d",
         help="DOS in YYYY-MM-DD format. Defaults to yesterday.",
     )
+    parser.add_argument("--start", help="First DOS of a range (YYYY-MM-DD).")
+    parser.add_argument("--end", help="Last DOS of the range (default: yesterday).")
+    parser.add_argument("--output", help="Range mode: also write the per-(dos, location) summary to this CSV.")
+    add_profile_argument(parser)
     return parser.parse_args()
 
 def resolve_date(arg):
@@ -29,34 +46,89 @@ def resolve_date(arg):
         return date.fromisoformat(arg)
     return date.today() - timedelta(days=1)
 
-def main():
-    log = get_logger(__name__)
-    log.info("=== Daily Capacity Executive Summary Started ===")
+def find_unknown_modalities(scheduled_df):
+    """Modalities in SCHEDULED with a missing (or zero) weight"""
+    if scheduled_df.empty:
+        return set()
+    weight = scheduled_df["modality_weight"]
+    missing = weight.isna() | (weight == 0)
+    return set(scheduled_df.loc[missing, "modality"].fillna("(NULL)"))
 
-    args = parse_args()
-    target_d = resolve_date(args.date)
+def network_by_day(summary_df):
+    """One line per DOS: network totals and status counts"""
+    if summary_df.empty:
+        return pd.DataFrame(columns=["dos", "scheduled_wu", "completed_wu", "capacity_wu", "completed_pct"])
+    totals = summary_df.groupby("dos")[["scheduled_wu", "completed_wu", "capacity_wu"]].sum()
+    totals["completed_pct"] = (totals["completed_wu"] / totals["capacity_wu"] * 100).where(totals["capacity_wu"] > 0, 0).round(1)
+    counts = pd.crosstab(summary_df["dos"], summary_df["status"])
+    return totals.round(2).join(counts).fillna(0).reset_index()
+
+def run_day(target_d):
     d_str = target_d.strftime("%Y-%m-%d")
 
     # Load datasets via the workload module
-    completed_df = get_daily_completed_workload(d_str)
-    scheduled_df = get_scheduled_snapshot(d_str)
-    capacity_df = get_capacity_by_location()
-
-    # Detect unknown modalities (where modality_weight is null)
-    unknown_modalities = set()
-    if not scheduled_df.empty:
-        for _, r in scheduled_df.iterrows():
-            if r.get('modality_weight') is None or (isinstance(r.get('modality_weight'), float) and r.get('modality_weight') == 0):
-                unknown_modalities.add(r.get('modality') or '(NULL)')
+    with span("data.completed"):
+        completed_df = get_daily_completed_workload(d_str)
+    with span("data.scheduled"):
+        scheduled_df = get_scheduled_snapshot(d_str)
+    with span("data.capacity"):
+        capacity_df = get_location_capacity_90th()
 
     # Compute capacity summary using centralized logic
-    summary_df = compute_capacity_summary(scheduled_df, completed_df, capacity_df)
+    with span("compute.capacity_summary"):
+        summary_df = compute_capacity_summary(scheduled_df, completed_df, capacity_df)
 
     # Build executive text report
-    report_text = build_text_report(summary_df, d_str)
+    with span("render.console"):
+        print(build_text_report(summary_df, d_str))
+    return find_unknown_modalities(scheduled_df)
+
+def run_range(start, end, output=None):
+    with span("data.completed"):
+        completed_df = get_daily_completed_workload_by_range(start, end)
+    with span("data.scheduled"):
+        scheduled_df = get_scheduled_snapshots_by_range(start, end)
+    with span("data.capacity"):
+        capacity_df = get_location_capacity_90th()
+
+    with span("compute.capacity_summary"):
+        summary_df = compute_capacity_summary(scheduled_df, completed_df, capacity_df)
+
+    if summary_df.empty:
+        print(f"No scheduled or completed data for {start} to {end}.")
+        return find_unknown_modalities(scheduled_df)
+
+    with span("render.console"):
+        for dos, day_df in summary_df.groupby("dos", sort=True):
+            print(build_text_report(day_df.drop(columns="dos"), dos.strftime("%Y-%m-%d")))
+
+        print(f"NETWORK BY DAY — {start} to {end}")
+        print(network_by_day(summary_df).to_string(index=False))
+
+    if output:
+        summary_df.to_csv(output, index=False)
+    return find_unknown_modalities(scheduled_df)
+
+def main():
+    log = get_logger(__name__)
+    log.info("=== Daily Capacity Executive Summary Started ===")
+
+    args = parse_args()
+    if args.start:
+        if args.date:
+            raise SystemExit("--date cannot be combined with --start/--end")
+    elif args.end:
+        raise SystemExit("--end requires --start")
 
-    # Print report
-    print(report_text)
+    outputs = [args.output] if args.output else []
+    with (
+        recorded_run("daily_capacity_executive_summary", outputs=outputs),
+        profiled(args.profile, "cli.daily_capacity_executive_summary"),
+    ):
+        if args.start:
+            unknown_modalities = run_range(date.fromisoformat(args.start), resolve_date(args.end), args.output)
+        else:
+            unknown_modalities = run_day(resolve_date(args.date))
 
     if unknown_modalities:
         log.warning("Unknown modalities found in SCHEDULED (weight missing): %s", ", ".join(sorted(unknown_modalities)))
@@ -0,0 +1,116 @@
+# src/radiology_reports/cli/daily_run.py
+"""
+Run the whole morning batch in one process (application/daily_jobs.py).
+
+Replaces starting manager_pdf, manager_pdf_yoy, capacity_reporting.cli and
+capacity_reporting.ops.cli one after another: imports, the DB server probe,
+connections and shared reference loads are paid once, independent jobs run
+concurrently, and one failed job doesn't stop the others.
+
+Usage:
+    python -m radiology_reports.cli.daily_run --email --cleanup
+    python -m radiology_reports.cli.daily_run --only capacity_scheduling --only capacity_ops
+    python -m radiology_reports.cli.daily_run --list
+"""
+
+from datetime import date, timedelta
+from pathlib import Path
+import argparse
+import sys
+
+from radiology_reports.application.daily_jobs import (
+    DailyRunOptions,
+    JobResult,
+    build_daily_jobs,
+    run_jobs,
+    select_jobs,
+)
+from radiology_reports.utils.mail_queue import drain_mail
+from radiology_reports.utils.run_metrics import recorded_run
+from radiology_reports.utils.tracing import add_profile_argument, profiled
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run the daily report jobs in one process.")
+    parser.add_argument("--date", type=str, help="Manager PDF report date (default: yesterday).")
+    parser.add_argument("--dos", type=str, help="Scheduling capacity day of service (default: tomorrow).")
+    parser.add_argument("--ops-dos", type=str, help="OPS capacity day of service (default: yesterday).")
+    parser.add_argument("--email", action="store_true", help="Send the manager PDF, scheduling and OPS emails.")
+    parser.add_argument("--audience", choices=["scheduling", "ops"], default="scheduling")
+    parser.add_argument("--output", type=str, default="output/manager_reports")
+    parser.add_argument("--yoy-output", type=str, default="output/manager_reports_yoy")
+    parser.add_argument("--cleanup", action="store_true", help="Clean up old PDF files after generation.")
+    parser.add_argument("--force", action="store_true", help="Re-render PDFs even if their content is unchanged.")
+    parser.add_argument("--only", action="append", default=[], help="Run only this job (repeatable).")
+    parser.add_argument("--skip", action="append", default=[], help="Skip this job (repeatable).")
+    parser.add_argument("--workers", type=int, default=4, help="Jobs run concurrently.")
+    parser.add_argument("--list", action="store_true", help="List the jobs and exit.")
+    add_profile_argument(parser)
+    return parser.parse_args()
+
+
+def _parse_date(value: str | None, default: date) -> date:
+    return date.fromisoformat(value) if value else default
+
+
+def _print_result(result: JobResult) -> None:
+    line = f"----- {result.name}: {result.status} ({result.seconds:.1f}s)"
+    if result.error:
+        line += f" — {result.error}"
+    print(line)
+    if result.output:
+        print(result.output.rstrip("\n"))
+
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        today = date.today()
+        opts = DailyRunOptions(
+            report_date=_parse_date(args.date, today - timedelta(days=1)),
+            dos=_parse_date(args.dos, today + timedelta(days=1)),
+            ops_dos=_parse_date(args.ops_dos, today - timedelta(days=1)),
+            email=args.email,
+            audience=args.audience,
+            manager_output=Path(args.output),
+            yoy_output=Path(args.yoy_output),
+            force=args.force,
+            cleanup=args.cleanup,
+        )
+        jobs = select_jobs(build_daily_jobs(opts), only=args.only, skip=args.skip)
+
+        if args.list:
+            for job in jobs:
+                after = f"  (after {', '.join(job.after)})" if job.after else ""
+                print(f"{job.name}{after}")
+            return 0
+
+        with recorded_run("daily_run", outputs=[args.output, args.yoy_output]), profiled(args.profile, "cli.daily_run"):
+            results = run_jobs(jobs, max_workers=args.workers, on_done=_print_result)
+            try:
+                drain_mail()  # mail from all jobs went out over the queue while others rendered
+                mail_error = None
+            except RuntimeError as exc:
+                mail_error = str(exc)
+
+        print()
+        print("DAILY RUN SUMMARY")
+        print("=" * 60)
+        for result in results.values():
+            print(f"{result.name:<24} {result.status:<8} {result.seconds:7.1f}s")
+
+        failed = [r.name for r in results.values() if r.status != "ok"]
+        if failed:
+            print(f"ERROR: job(s) not completed: {', '.join(failed)}", file=sys.stderr)
+        if mail_error:
+            print(f"ERROR: {mail_error}", file=sys.stderr)
+        return 1 if failed or mail_error else 0
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
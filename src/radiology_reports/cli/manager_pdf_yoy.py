@@ -7,6 +7,9 @@ import sys
 from radiology_reports.application.manager_daily_yoy_app import (
     ManagerDailyYoYReportApplication,
 )
+from radiology_reports.utils.mail_queue import drain_mail
+from radiology_reports.utils.run_metrics import recorded_run
+from radiology_reports.utils.tracing import add_profile_argument, profiled
 from radiology_reports.utils.file_utils import cleanup_old_files
 
 def parse_args() -> argparse.Namespace:
@@ -15,6 +18,8 @@ def parse_args() -> argparse.Namespace:
     )
 
     parser.add_argument("--date", type=str)
+    parser.add_argument("--start", type=str, help="First report date of a batch range (YYYY-MM-DD).")
+    parser.add_argument("--end", type=str, help="Last report date of a batch range (default: yesterday).")
     parser.add_argument(
         "--output",
         type=str,
@@ -23,6 +28,8 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--combined", action="store_true")
     parser.add_argument("--email", action="store_true")
     parser.add_argument("--cleanup", action="store_true", help="Clean up old PDF files after generation.")
+    parser.add_argument("--force", action="store_true", help="Re-render PDFs even if their content is unchanged.")
+    add_profile_argument(parser)
 
     return parser.parse_args()
 
@@ -31,21 +38,47 @@ def resolve_target_date(date_arg: str | None) -> date:
         return date.today() - timedelta(days=1)
     return date.fromisoformat(date_arg)
 
+def resolve_range(start_arg: str, end_arg: str | None) -> tuple[date, date]:
+    start = date.fromisoformat(start_arg)
+    end = date.fromisoformat(end_arg) if end_arg else date.today() - timedelta(days=1)
+    return start, end
+
 def main() -> int:
     args = parse_args()
 
     try:
         app = ManagerDailyYoYReportApplication()
 
-        app.run(
-            target_date=resolve_target_date(args.date),
-            output_root=Path(args.output),
-            combined=args.combined,
-            email=args.email,
-        )
+        with recorded_run("manager_pdf_yoy", outputs=[args.output]), profiled(args.profile, "cli.manager_pdf_yoy"):
+            if args.start:
+                if args.date:
+                    raise RuntimeError("--date cannot be combined with --start/--end")
+                if args.email:
+                    raise RuntimeError("--email is not supported with --start/--end")
+
+                start_date, end_date = resolve_range(args.start, args.end)
+                app.run_range(
+                    start_date=start_date,
+                    end_date=end_date,
+                    output_root=Path(args.output),
+                    combined=args.combined,
+                    force=args.force,
+                )
+            elif args.end:
+                raise RuntimeError("--end requires --start")
+            else:
+                app.run(
+                    target_date=resolve_target_date(args.date),
+                    output_root=Path(args.output),
+                    combined=args.combined,
+                    email=args.email,
+                    force=args.force,
+                )
+
+            if args.cleanup:
+                cleanup_old_files(args.output)
 
-        if args.cleanup:
-            cleanup_old_files(args.output)
+            drain_mail()
 
         print("Manager PDF YoY reports generated successfully.")
         return 0
@@ -0,0 +1,61 @@
+# src/radiology_reports/cli/pickup_nowcast.py
+
+from datetime import date
+from pathlib import Path
+import argparse
+import sys
+
+from radiology_reports.forecasting.pickup_curve import (
+    DEFAULT_STATE,
+    SETTLE_DAYS,
+    load_or_build,
+    nowcast_upcoming,
+)
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Update schedule pickup curves and nowcast final volume for upcoming DOS."
+    )
+
+    parser.add_argument("--start", type=str, help="First DOS to nowcast (YYYY-MM-DD). Defaults to today.")
+    parser.add_argument("--days", type=int, default=10)
+    parser.add_argument("--state", type=str, default=str(DEFAULT_STATE), help="Saved curves (.npz).")
+    parser.add_argument("--history-days", type=int, default=365, help="History for a fresh build.")
+    parser.add_argument(
+        "--settle-days",
+        type=int,
+        default=SETTLE_DAYS,
+        help="Days after a DOS before it is folded into the curves (DAILY still loading).",
+    )
+    parser.add_argument("--curves", type=str, help="Also write the curves to this CSV.")
+    parser.add_argument("--output", type=str, default="output/pickup_nowcast.csv")
+
+    return parser.parse_args()
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        curves = load_or_build(
+            Path(args.state),
+            history_days=args.history_days,
+            settle_days=args.settle_days,
+        )
+        start = date.fromisoformat(args.start) if args.start else None
+        nowcast = nowcast_upcoming(curves, days=args.days, start=start)
+
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        nowcast.to_csv(output, index=False)
+        if args.curves:
+            curves.curve_frame().to_csv(args.curves, index=False)
+
+        print(f"Pickup curves through {curves.through}; nowcast {len(nowcast)} rows -> {output}")
+        return 0
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
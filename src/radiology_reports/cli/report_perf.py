@@ -0,0 +1,181 @@
+# src/radiology_reports/cli/report_perf.py
+"""
+Report job performance from the run-metrics store (utils/run_metrics.py).
+
+- p50 / p95 wall time per job, overall and per day/week
+- latest run vs a rolling baseline (median of the previous N successful
+  runs); slower than threshold × baseline is flagged as a regression
+- optional per-stage regressions and Prometheus textfile export
+
+Usage:
+    python -m radiology_reports.cli.report_perf
+    python -m radiology_reports.cli.report_perf --job manager_pdf --stages --days 60
+    python -m radiology_reports.cli.report_perf --prometheus /var/lib/node_exporter/radiology.prom
+"""
+
+from datetime import datetime, timedelta
+import argparse
+import sys
+
+import pandas as pd
+
+from radiology_reports.utils.run_metrics import RunMetricsStore, export_prometheus
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Report job p50/p95 trends and flag regressions.")
+    parser.add_argument("--db", help="Run-metrics SQLite file (default: RUN_METRICS_DB or output/run_metrics.db).")
+    parser.add_argument("--job", help="Only this job.")
+    parser.add_argument("--days", type=int, default=30, help="History window in days.")
+    parser.add_argument("--by", choices=["day", "week"], default="week", help="Trend bucket.")
+    parser.add_argument("--baseline", type=int, default=20, help="Previous successful runs in the rolling baseline.")
+    parser.add_argument("--min-runs", type=int, default=5, help="Baseline runs needed before flagging.")
+    parser.add_argument("--threshold", type=float, default=1.25, help="Regression when latest > threshold x baseline.")
+    parser.add_argument("--min-delta", type=float, default=0.5, help="...and at least this many seconds slower.")
+    parser.add_argument("--stages", action="store_true", help="Also check every stage for regressions.")
+    parser.add_argument("--prometheus", help="Write the latest run per job to this Prometheus textfile.")
+    parser.add_argument("--fail-on-regression", action="store_true", help="Exit 2 when a regression or failed latest run is found.")
+    return parser.parse_args()
+
+
+# =====================================================
+# Summaries
+# =====================================================
+def _p50(s: pd.Series) -> float:
+    return s.quantile(0.50)
+
+
+def _p95(s: pd.Series) -> float:
+    return s.quantile(0.95)
+
+
+def _latest(df: pd.DataFrame, keys: list) -> pd.DataFrame:
+    """Last row per key (rows are oldest first)."""
+    return df.groupby(keys, sort=False).tail(1).sort_values(keys).reset_index(drop=True)
+
+
+def job_summary(runs: pd.DataFrame) -> pd.DataFrame:
+    """Runs, failures, p50/p95 (successful runs, seconds) and the latest run per job."""
+    ok = runs[runs["exit_code"] == 0]
+    stats = ok.groupby("job")["duration_ms"].agg(p50=_p50, p95=_p95).div(1000)
+    last = _latest(runs, ["job"]).set_index("job")
+    return pd.DataFrame({
+        "runs": runs.groupby("job").size(),
+        "failed": runs["exit_code"].ne(0).groupby(runs["job"]).sum(),
+        "p50_s": stats["p50"],
+        "p95_s": stats["p95"],
+        "last_s": last["duration_ms"] / 1000,
+        "last_exit": last["exit_code"],
+        "last_run": last["started_at"].dt.strftime("%Y-%m-%d %H:%M"),
+        "queries": last["queries"],
+        "rows": last["rows"],
+    }).round(2).reset_index()
+
+
+def trend(runs: pd.DataFrame, by: str = "week") -> pd.DataFrame:
+    """p50 / p95 per job and day (or ISO week start) over successful runs."""
+    ok = runs[runs["exit_code"] == 0]
+    period = ok["started_at"].dt.normalize()
+    if by == "week":
+        period = period - pd.to_timedelta(period.dt.weekday, unit="D")
+    out = (
+        ok.assign(period=period.dt.date)
+        .groupby(["job", "period"])["duration_ms"]
+        .agg(runs="size", p50_s=_p50, p95_s=_p95)
+        .reset_index()
+    )
+    out[["p50_s", "p95_s"]] = (out[["p50_s", "p95_s"]] / 1000).round(2)
+    return out
+
+
+def flag_regressions(
+    df: pd.DataFrame,
+    keys: list,
+    baseline: int = 20,
+    min_runs: int = 5,
+    threshold: float = 1.25,
+    min_delta_ms: float = 500.0,
+) -> pd.DataFrame:
+    """
+    Latest successful value per key vs the median of the previous `baseline`
+    successful values (rows must be oldest first and carry duration_ms).
+    A regression is slower than threshold × baseline and by at least
+    min_delta_ms, so millisecond stages don't flag on noise.
+    """
+    ok = df[df["exit_code"] == 0]
+    grouped = ok.groupby(keys, sort=False)["duration_ms"]
+    base = grouped.transform(lambda s: s.shift(1).rolling(baseline, min_periods=min_runs).median())
+    latest = _latest(ok.assign(baseline_ms=base), keys)
+    latest["ratio"] = (latest["duration_ms"] / latest["baseline_ms"]).round(2)
+    latest["regression"] = (latest["ratio"] > threshold) & (
+        latest["duration_ms"] - latest["baseline_ms"] >= min_delta_ms
+    )
+    latest[["duration_ms", "baseline_ms"]] = latest[["duration_ms", "baseline_ms"]].round(1)
+    return latest[keys + ["started_at", "duration_ms", "baseline_ms", "ratio", "regression"]]
+
+
+def _print_section(title: str, df: pd.DataFrame) -> None:
+    print(title)
+    print("=" * 80)
+    print(df.to_string(index=False) if not df.empty else "(no data)")
+    print()
+
+
+def main() -> int:
+    args = parse_args()
+
+    try:
+        store = RunMetricsStore(args.db)
+        since = datetime.now() - timedelta(days=args.days)
+        runs = store.runs(job=args.job, since=since)
+
+        if runs.empty:
+            print(f"No runs recorded in the last {args.days} days ({store.path}).")
+            return 0
+
+        _print_section(f"JOB PERFORMANCE — last {args.days} days", job_summary(runs))
+        _print_section(f"TREND by {args.by} (successful runs)", trend(runs, args.by))
+
+        problems = []
+        failed = _latest(runs, ["job"]).query("exit_code != 0")
+        for _, row in failed.iterrows():
+            problems.append(f"FAILED: {row['job']} last run {row['started_at']:%Y-%m-%d %H:%M} exit {row['exit_code']}: {row['error']}")
+
+        min_delta_ms = args.min_delta * 1000
+        regressions = flag_regressions(runs, ["job"], args.baseline, args.min_runs, args.threshold, min_delta_ms)
+        _print_section(f"LATEST vs BASELINE (median of previous {args.baseline} runs)", regressions)
+        for row in regressions[regressions["regression"]].itertuples(index=False):
+            problems.append(
+                f"REGRESSION: {row.job} {row.duration_ms / 1000:.1f}s vs baseline "
+                f"{row.baseline_ms / 1000:.1f}s (x{row.ratio})"
+            )
+
+        if args.stages:
+            stages = store.stages(job=args.job, since=since)
+            stage_flags = flag_regressions(
+                stages, ["job", "stage"], args.baseline, args.min_runs, args.threshold, min_delta_ms
+            )
+            _print_section("STAGES vs BASELINE", stage_flags)
+            for row in stage_flags[stage_flags["regression"]].itertuples(index=False):
+                problems.append(
+                    f"REGRESSION: {row.job} stage {row.stage} {row.duration_ms:.0f}ms vs baseline "
+                    f"{row.baseline_ms:.0f}ms (x{row.ratio})"
+                )
+
+        if args.prometheus:
+            print(f"Prometheus textfile written to {export_prometheus(store, args.prometheus)}")
+
+        for problem in problems:
+            print(problem)
+        if not problems:
+            print("No regressions or failed runs.")
+
+        return 2 if problems and args.fail_on_regression else 0
+
+    except Exception as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
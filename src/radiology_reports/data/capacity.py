@@ -12,9 +12,11 @@ from __future__ import annotations
 from typing import Dict, Tuple
 import pandas as pd
 
+from radiology_reports.data.shared_cache import shared_result
 from radiology_reports.data.workload import get_connection
 
 
+@shared_result
 def get_capacity_weighted_90th_by_location() -> Dict[str, float]:
     """
     Original source: dbo.v_Capacity_Model
@@ -38,6 +40,7 @@ def get_capacity_weighted_90th_by_location() -> Dict[str, float]:
     }
 
 
+@shared_result
 def get_capacity_weighted_90th_by_modality() -> Dict[Tuple[str, str], float]:
     """
     Original source: dbo.v_Modality_Capacity_Model
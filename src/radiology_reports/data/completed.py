@@ -3,9 +3,11 @@ from __future__ import annotations
 from datetime import date, datetime
 import pandas as pd
 
+from radiology_reports.data.shared_cache import shared_result
 from radiology_reports.data.workload import get_connection
 
 
+@shared_result
 def get_completed_snapshot(dos: str | date | datetime) -> pd.DataFrame:
     """
     Completed exams snapshot for a single DOS.
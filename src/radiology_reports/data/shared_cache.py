@@ -0,0 +1,131 @@
+# src/radiology_reports/data/shared_cache.py
+"""
+Process-wide sharing for in-process multi-job runs (application/daily_jobs.py).
+
+Inside shared_scope():
+- the database server is probed once (config.pin_server) instead of on
+  every connection
+- get_connection() reuses one connection per thread instead of opening
+  and closing one per query
+- loaders decorated with @shared_result run once per distinct arguments;
+  concurrent callers of the same load wait for the first one, and every
+  caller gets its own copy of the result (DataFrames / dicts / lists), so
+  one job can't mutate another's data
+
+Outside a scope everything behaves exactly as before (no caching, one
+connection per query), so the single-report CLIs and their golden
+outputs are unchanged.
+"""
+
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Dict, Hashable, List, Optional, Tuple
+
+import pandas as pd
+
+from radiology_reports.utils.config import config
+
+
+class _Scope:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.results: Dict[Hashable, object] = {}
+        self.key_locks: Dict[Hashable, threading.Lock] = {}
+        self.local = threading.local()
+        self.connections: List = []
+        self.hits = 0
+        self.misses = 0
+
+    def load(self, key: Hashable, loader: Callable[[], object]):
+        with self.lock:
+            if key in self.results:
+                self.hits += 1
+                return self.results[key]
+            key_lock = self.key_locks.setdefault(key, threading.Lock())
+
+        # single flight: one thread loads, the others wait for its result
+        with key_lock:
+            with self.lock:
+                if key in self.results:
+                    self.hits += 1
+                    return self.results[key]
+            value = loader()
+            with self.lock:
+                self.results[key] = value
+                self.misses += 1
+            return value
+
+
+_scope: Optional[_Scope] = None
+
+
+def _copy(value):
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return value.copy()
+    if isinstance(value, dict):
+        return dict(value)
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+def shared_result(fn):
+    """Run fn once per distinct (hashable) arguments while a shared scope is active."""
+
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        scope = _scope
+        if scope is None:
+            return fn(*args, **kwargs)
+        key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return fn(*args, **kwargs)
+        return _copy(scope.load(key, lambda: fn(*args, **kwargs)))
+
+    return wrapper
+
+
+def thread_connection(connect: Callable[[], object]) -> Tuple[object, bool]:
+    """
+    (connection, owned). Outside a scope a new connection the caller must
+    close; inside, this thread's shared connection (closed by the scope).
+    """
+    scope = _scope
+    if scope is None:
+        return connect(), True
+
+    conn = getattr(scope.local, "conn", None)
+    if conn is None:
+        conn = connect()
+        scope.local.conn = conn
+        with scope.lock:
+            scope.connections.append(conn)
+    return conn, False
+
+
+@contextmanager
+def shared_scope():
+    """Share server probe, connections and loaded reference data for the block."""
+    global _scope
+    if _scope is not None:
+        yield _scope
+        return
+
+    scope = _Scope()
+    _scope = scope
+    try:
+        config.pin_server()
+        yield scope
+    finally:
+        _scope = None
+        config.unpin_server()
+        for conn in scope.connections:
+            try:
+                conn.close()
+            except Exception:
+                pass
@@ -1,25 +1,33 @@
 # src/radiology_reports/data/workload.py
 from __future__ import annotations
 # src/radiology_reports/data/workload.py
+import logging
 import warnings
 warnings.filterwarnings("ignore", category=UserWarning)  # Nuclear option — zero warnings
 
-import pyodbc
 import pandas as pd
 from contextlib import contextmanager
 from datetime import date, datetime
 import calendar
 
 from radiology_reports.utils.config import config
+from radiology_reports.utils.run_metrics import instrument_connection
+from radiology_reports.data.shared_cache import shared_result, thread_connection
+
+logger = logging.getLogger(__name__)
 
 
 @contextmanager
 def get_connection():
-    conn = pyodbc.connect(config.SQLALCHEMY_DATABASE_URI)
+    import pyodbc  # deferred: only needed once a query actually runs
+
+    # One connection per call, or this thread's connection inside shared_scope()
+    conn, owned = thread_connection(lambda: pyodbc.connect(config.SQLALCHEMY_DATABASE_URI))
     try:
-        yield conn
+        yield instrument_connection(conn)
     finally:
-        conn.close()
+        if owned:
+            conn.close()
 
 
 # ===================================================================
@@ -109,6 +117,7 @@ def get_active_locations() -> pd.DataFrame:
 # CAPACITY & WORKLOAD SNAPSHOT QUERIES (your existing excellent ones)
 # ===================================================================
 
+@shared_result
 def get_active_locations() -> pd.DataFrame:
     """All currently active imaging centers"""
     sql = "SELECT LocationName FROM dbo.v_Active_Locations"
@@ -116,6 +125,7 @@ def get_active_locations() -> pd.DataFrame:
         return pd.read_sql(sql, conn)
 
 
+@shared_result
 def get_daily_completed_workload(dos: str | date | datetime) -> pd.DataFrame:
     """Actual completed weighted exams for a given DOS"""
     if isinstance(dos, (date, datetime)):
@@ -129,6 +139,7 @@ def get_daily_completed_workload(dos: str | date | datetime) -> pd.DataFrame:
         return pd.read_sql(sql, conn, params=[dos])
 
 
+@shared_result
 def get_scheduled_snapshot(dos: str | date | datetime) -> pd.DataFrame:
     """Morning scheduled snapshot (inserted = dos) aggregated with weights applied"""
 
@@ -174,6 +185,114 @@ def get_scheduled_snapshot(dos: str | date | datetime) -> pd.DataFrame:
         return pd.read_sql(sql, conn, params=[dos])
 
 
+def get_daily_completed_workload_by_range(start_date: date, end_date: date) -> pd.DataFrame:
+    """Completed weighted exams for every DOS in [start, end] (one query)"""
+    sql = """
+        SELECT dos, location, modality, volume, modality_weight, weighted_units
+        FROM dbo.v_Daily_Workload_Weighted
+        WHERE dos BETWEEN ? AND ?
+    """
+    with get_connection() as conn:
+        df = pd.read_sql(sql, conn, params=[start_date, end_date])
+
+    df["dos"] = pd.to_datetime(df["dos"]).dt.date
+    return df
+
+
+def get_scheduled_snapshots_by_range(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Scheduled snapshot per DOS in [start, end], same rules as
+    get_scheduled_snapshot (latest insert per DOS, weights applied), in one query.
+    """
+    sql = """
+        SELECT
+            s.dos,
+            s.location,
+            s.modality,
+            SUM(s.volume) AS volume,
+            MAX(w.weight) AS modality_weight,
+            CAST(SUM(s.volume * w.weight) AS DECIMAL(10,2)) AS weighted_units,
+            MAX(s.inserted) AS snapshot_date
+        FROM dbo.SCHEDULED s
+        JOIN dbo.v_Active_Locations a
+            ON s.location = a.LocationName
+        JOIN dbo.Modality_Weight_Governance w
+            ON UPPER(LTRIM(RTRIM(w.modality))) =
+               UPPER(LTRIM(RTRIM(s.modality)))
+           AND s.dos BETWEEN w.effective_start
+                          AND ISNULL(w.effective_end, '9999-12-31')
+
+        WHERE s.dos BETWEEN ? AND ?
+            AND s.inserted = (
+                SELECT MAX(s2.inserted)
+                FROM dbo.SCHEDULED s2
+                WHERE s2.dos = s.dos
+                AND s2.inserted <= CAST(GETDATE() AS date)
+            )
+
+        GROUP BY
+            s.dos,
+            s.location,
+            s.modality
+    """
+    with get_connection() as conn:
+        df = pd.read_sql(sql, conn, params=[start_date, end_date])
+
+    df["dos"] = pd.to_datetime(df["dos"]).dt.date
+    return df
+
+
+def get_scheduled_history(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Every SCHEDULED snapshot (one row per dos, location, modality, inserted)
+    for DOS in [start, end] — the raw material for pickup curves.
+    """
+    sql = """
+        SELECT
+            s.dos,
+            s.location,
+            s.modality,
+            s.inserted,
+            SUM(s.volume) AS volume
+        FROM dbo.SCHEDULED s
+        WHERE s.dos BETWEEN ? AND ?
+        GROUP BY s.dos, s.location, s.modality, s.inserted
+    """
+    with get_connection() as conn:
+        df = pd.read_sql(sql, conn, params=[start_date, end_date])
+
+    df["dos"] = pd.to_datetime(df["dos"]).dt.date
+    df["inserted"] = pd.to_datetime(df["inserted"]).dt.date
+    return df
+
+
+PICKUP_EXCLUDED_CATEGORIES = ("E&M CODES", "ENHANCED SRVC")
+
+
+def get_completed_units_for_pickup(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    DAILY units per (dos, location, modality) in [start, end], without the
+    non-imaging categories (as in the SCHEDULED_FORECAST view).
+    """
+    sql = f"""
+        SELECT
+            CAST(ScheduleStartDate AS DATE) AS dos,
+            LocationName AS location,
+            ProcedureCategory AS modality,
+            SUM(Unit) AS units
+        FROM DAILY
+        WHERE CAST(ScheduleStartDate AS DATE) BETWEEN ? AND ?
+          AND ProcedureCategory NOT IN ({", ".join("?" * len(PICKUP_EXCLUDED_CATEGORIES))})
+        GROUP BY CAST(ScheduleStartDate AS DATE), LocationName, ProcedureCategory
+    """
+    with get_connection() as conn:
+        df = pd.read_sql(sql, conn, params=[start_date, end_date, *PICKUP_EXCLUDED_CATEGORIES])
+
+    df["dos"] = pd.to_datetime(df["dos"]).dt.date
+    return df
+
+
+@shared_result
 def get_location_capacity_90th() -> pd.DataFrame:
     """90th percentile capacity per location"""
     sql = """
@@ -184,6 +303,7 @@ def get_location_capacity_90th() -> pd.DataFrame:
         return pd.read_sql(sql, conn)
 
 
+@shared_result
 def get_modality_capacity_detail() -> pd.DataFrame:
     """Modality-level 90th percentile capacity + status"""
     sql = """
@@ -264,6 +384,7 @@ def get_daily_units_for_top(start_date: datetime = None, end_date: datetime = No
         return pd.read_sql(sql, conn, params=params)
         
         
+@shared_result
 def get_budget_for_month(year: int, month: int) -> pd.DataFrame:
     """Get projected volume for specific month"""
     sql = """
@@ -285,12 +406,43 @@ def get_budget_daily_volume(year: int, month: int) -> pd.DataFrame:
     with get_connection() as conn:
         return pd.read_sql(sql, conn, params=[year, month])
 
-def get_budget_mtd(year: int, month: int, businessdays: int) -> pd.DataFrame:
-    """Get MTD budget"""
+@shared_result
+def get_budget_mtd(
+    year: int,
+    month: int,
+    businessdays: int,
+    days_by_location: Optional[pd.Series] = None,
+) -> pd.DataFrame:
+    """
+    Get MTD budget.
+    days_by_location: LocationName -> days open MTD (operating calendar);
+    locations missing from it use the global businessdays count.
+    """
     df = get_budget_daily_volume(year, month)
-    df['Unit'] = df['Unit'] * businessdays
+    df['Unit'] = df['Unit'] * budget_days(df['LocationName'], businessdays, days_by_location)
     return df
 
+def budget_days(
+    locations: pd.Series,
+    businessdays: int,
+    days_by_location: Optional[pd.Series] = None,
+) -> pd.Series:
+    """
+    Days to pace each budget row by: the location's days open when known,
+    else the global businessdays count (logged).
+    """
+    if days_by_location is None:
+        return pd.Series(businessdays, index=locations.index)
+    days = locations.map(days_by_location)
+    missing = sorted(locations[days.isna()].unique())
+    if missing:
+        logger.warning(
+            f"No operating calendar for {', '.join(missing)}; "
+            f"budget paced on {businessdays} business days."
+        )
+    return days.fillna(businessdays)
+
+@shared_result
 def get_year_budget_proj_daily(year: int) -> pd.DataFrame:
     """Get yearly projected daily budget (using stored proc)"""
     sql = "EXEC getYearBudgetProjDaily @year = ?"
@@ -301,6 +453,7 @@ def get_year_budget_proj_daily(year: int) -> pd.DataFrame:
 # src/radiology_reports/data/workload.py
 # ← Add this function somewhere in the file
 
+@shared_result
 def get_budget_daily_volume(year: int, month: int) -> pd.DataFrame:
     """Centralized query for daily projected budget volume"""
     sql = """
@@ -318,6 +471,7 @@ def get_budget_daily_volume(year: int, month: int) -> pd.DataFrame:
     with get_connection() as conn:
         return pd.read_sql(sql, conn, params=[year, month])
 
+@shared_result
 def get_units_by_range(start_date: date, end_date: date) -> pd.DataFrame:
     """
     Fetches exam units between a specified start and end date.
@@ -329,9 +483,56 @@ def get_units_by_range(start_date: date, end_date: date) -> pd.DataFrame:
     """
     with get_connection() as conn:
         return pd.read_sql(sql, conn, params=[start_date, end_date])
-        
-        
-        
+
+
+@shared_result
+def get_daily_units_by_range(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Units per (day, location, category) between start and end, aggregated in SQL.
+    Used by batch (date-range) runs to load a whole range in one query.
+    Same rows and columns as get_data_by_date per day (LOCATIONS join,
+    Region, Year), so cube-backed and live DAILY totals agree.
+    """
+    sql = """
+        SELECT
+            CAST(ScheduleStartDate AS DATE) AS ScheduleStartDate,
+            d.LocationName,
+            ProcedureCategory,
+            l.Region,
+            SUM(Unit) AS Unit,
+            YEAR(ScheduleStartDate) AS Year
+        FROM DAILY d
+        INNER JOIN LOCATIONS l ON d.LocationName = l.LocationName
+        WHERE CAST(ScheduleStartDate AS DATE) BETWEEN ? AND ?
+        GROUP BY CAST(ScheduleStartDate AS DATE), d.LocationName, ProcedureCategory, l.Region,
+                 YEAR(ScheduleStartDate)
+    """
+    with get_connection() as conn:
+        df = pd.read_sql(sql, conn, params=[start_date, end_date])
+
+    df["ScheduleStartDate"] = pd.to_datetime(df["ScheduleStartDate"]).dt.date
+    return df
+
+
+
+@shared_result
+def get_location_open_dates(start_date: date, end_date: date) -> pd.DataFrame:
+    """
+    Distinct (LocationName, date) pairs with DAILY activity in the range.
+    Used to infer each location's operating weekdays.
+    """
+    sql = """
+        SELECT DISTINCT
+            LocationName,
+            CAST(ScheduleStartDate AS DATE) AS ScheduleStartDate
+        FROM DAILY
+        WHERE CAST(ScheduleStartDate AS DATE) BETWEEN ? AND ?
+    """
+    with get_connection() as conn:
+        return pd.read_sql(sql, conn, params=[start_date, end_date])
+
+
+@shared_result
 def budget_exists_for_month(year: int, month: int) -> bool:
     sql = """
         SELECT TOP 1 1
@@ -0,0 +1,219 @@
+# src/radiology_reports/forecasting/accuracy_history.py
+"""
+Scheduled-vs-completed forecast accuracy over a window of days.
+
+The scheduled snapshot is the forecast; completed weighted units are the
+actual. For a whole window this:
+- loads snapshots and completed workload with one range query each
+- aggregates per (dos, location) with groupby (no iterrows)
+- computes accuracy, rolling MAPE and bias with grouped rolling windows
+- keeps per-(dos, location) totals in a small SQLite history, so the
+  trend is read back instead of rescanning SCHEDULED / workload, and
+  only days missing from the history are queried
+"""
+
+from __future__ import annotations
+
+import sqlite3
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_HISTORY_DB = Path("output") / "forecast_accuracy_history.db"
+# Days this recent are never stored: their DAILY completions may still be loading
+SETTLE_DAYS = 3
+
+COLUMNS = ["dos", "location", "scheduled", "actual"]
+
+
+# =====================================================
+# Aggregation
+# =====================================================
+def aggregate_window(sched_df: pd.DataFrame, actual_df: pd.DataFrame) -> Tuple[pd.DataFrame, Set[str]]:
+    """
+    Per-(dos, location) scheduled and actual weighted units.
+    Scheduled rows without a modality weight count 0 and their modality is
+    reported back (as the single-day report did).
+    """
+    unknown: Set[str] = set()
+    if sched_df.empty:
+        sched = pd.DataFrame(columns=["dos", "location", "scheduled"])
+    else:
+        no_weight = sched_df["modality_weight"].isna()
+        unknown = set(sched_df.loc[no_weight, "modality"].fillna("(NULL)"))
+        units = pd.to_numeric(sched_df["weighted_units"], errors="coerce").fillna(0.0).astype(float)
+        sched = (
+            sched_df.assign(scheduled=units.where(~no_weight, 0.0))
+            .groupby(["dos", "location"], as_index=False)["scheduled"].sum()
+        )
+
+    if actual_df.empty:
+        actual = pd.DataFrame(columns=["dos", "location", "actual"])
+    else:
+        actual = (
+            actual_df.assign(actual=pd.to_numeric(actual_df["weighted_units"], errors="coerce").astype(float))
+            .groupby(["dos", "location"], as_index=False)["actual"].sum()
+        )
+
+    df = sched.merge(actual, on=["dos", "location"], how="outer")
+    df[["scheduled", "actual"]] = df[["scheduled", "actual"]].astype(float).fillna(0.0)
+    return df.sort_values(["dos", "location"]).reset_index(drop=True)[COLUMNS], unknown
+
+
+def add_accuracy(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Adds Diff (actual − scheduled), Accuracy (actual / scheduled × 100,
+    NaN when nothing was scheduled), APE (|scheduled − actual| / actual × 100,
+    NaN when nothing was done) and Error (scheduled − actual).
+    """
+    s = df["scheduled"].to_numpy(dtype=float)
+    a = df["actual"].to_numpy(dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        accuracy = np.where(s > 0, a / s * 100, np.nan)
+        ape = np.where(a > 0, np.abs(s - a) / a * 100, np.nan)
+    return df.assign(diff=a - s, accuracy=accuracy, ape=ape, error=s - a)
+
+
+def network_by_day(df: pd.DataFrame) -> pd.DataFrame:
+    """Network totals per DOS with the same accuracy columns."""
+    daily = df.groupby("dos", as_index=False)[["scheduled", "actual"]].sum()
+    return add_accuracy(daily.assign(location="NETWORK"))[["dos", "location", "scheduled", "actual",
+                                                           "diff", "accuracy", "ape", "error"]]
+
+
+def rolling_metrics(df: pd.DataFrame, window: int = 7) -> pd.DataFrame:
+    """
+    Rolling MAPE and bias per location over the last `window` days
+    (rows must carry ape and error, e.g. from add_accuracy).
+    """
+    df = df.sort_values(["location", "dos"]).reset_index(drop=True)
+    grouped = df.groupby("location", sort=False)
+    return df.assign(
+        rolling_mape=grouped["ape"].transform(lambda x: x.rolling(window, min_periods=1).mean()),
+        rolling_bias=grouped["error"].transform(lambda x: x.rolling(window, min_periods=1).mean()),
+    )
+
+
+# =====================================================
+# History store
+# =====================================================
+class AccuracyHistory:
+    """
+    SQLite table of per-(dos, location) scheduled / actual totals.
+    """
+
+    def __init__(self, path=DEFAULT_HISTORY_DB):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS accuracy (
+                       dos TEXT NOT NULL,
+                       location TEXT NOT NULL,
+                       scheduled REAL NOT NULL,
+                       actual REAL NOT NULL,
+                       PRIMARY KEY (dos, location))"""
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS loaded_days (dos TEXT PRIMARY KEY)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def loaded_days(self, start: date, end: date) -> Set[date]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT dos FROM loaded_days WHERE dos BETWEEN ? AND ?",
+                (start.isoformat(), end.isoformat()),
+            ).fetchall()
+        return {date.fromisoformat(r[0]) for r in rows}
+
+    def missing_days(self, start: date, end: date) -> List[date]:
+        have = self.loaded_days(start, end)
+        days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        return [d for d in days if d not in have]
+
+    def store(self, df: pd.DataFrame, days: Iterable[date]) -> None:
+        """Replace the rows for `days` with df (days with no rows are still marked loaded)."""
+        days = [d.isoformat() for d in days]
+        rows = list(zip(
+            pd.Series(df["dos"]).map(lambda d: d.isoformat()),
+            df["location"],
+            df["scheduled"].astype(float),
+            df["actual"].astype(float),
+        ))
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM accuracy WHERE dos = ?", [(d,) for d in days])
+            conn.executemany("INSERT OR REPLACE INTO accuracy VALUES (?, ?, ?, ?)", rows)
+            conn.executemany("INSERT OR IGNORE INTO loaded_days VALUES (?)", [(d,) for d in days])
+
+    def load(self, start: date, end: date) -> pd.DataFrame:
+        with self._connect() as conn:
+            df = pd.read_sql_query(
+                "SELECT dos, location, scheduled, actual FROM accuracy WHERE dos BETWEEN ? AND ?",
+                conn,
+                params=(start.isoformat(), end.isoformat()),
+            )
+        df["dos"] = pd.to_datetime(df["dos"]).dt.date
+        return df.sort_values(["dos", "location"]).reset_index(drop=True)
+
+
+def _runs(days: List[date]) -> List[Tuple[date, date]]:
+    """Contiguous [first, last] runs of sorted days."""
+    runs: List[Tuple[date, date]] = []
+    for d in days:
+        if runs and d == runs[-1][1] + timedelta(days=1):
+            runs[-1] = (runs[-1][0], d)
+        else:
+            runs.append((d, d))
+    return runs
+
+
+def load_accuracy(
+    start: date,
+    end: date,
+    history: Optional[AccuracyHistory] = None,
+    refresh: bool = False,
+) -> Tuple[pd.DataFrame, Set[str]]:
+    """
+    Per-(dos, location) scheduled / actual for [start, end]. With a
+    history, only days not stored yet (or all of them with refresh) are
+    queried — one pair of range queries per contiguous gap — then stored.
+    Only settled days (older than SETTLE_DAYS) with completions are stored;
+    the rest are reported but re-queried next time, since they may still
+    change.
+    """
+    from radiology_reports.data.workload import (
+        get_daily_completed_workload_by_range,
+        get_scheduled_snapshots_by_range,
+    )
+
+    if history is None:
+        return aggregate_window(
+            get_scheduled_snapshots_by_range(start, end),
+            get_daily_completed_workload_by_range(start, end),
+        )
+
+    days = (
+        [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        if refresh else history.missing_days(start, end)
+    )
+    unknown: Set[str] = set()
+    recent = []
+    settled = date.today() - timedelta(days=SETTLE_DAYS)
+    for first, last in _runs(days):
+        df, gap_unknown = aggregate_window(
+            get_scheduled_snapshots_by_range(first, last),
+            get_daily_completed_workload_by_range(first, last),
+        )
+        unknown |= gap_unknown
+        completed_days = set(pd.to_datetime(df.loc[df["actual"] > 0, "dos"]).dt.date)
+        final_days = [d for d in days if first <= d <= last and d < settled and d in completed_days]
+        final = df["dos"].isin(final_days)
+        history.store(df[final], final_days)
+        recent.append(df[~final])
+
+    df = pd.concat([history.load(start, end)] + recent, ignore_index=True)
+    return df.sort_values(["dos", "location"]).reset_index(drop=True), unknown
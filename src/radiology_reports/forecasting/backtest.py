@@ -0,0 +1,233 @@
+# src/radiology_reports/forecasting/backtest.py
+"""
+Walk-forward backtests for panel forecasters.
+
+A forecaster is any fn(panel, horizon) -> (series × horizon) array (the
+baseline methods already are). Each origin is one fold: the forecaster
+sees history through the origin only and is scored on the next `horizon`
+days, for every series at once. Folds run across processes; the panel is
+sent to each worker once (pool initializer), not once per fold.
+
+Fold forecasts are cached on disk keyed by forecaster (name, bound
+parameters, optional `version` attribute and the source of its module),
+horizon and a hash of the history the fold saw, so adding origins or
+forecasters only computes the new folds, and editing a forecaster
+recomputes its folds.
+
+Metrics per (forecaster, location, modality, horizon day):
+- MAE   mean |forecast − actual|
+- MAPE  mean |forecast − actual| / actual × 100 over days with actual > 0
+- Bias  mean (forecast − actual)
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import inspect
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from radiology_reports.forecasting.baseline import KEY_COLS, METHODS, SeriesPanel
+
+logger = logging.getLogger(__name__)
+
+Forecaster = Callable[[SeriesPanel, int], np.ndarray]
+
+DEFAULT_CACHE = Path("backtest_cache")
+
+FORECASTERS: Dict[str, Forecaster] = dict(METHODS)
+
+
+def register_forecaster(name: str):
+    """Decorator: make fn(panel, horizon) available to backtests by name."""
+    def wrap(fn: Forecaster) -> Forecaster:
+        FORECASTERS[name] = fn
+        return fn
+    return wrap
+
+
+def per_series(fit_predict: Callable[[np.ndarray, pd.DatetimeIndex, int], np.ndarray]) -> Forecaster:
+    """
+    Adapt a one-series model (Prophet, SARIMA, ...) to the panel interface:
+    fit_predict(y, dates, horizon) -> horizon values, called per series.
+    Must be a module-level function so folds can run in worker processes.
+    """
+    return _PerSeries(fit_predict)
+
+
+class _PerSeries:
+    def __init__(self, fit_predict):
+        self.fit_predict = fit_predict
+        self.__name__ = getattr(fit_predict, "__name__", "per_series")
+
+    def __call__(self, panel: SeriesPanel, horizon: int) -> np.ndarray:
+        dates = panel.dates()
+        return np.vstack([
+            np.asarray(self.fit_predict(y, dates, horizon), dtype=float)
+            for y in panel.values
+        ])
+
+
+# =====================================================
+# Folds
+# =====================================================
+def rolling_origins(panel: SeriesPanel, horizon: int, first: date, last: Optional[date] = None,
+                    step_days: int = 7) -> List[date]:
+    """Origins from first to last every step_days, each with horizon days of actuals."""
+    latest = pd.Timestamp(str(panel.end)).date() - timedelta(days=horizon)
+    last = min(last or latest, latest)
+    origins = []
+    d = first
+    while d <= last:
+        origins.append(d)
+        d += timedelta(days=step_days)
+    return origins
+
+
+def forecaster_fingerprint(fn) -> str:
+    """
+    Hash of what a forecaster computes: its `version` and `params`
+    attributes (if any), functools.partial arguments, and the source of the module defining
+    the underlying function (so edits to it or its helpers count).
+    """
+    parts = []
+    while True:
+        parts.append(repr((getattr(fn, "version", None), getattr(fn, "params", None))))
+        if isinstance(fn, functools.partial):
+            parts.append(repr((fn.args, sorted(fn.keywords.items()))))
+            fn = fn.func
+        elif isinstance(fn, _PerSeries):
+            fn = fn.fit_predict
+        else:
+            break
+
+    parts.append(f"{getattr(fn, '__module__', '')}.{getattr(fn, '__qualname__', type(fn).__name__)}")
+    try:
+        parts.append(inspect.getsource(inspect.getmodule(fn)))
+    except (OSError, TypeError):
+        logger.warning(f"No source for forecaster {parts[-1]}; cached folds track its name and version only")
+    return hashlib.sha256("|".join(parts).encode()).hexdigest()[:16]
+
+
+def _fold_key(name: str, fingerprint: str, horizon: int, history: SeriesPanel) -> str:
+    h = hashlib.sha256()
+    h.update(f"{name}|{fingerprint}|{horizon}|{history.start}|{history.values.shape}".encode())
+    h.update(repr(history.keys).encode())
+    h.update(np.ascontiguousarray(history.values).tobytes())
+    return h.hexdigest()[:24]
+
+
+def _run_fold(panel: SeriesPanel, name: str, fn: Forecaster, origin: date, horizon: int,
+              cache_dir: Optional[Path], fingerprint: str = "") -> np.ndarray:
+    history = panel.upto(origin)
+    path = None
+    if cache_dir is not None:
+        path = cache_dir / name / f"{_fold_key(name, fingerprint, horizon, history)}.npy"
+        if path.exists():
+            return np.load(path)
+
+    forecast = np.asarray(fn(history, horizon), dtype=float)
+
+    if path is not None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".npy")
+        with os.fdopen(fd, "wb") as fh:
+            np.save(fh, forecast)
+        os.replace(tmp, path)
+    return forecast
+
+
+_WORKER_PANEL: Optional[SeriesPanel] = None
+
+
+def _init_worker(panel: SeriesPanel) -> None:
+    global _WORKER_PANEL
+    _WORKER_PANEL = panel
+
+
+def _run_fold_in_worker(task) -> np.ndarray:
+    return _run_fold(_WORKER_PANEL, *task)
+
+
+# =====================================================
+# Backtest
+# =====================================================
+def backtest(
+    panel: SeriesPanel,
+    origins: Sequence[date],
+    horizon: int,
+    forecasters: Iterable[str] = (),
+    workers: Optional[int] = None,
+    cache_dir: Optional[Path] = DEFAULT_CACHE,
+) -> pd.DataFrame:
+    """
+    Long fold results: Forecaster, Origin, <KEY_COLS>, Horizon, Date,
+    Forecast, Actual. workers=1 runs in-process.
+    """
+    names = list(forecasters) or list(FORECASTERS)
+    unknown = [n for n in names if n not in FORECASTERS]
+    if unknown:
+        raise ValueError(f"Unknown forecaster(s): {unknown}. Registered: {sorted(FORECASTERS)}")
+
+    cache_dir = Path(cache_dir) if cache_dir is not None else None
+    fingerprints = {n: forecaster_fingerprint(FORECASTERS[n]) for n in names}
+    tasks = [(n, FORECASTERS[n], o, horizon, cache_dir, fingerprints[n]) for n in names for o in origins]
+    workers = min(workers or os.cpu_count() or 1, max(len(tasks), 1))
+    logger.info(f"Backtest: {len(names)} forecasters × {len(origins)} origins on {workers} workers")
+
+    if workers == 1:
+        forecasts = [_run_fold(panel, *task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(panel,)) as pool:
+            forecasts = list(pool.map(_run_fold_in_worker, tasks))
+
+    return _fold_frame(panel, tasks, forecasts, horizon)
+
+
+def _fold_frame(panel: SeriesPanel, tasks, forecasts, horizon: int) -> pd.DataFrame:
+    n_series = len(panel.keys)
+    keys = pd.DataFrame(panel.keys, columns=list(KEY_COLS))
+    steps = np.arange(1, horizon + 1)
+
+    frames = []
+    for (name, _, origin, *_), forecast in zip(tasks, forecasts):
+        o = int((np.datetime64(origin, "D") - panel.start).astype(np.int64))
+        actual = panel.values[:, o + 1:o + 1 + horizon]
+
+        frame = keys.loc[keys.index.repeat(horizon)].reset_index(drop=True)
+        frame.insert(0, "Origin", pd.Timestamp(origin))
+        frame.insert(0, "Forecaster", name)
+        frame["Horizon"] = np.tile(steps, n_series)
+        frame["Date"] = frame["Origin"] + pd.to_timedelta(frame["Horizon"], unit="D")
+        frame["Forecast"] = forecast.ravel()
+        frame["Actual"] = actual.ravel()
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def summarize(folds: pd.DataFrame, by: Sequence[str] = ("Forecaster",) + KEY_COLS + ("Horizon",)) -> pd.DataFrame:
+    """MAE / MAPE / Bias (and fold count) grouped by `by`."""
+    err = folds["Forecast"] - folds["Actual"]
+    pos = folds["Actual"] > 0
+    frame = folds[list(by)].assign(
+        AbsErr=err.abs(),
+        Err=err,
+        Ape=(err.abs() / folds["Actual"].where(pos)) * 100,
+    )
+    out = frame.groupby(list(by), sort=True).agg(
+        MAE=("AbsErr", "mean"),
+        MAPE=("Ape", "mean"),
+        Bias=("Err", "mean"),
+        Folds=("Err", "size"),
+    )
+    return out.reset_index()
@@ -0,0 +1,202 @@
+# src/radiology_reports/forecasting/baseline.py
+"""
+Vectorized baseline forecasts for every (location, modality) series at once.
+
+History is pivoted into one dense (series × day) array; missing days are 0
+(site closed / nothing done). Each method maps that array to a
+(series × horizon) forecast with array indexing only — no per-series
+loop — so all combos forecast in milliseconds. They are the production
+default and the yardstick the Prophet/SARIMA experiments have to beat.
+
+Methods:
+- seasonal_naive:        mean of the last `weeks` same-weekday values
+- same_weekday_last_year: value 364 days earlier × recent YoY trend ratio
+- ewm_dow:               exponentially weighted day-of-week profile
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+DATE_COL = "ScheduleStartDate"
+KEY_COLS = ("LocationName", "ProcedureCategory")
+VALUE_COL = "Unit"
+
+DAYS_PER_YEAR = 364  # 52 weeks: same weekday last year
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday (weekday 3)
+    return (days.astype("datetime64[D]").astype(np.int64) + 3) % 7
+
+
+@dataclass
+class SeriesPanel:
+    """
+    keys:   one (location, modality) per row of values
+    start:  date of column 0
+    values: (series, days) float array, 0 on days without activity
+    """
+
+    keys: List[Tuple]
+    start: np.datetime64
+    values: np.ndarray
+
+    @classmethod
+    def from_frame(
+        cls,
+        df: pd.DataFrame,
+        date_col: str = DATE_COL,
+        key_cols: Sequence[str] = KEY_COLS,
+        value_col: str = VALUE_COL,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+    ) -> "SeriesPanel":
+        """Pivot long history rows into the dense panel (duplicates are summed)."""
+        days = pd.to_datetime(df[date_col]).to_numpy().astype("datetime64[D]")
+        first = np.datetime64(start, "D") if start else days.min()
+        last = np.datetime64(end, "D") if end else days.max()
+
+        keep = (days >= first) & (days <= last)
+        codes, uniques = pd.MultiIndex.from_frame(df.loc[keep, list(key_cols)]).factorize(sort=True)
+        cols = (days[keep] - first).astype(np.int64)
+
+        values = np.zeros((len(uniques), int((last - first).astype(np.int64)) + 1))
+        np.add.at(values, (codes, cols), df.loc[keep, value_col].to_numpy(dtype=float))
+        return cls(list(uniques), first, values)
+
+    @property
+    def end(self) -> np.datetime64:
+        return self.start + self.values.shape[1] - 1
+
+    def dates(self) -> pd.DatetimeIndex:
+        return pd.date_range(str(self.start), str(self.end), freq="D")
+
+    def upto(self, last) -> "SeriesPanel":
+        """Panel truncated to history through `last` (no copy)."""
+        n = int((np.datetime64(last, "D") - self.start).astype(np.int64)) + 1
+        return SeriesPanel(self.keys, self.start, self.values[:, :max(n, 0)])
+
+
+# =====================================================
+# Methods: panel + horizon (1 = day after panel.end) -> (series, horizon)
+# =====================================================
+def _steps(horizon: int) -> np.ndarray:
+    return np.arange(1, horizon + 1)
+
+
+def seasonal_naive(panel: SeriesPanel, horizon: int, weeks: int = 1) -> np.ndarray:
+    """Mean of the last `weeks` observed values on the same weekday."""
+    t_last = panel.values.shape[1] - 1
+    h = _steps(horizon)
+    latest = t_last + h - 7 * np.ceil(h / 7).astype(int)  # newest same-weekday index
+
+    lags = latest[None, :] - 7 * np.arange(weeks)[:, None]  # (weeks, horizon)
+    valid = lags >= 0
+    picked = panel.values[:, np.clip(lags, 0, None)] * valid  # (series, weeks, horizon)
+    return picked.sum(axis=1) / np.maximum(valid.sum(axis=0), 1)
+
+
+def same_weekday_last_year(
+    panel: SeriesPanel,
+    horizon: int,
+    trend_days: int = 28,
+    clip: Tuple[float, float] = (0.5, 2.0),
+) -> np.ndarray:
+    """
+    Value 364 days before each target day, scaled by the ratio of the last
+    `trend_days` to the same window a year earlier. Series (or targets)
+    without a year of history fall back to seasonal_naive.
+    """
+    n = panel.values.shape[1]
+    t_last = n - 1
+    fallback = seasonal_naive(panel, horizon)
+    if n < DAYS_PER_YEAR + trend_days:
+        return fallback
+
+    recent = panel.values[:, n - trend_days:].sum(axis=1)
+    prior = panel.values[:, n - trend_days - DAYS_PER_YEAR:n - DAYS_PER_YEAR].sum(axis=1)
+    ratio = np.where(prior > 0, recent / np.where(prior > 0, prior, 1), 1.0)
+    ratio = np.clip(ratio, *clip)
+
+    idx = t_last + _steps(horizon) - DAYS_PER_YEAR
+    in_history = (idx >= 0) & (idx <= t_last)
+    last_year = panel.values[:, np.clip(idx, 0, t_last)] * ratio[:, None]
+
+    use = in_history[None, :] & (prior > 0)[:, None]
+    return np.where(use, last_year, fallback)
+
+
+def ewm_dow(panel: SeriesPanel, horizon: int, halflife_weeks: float = 4.0) -> np.ndarray:
+    """
+    Exponentially weighted mean per weekday (weight halves every
+    halflife_weeks), read off for each target day's weekday.
+    """
+    n = panel.values.shape[1]
+    age_weeks = (n - 1 - np.arange(n)) / 7.0
+    weights = 0.5 ** (age_weeks / halflife_weeks)
+
+    weekday = _weekday(panel.start + np.arange(n))
+    onehot = weekday[:, None] == np.arange(7)[None, :]  # (days, 7)
+    num = panel.values @ (onehot * weights[:, None])  # (series, 7)
+    den = np.maximum((onehot * weights[:, None]).sum(axis=0), 1e-12)
+    profile = num / den
+
+    target_weekday = _weekday(panel.end + _steps(horizon))
+    return profile[:, target_weekday]
+
+
+METHODS: Dict[str, Callable[..., np.ndarray]] = {
+    "seasonal_naive": seasonal_naive,
+    "same_weekday_last_year": same_weekday_last_year,
+    "ewm_dow": ewm_dow,
+}
+DEFAULT_METHOD = "ewm_dow"
+
+
+# =====================================================
+# Long-format output
+# =====================================================
+def forecast_frame(
+    panel: SeriesPanel,
+    horizon: int,
+    methods: Sequence[str] = (DEFAULT_METHOD,),
+    key_cols: Sequence[str] = KEY_COLS,
+) -> pd.DataFrame:
+    """
+    One row per (method, day, series): Method, Date, <key_cols>, Forecast.
+    """
+    dates = pd.to_datetime(panel.end + _steps(horizon))
+    keys = pd.DataFrame(panel.keys, columns=list(key_cols))
+
+    frames = []
+    for name in methods:
+        fc = METHODS[name](panel, horizon)
+        frame = keys.loc[keys.index.repeat(horizon)].reset_index(drop=True)
+        frame.insert(0, "Date", np.tile(dates, len(keys)))
+        frame.insert(0, "Method", name)
+        frame["Forecast"] = fc.ravel()
+        frames.append(frame)
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def baseline_forecast(
+    history: pd.DataFrame,
+    through: date,
+    horizon: int,
+    methods: Sequence[str] = (DEFAULT_METHOD,),
+) -> pd.DataFrame:
+    """Forecast horizon days after `through` from DAILY-shaped history rows."""
+    panel = SeriesPanel.from_frame(history, end=through)
+    return forecast_frame(panel, horizon, methods)
+
+
+def history_window(through: date, years: int = 1, trend_days: int = 28) -> Tuple[date, date]:
+    """History range the methods need to forecast from `through`."""
+    return through - timedelta(days=years * DAYS_PER_YEAR + trend_days + 7), through
@@ -3,14 +3,25 @@
 scripts/daily_forecast_accuracy.py
 Compare yesterday's scheduled snapshot (inserted=dos) vs completed weighted units.
 Refactored to use rrc.data.workload
+
+Window mode (--start/--end) loads every day in one pass through
+forecasting.accuracy_history and adds per-day network accuracy and a
+rolling MAPE / bias trend per location. With --history, settled days
+are kept in a local SQLite store and not re-queried.
 """
 from datetime import date, timedelta
-from collections import defaultdict
+import argparse
 import io
 import pandas as pd
 
-from utils.logger import get_logger
-from rrc.data.workload import get_daily_completed_workload, get_scheduled_snapshot
+from radiology_reports.utils.logger import get_logger
+from radiology_reports.forecasting.accuracy_history import (
+    AccuracyHistory,
+    add_accuracy,
+    load_accuracy,
+    network_by_day,
+    rolling_metrics,
+)
 
 def format_table(rows, headers):
     output = io.StringIO()
@@ -26,49 +37,37 @@ def format_table(rows, headers):
         print(fmt(row), file=output)
     return output.getvalue()
 
-def main():
-    log = get_logger(__name__)
-    log.info("=== Daily Forecast Accuracy Check Started ===")
-
-    yesterday = date.today() - timedelta(days=1)
-    y_str = yesterday.strftime("%Y-%m-%d")
-
-    # Use workload module to get actuals and scheduled snapshot
-    actual_df = get_daily_completed_workload(y_str)
-    sched_df = get_scheduled_snapshot(y_str)
-
-    # Aggregate by location
-    actual = actual_df.groupby('location')['weighted_units'].sum().to_dict() if not actual_df.empty else {}
-    sched = {}
-    unknown_modalities = set()
-    if not sched_df.empty:
-        for _, r in sched_df.iterrows():
-            loc = r['location']
-            weight = r.get('modality_weight')
-            w_units = r.get('weighted_units')
-            if weight is None or pd.isna(weight):
-                unknown_modalities.add(r.get('modality') or '(NULL)')
-                w_units = 0.0
-            else:
-                w_units = float(w_units or 0.0)
-            sched[loc] = sched.get(loc, 0.0) + w_units
+def parse_args(argv=None):
+    p = argparse.ArgumentParser()
+    p.add_argument("--start", help="First DOS of a window (YYYY-MM-DD).")
+    p.add_argument("--end", help="Last DOS of the window (default: yesterday).")
+    p.add_argument("--window", type=int, default=7, help="Rolling MAPE/bias window in days.")
+    p.add_argument("--history", action="store_true", help="Read/write settled days in the local history store.")
+    p.add_argument("--refresh", action="store_true", help="With --history: re-query stored days and overwrite them.")
+    return p.parse_args(argv)
 
+def location_rows(day_df):
+    """Legacy per-location table rows (rounded values, as before)."""
     rows = []
-    for loc in sorted(set(actual) | set(sched)):
-        s = round(sched.get(loc, 0.0), 2)
-        a = round(actual.get(loc, 0.0), 2)
+    for loc, sched, actual in day_df[["location", "scheduled", "actual"]].itertuples(index=False):
+        s = round(sched, 2)
+        a = round(actual, 2)
         diff = round(a - s, 2)
         acc = round(a / s * 100, 1) if s > 0 else 0
         rows.append((loc, s, a, diff, f"{acc}%" if s > 0 else "N/A"))
+    return rows
 
-    total_scheduled = sum(sched.values())
-    total_actual = sum(actual.values())
+def fmt_pct(v):
+    return "N/A" if pd.isna(v) else f"{v:.1f}%"
+
+def day_report(y_str, day_df, unknown_modalities, out, title="YESTERDAY'S FORECAST ACCURACY"):
+    total_scheduled = day_df["scheduled"].sum()
+    total_actual = day_df["actual"].sum()
     overall_accuracy = round(total_actual / total_scheduled * 100, 1) if total_scheduled > 0 else 0.0
 
-    out = io.StringIO()
-    print(f"YESTERDAY'S FORECAST ACCURACY — {y_str}", file=out)
+    print(f"{title} — {y_str}", file=out)
     print("="*80, file=out)
-    print(format_table(rows, ["Location", "Scheduled", "Actual", "Diff", "Accuracy"]), file=out)
+    print(format_table(location_rows(day_df), ["Location", "Scheduled", "Actual", "Diff", "Accuracy"]), file=out)
     print(file=out)
     print(f"NETWORK: Scheduled {total_scheduled:.2f} | Actual {total_actual:.2f} | "
           f"Accuracy {overall_accuracy}%", file=out)
@@ -78,6 +77,51 @@ def main():
         for m in sorted(unknown_modalities):
             print(" -", m, file=out)
 
+def window_report(start, end, df, window, out):
+    scored = add_accuracy(df)
+    network = network_by_day(df)
+    trend = rolling_metrics(scored, window=window)
+    latest = trend.groupby("location", as_index=False).last()
+
+    print(f"FORECAST ACCURACY — {start} to {end}", file=out)
+    print("="*80, file=out)
+    print(format_table(
+        [(d, f"{s:.2f}", f"{a:.2f}", f"{a - s:.2f}", fmt_pct(acc), fmt_pct(ape))
+         for d, s, a, acc, ape in network[["dos", "scheduled", "actual", "accuracy", "ape"]].itertuples(index=False)],
+        ["DOS", "Scheduled", "Actual", "Diff", "Accuracy", "APE"],
+    ), file=out)
+
+    summary = scored.groupby("location").agg(
+        scheduled=("scheduled", "sum"), actual=("actual", "sum"),
+        mape=("ape", "mean"), bias=("error", "mean"),
+    ).reset_index().merge(latest[["location", "rolling_mape", "rolling_bias"]], on="location")
+    print(f"BY LOCATION (rolling = last {window} days)", file=out)
+    print(format_table(
+        [(r.location, f"{r.scheduled:.2f}", f"{r.actual:.2f}", fmt_pct(r.mape), f"{r.bias:+.2f}",
+          fmt_pct(r.rolling_mape), f"{r.rolling_bias:+.2f}")
+         for r in summary.itertuples(index=False)],
+        ["Location", "Scheduled", "Actual", "MAPE", "Bias", "Rolling MAPE", "Rolling Bias"],
+    ), file=out)
+
+def main(argv=None):
+    args = parse_args(argv)
+    log = get_logger(__name__)
+    log.info("=== Daily Forecast Accuracy Check Started ===")
+
+    yesterday = date.today() - timedelta(days=1)
+    end = date.fromisoformat(args.end) if args.end else yesterday
+    start = date.fromisoformat(args.start) if args.start else end
+
+    history = AccuracyHistory() if args.history else None
+    df, unknown_modalities = load_accuracy(start, end, history=history, refresh=args.refresh)
+
+    out = io.StringIO()
+    if args.start:
+        window_report(start, end, df, args.window, out)
+    else:
+        title = "YESTERDAY'S FORECAST ACCURACY" if end == yesterday else "FORECAST ACCURACY"
+        day_report(end.strftime("%Y-%m-%d"), df[df["dos"] == end], unknown_modalities, out, title)
+
     print(out.getvalue())
     log.info("=== Forecast Accuracy Report Completed ===")
     return out.getvalue()
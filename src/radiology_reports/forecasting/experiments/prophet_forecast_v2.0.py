@@ -3,7 +3,9 @@ import numpy as np
 from prophet import Prophet
 from prophet.diagnostics import cross_validation, performance_metrics
 from datetime import timedelta
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from radiology_reports.forecasting.training_pool import train_by_combo
+from radiology_reports.forecasting.model_registry import ModelRegistry
 import os
 import warnings
 import holidays
@@ -323,11 +325,10 @@ if __name__ == "__main__":
     try:
         hist_ts, scheduled_df, budget_df, capacity_df, dow_effects = load_and_prepare_data(historical_csv, scheduled_csv, budget_csv)
         
-        combos = [(hist_ts, loc, mod) for loc, mod in hist_ts.groupby(['location', 'modality']).groups.keys()
-                  if len(hist_ts[(hist_ts['location'] == loc) & (hist_ts['modality'] == mod)]) >= 10]
-        print(f"Training {len(combos)} combos using {cpu_count()} cores...")
-        with Pool(cpu_count()) as pool:
-            models = dict(pool.map(train_prophet_model, combos))
+        # History is split per combo once (<10 rows dropped); each worker gets only its slice
+        print(f"Training using {cpu_count()} cores...")
+        models = train_by_combo(train_prophet_model, hist_ts, min_rows=10, registry=ModelRegistry(max_age_days=7),
+                                model_type='prophet_logistic', params={'changepoint_prior_scale': 0.1, 'interval_width': 0.95})
         
         predictions = predict_future_exams(models, '2025-03-24', 7, scheduled_df, budget_df, capacity_df, dow_effects)
         print("\nPredicted Exam Counts:")
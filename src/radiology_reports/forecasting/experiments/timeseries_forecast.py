@@ -2,7 +2,9 @@ import pandas as pd
 import numpy as np
 from pmdarima import auto_arima
 from datetime import datetime, timedelta
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from radiology_reports.forecasting.training_pool import train_by_combo
+from radiology_reports.forecasting.model_registry import ModelRegistry
 import os
 import warnings
 warnings.filterwarnings("ignore")
@@ -282,12 +284,10 @@ if __name__ == "__main__":
         )
         
         # Train SARIMA models with parallel processing
-        combos = [(hist_ts, loc, mod) for loc, mod in hist_ts.groupby(['location', 'modality']).groups.keys()]
-        print(f"Training SARIMA for {len(combos)} combos using {cpu_count()} cores...")
-        with Pool(processes=cpu_count()) as pool:
-            results = pool.map(train_sarima_model, combos)
-        
-        models = dict(results)
+        # History is split per combo once; each worker gets only its slice
+        print(f"Training SARIMA using {cpu_count()} cores...")
+        models = train_by_combo(train_sarima_model, hist_ts, registry=ModelRegistry(max_age_days=7),
+                                model_type='sarima_weekly', params={'m': 52, 'max_p': 2, 'max_q': 2, 'holdout_weeks': 4})
         
         start_date = '2025-03-01'
         days_ahead = 7
@@ -2,7 +2,9 @@ import pandas as pd
 import numpy as np
 from prophet import Prophet
 from datetime import datetime, timedelta
-from multiprocessing import Pool, cpu_count
+from multiprocessing import cpu_count
+from radiology_reports.forecasting.training_pool import train_by_combo
+from radiology_reports.forecasting.model_registry import ModelRegistry
 import os
 import warnings
 warnings.filterwarnings("ignore")
@@ -315,12 +317,10 @@ if __name__ == "__main__":
             historical_csv, scheduled_csv, budget_csv
         )
         
-        combos = [(hist_ts, loc, mod) for loc, mod in hist_ts.groupby(['location', 'modality']).groups.keys()]
-        print(f"Training Prophet for {len(combos)} combos using {cpu_count()} cores...")
-        with Pool(processes=cpu_count()) as pool:
-            results = pool.map(train_prophet_model, combos)
-        
-        models = dict(results)
+        # History is split per combo once; each worker gets only its slice
+        print(f"Training Prophet using {cpu_count()} cores...")
+        models = train_by_combo(train_prophet_model, hist_ts, registry=ModelRegistry(max_age_days=7),
+                                model_type='prophet_timeseries', params={'holdout_days': 7})
         
         start_date = '2025-03-06'
         days_ahead = 7
@@ -1,15 +1,14 @@
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
-from sklearn.ensemble import RandomForestRegressor
-from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
-from sklearn.preprocessing import LabelEncoder
 from datetime import datetime, timedelta
 import os
 
+from radiology_reports.forecasting.model_registry import ModelRegistry
+
 def load_and_prepare_data(historical_csv, scheduled_csv=None, budget_csv=None):
     """Load and prepare data, calculate capacity and day-of-week effects"""
+    from sklearn.preprocessing import LabelEncoder
+
     if not os.path.exists(historical_csv):
         raise FileNotFoundError(f"Historical CSV file '{historical_csv}' not found.")
     hist_df = pd.read_csv(historical_csv)
@@ -63,20 +62,38 @@ def load_and_prepare_data(historical_csv, scheduled_csv=None, budget_csv=None):
     
     return hist_df, scheduled_df, budget_df, capacity_df, dow_effects, location_encoder, modality_encoder
 
-def train_and_evaluate_model(df, model_type='linear'):
+# Bump when train_and_evaluate_model changes what it fits: registry keys
+# include it, so cached models are retrained
+TRAINER_VERSION = 1
+
+MODEL_PARAMS = {
+    'linear': {'test_size': 0.2, 'random_state': 42},
+    'random_forest': {'test_size': 0.2, 'random_state': 42, 'n_estimators': 100},
+}
+
+def train_and_evaluate_model(df, model_type='linear', params=None):
     """Train and evaluate a model, returning performance metrics"""
+    if model_type not in MODEL_PARAMS:
+        raise ValueError("Unsupported model_type. Use 'linear' or 'random_forest'.")
+    params = {**MODEL_PARAMS[model_type], **(params or {})}
+
+    # sklearn is imported where it's used so importing this module stays cheap
+    from sklearn.model_selection import train_test_split
+    from sklearn.linear_model import LinearRegression
+    from sklearn.ensemble import RandomForestRegressor
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+
     features = ['day_of_week', 'month', 'day_of_year', 'location_encoded', 'modality_encoded']
     X = df[features]
     y = df['exam_count']
     
-    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=params['test_size'], random_state=params['random_state'])
     
     if model_type == 'linear':
         model = LinearRegression()
-    elif model_type == 'random_forest':
-        model = RandomForestRegressor(n_estimators=100, random_state=42)
     else:
-        raise ValueError("Unsupported model_type. Use 'linear' or 'random_forest'.")
+        model = RandomForestRegressor(n_estimators=params['n_estimators'], random_state=params['random_state'])
     
     model.fit(X_train, y_train)
     
@@ -102,167 +119,197 @@ def train_and_evaluate_model(df, model_type='linear'):
     
     return model, features
 
-def is_holiday(date, holidays):
+HOLIDAYS = {
+    '2025-01-01', # New Year's Day
+    '2025-05-26', # Memorial Day
+    '2025-07-04', # Independence Day
+    '2025-09-01', # Labor Day
+    '2025-11-27', # Thanksgiving Day
+    '2025-12-25', # Christmas Day
+}
+
+def train_with_registry(registry, model_type, data, params=None):
+    """
+    train_and_evaluate_model(data, model_type, params) through the registry;
+    the key carries the same params plus TRAINER_VERSION.
+    """
+    params = {**MODEL_PARAMS[model_type], **(params or {})}
+    key = {**params, 'trainer_version': TRAINER_VERSION}
+    return registry.get_or_train(
+        'ALL', 'ALL', f'sklearn_{model_type}', key, data,
+        lambda d: train_and_evaluate_model(d, model_type=model_type, params=params))
+
+PREDICTION_COLUMNS = ['date', 'location', 'modality', 'scheduled_count',
+                      'predicted_additional', 'max_capacity', 'total_predicted',
+                      'budget_count', 'variance', 'is_holiday']
+
+def is_holiday(date, holidays=None):
     """Check if a date is a holiday"""
-    return date.strftime('%Y-%m-%d') in holidays
+    return date.strftime('%Y-%m-%d') in (HOLIDAYS if holidays is None else holidays)
+
+def _encode(encoder, values):
+    """LabelEncoder.transform for a whole column; unknown labels -> NaN"""
+    index = {label: i for i, label in enumerate(encoder.classes_)}
+    return values.map(index)
+
+def _first_match(lookup_df, keys, value_column):
+    """One value per key combo (first row wins, like .iloc[0] on a mask)"""
+    return lookup_df.drop_duplicates(subset=keys, keep='first')[keys + [value_column]]
+
+def _with_na(values, present, dtype=None):
+    """Object column with 'N/A' where a value is missing (present values keep dtype)"""
+    values = pd.Series(values).reset_index(drop=True)
+    present = np.asarray(present, dtype=bool)
+    out = pd.Series('N/A', index=values.index, dtype=object)
+    kept = values[present]
+    out[present] = list(kept.astype(dtype) if dtype is not None else kept)
+    return out
 
 def predict_future_exams(model, start_date, days_ahead, scheduled_df, budget_df, capacity_df, 
                         dow_effects, location_encoder, modality_encoder, feature_names):
-    """Predict exam counts, capping at 10% above budget"""
+    """
+    Predict exam counts, capping at 10% above budget.
+
+    Vectorized: one feature matrix for every (date, location, modality) in
+    the horizon, a single model.predict call, capacity/budget via merges,
+    and caps / holiday / weekend rules as array ops.
+    """
     if (scheduled_df is None or scheduled_df.empty) and (budget_df is None or budget_df.empty):
         print("No scheduled or budgeted exams to predict.")
-        return pd.DataFrame(columns=['date', 'location', 'modality', 'scheduled_count', 
-                                    'predicted_additional', 'max_capacity', 'total_predicted', 
-                                    'budget_count', 'variance', 'is_holiday'])
+        return pd.DataFrame(columns=PREDICTION_COLUMNS)
     
     start_date = pd.to_datetime(start_date)
-    future_dates = [start_date + timedelta(days=i) for i in range(days_ahead)]
-    
-    holidays = {
-        '2025-01-01', # New Year's Day
-        '2025-05-26', # Memorial Day
-        '2025-07-04', # Independence Day
-        '2025-09-01', # Labor Day
-        '2025-11-27', # Thanksgiving Day
-        '2025-12-25', # Christmas Day
-    }
-    
-    predictions = []
-    for date in future_dates:
-        day_scheduled = scheduled_df[scheduled_df['date'] == date] if scheduled_df is not None else pd.DataFrame()
-        
-        dow = date.dayofweek
-        dow_factor = dow_effects.get(dow, 1.0) / max(dow_effects.values()) if dow_effects else 1.0
-        holiday = is_holiday(date, holidays)
-        is_weekend = dow in [5, 6]
-        
-        # Process scheduled combos first
-        scheduled_combos = set()
-        if not day_scheduled.empty:
-            for _, row in day_scheduled.iterrows():
-                location = row['location']
-                modality = row['modality']
-                scheduled_count = row['scheduled_count']
-                scheduled_combos.add((location, modality))
-                
-                try:
-                    loc_encoded = location_encoder.transform([location])[0]
-                    mod_encoded = modality_encoder.transform([modality])[0]
-                except ValueError:
-                    print(f"Warning: '{location}' or '{modality}' not in training data. Skipping.")
-                    continue
-                
-                features = pd.DataFrame([[
-                    date.dayofweek,
-                    date.month,
-                    date.dayofyear,
-                    loc_encoded,
-                    mod_encoded
-                ]], columns=feature_names)
-                
-                pred_additional_raw = max(0, int(round(model.predict(features)[0])))
-                pred_additional = int(pred_additional_raw * dow_factor)
-                
-                # Historical capacity
-                capacity_row = capacity_df[
-                    (capacity_df['location'] == location) & 
-                    (capacity_df['modality'] == modality)
-                ]
-                max_capacity = capacity_row['max_capacity'].iloc[0] if not capacity_row.empty else float('inf')
-                
-                # Budget (0 on weekends)
-                budget_count = None
-                if budget_df is not None and not is_weekend:
-                    budget_row = budget_df[
-                        (budget_df['location'] == location) & 
-                        (budget_df['modality'] == modality)
-                    ]
-                    budget_count = budget_row['budget_count'].iloc[0] if not budget_row.empty else None
-                else:
-                    budget_count = 0
-                
-                # Prediction logic
-                if scheduled_count == 0:
-                    total_predicted = 0
-                elif holiday:
-                    total_predicted = scheduled_count
-                else:
-                    total_unconstrained = scheduled_count + pred_additional
-                    if budget_count is not None:
-                        total_predicted = min(total_unconstrained, max_capacity, int(budget_count * 1.1))
-                    else:
-                        total_predicted = min(total_unconstrained, max_capacity)
-                
-                variance = total_predicted - budget_count if budget_count is not None else None
-                
-                predictions.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'location': location,
-                    'modality': modality,
-                    'scheduled_count': scheduled_count,
-                    'predicted_additional': pred_additional,
-                    'max_capacity': max_capacity if max_capacity != float('inf') else 'N/A',
-                    'total_predicted': total_predicted,
-                    'budget_count': budget_count if budget_count is not None else 'N/A',
-                    'variance': variance if variance is not None else 'N/A',
-                    'is_holiday': holiday
-                })
-        
-        # Process budgeted but unscheduled combos (only on weekdays, not holidays)
-        if budget_df is not None and not holiday and not is_weekend:
-            for _, budget_row in budget_df.iterrows():
-                location = budget_row['location']
-                modality = budget_row['modality']
-                if (location, modality) in scheduled_combos:
-                    continue
-                
-                try:
-                    loc_encoded = location_encoder.transform([location])[0]
-                    mod_encoded = modality_encoder.transform([modality])[0]
-                except ValueError:
-                    print(f"Warning: '{location}' or '{modality}' not in training data. Skipping.")
-                    continue
-                
-                features = pd.DataFrame([[
-                    date.dayofweek,
-                    date.month,
-                    date.dayofyear,
-                    loc_encoded,
-                    mod_encoded
-                ]], columns=feature_names)
-                
-                pred_additional_raw = max(0, int(round(model.predict(features)[0])))
-                pred_additional = int(pred_additional_raw * dow_factor)
-                
-                # Historical capacity
-                capacity_row = capacity_df[
-                    (capacity_df['location'] == location) & 
-                    (capacity_df['modality'] == modality)
-                ]
-                max_capacity = capacity_row['max_capacity'].iloc[0] if not capacity_row.empty else float('inf')
-                
-                budget_count = budget_row['budget_count']
-                
-                # Ensure some volume, capped at max_capacity and 10% above budget
-                total_unconstrained = max(1, pred_additional)
-                total_predicted = min(total_unconstrained, max_capacity, int(budget_count * 1.1))
-                
-                variance = total_predicted - budget_count
-                
-                predictions.append({
-                    'date': date.strftime('%Y-%m-%d'),
-                    'location': location,
-                    'modality': modality,
-                    'scheduled_count': 'N/A',
-                    'predicted_additional': pred_additional,
-                    'max_capacity': max_capacity if max_capacity != float('inf') else 'N/A',
-                    'total_predicted': total_predicted,
-                    'budget_count': budget_count,
-                    'variance': variance,
-                    'is_holiday': holiday
-                })
-    
-    return pd.DataFrame(predictions)
+    future_dates = pd.DatetimeIndex([start_date + timedelta(days=i) for i in range(days_ahead)])
+    
+    # -------------------------------------------------
+    # Candidate rows: scheduled combos, then budgeted-but-unscheduled
+    # -------------------------------------------------
+    blocks = []
+    scheduled = pd.DataFrame(columns=['date', 'location', 'modality'])
+    if scheduled_df is not None and not scheduled_df.empty:
+        in_horizon = scheduled_df['date'].isin(future_dates).to_numpy()
+        scheduled = scheduled_df.loc[in_horizon, ['date', 'location', 'modality', 'scheduled_count']].copy()
+        scheduled['_block'] = 0
+        scheduled['_order'] = np.flatnonzero(in_horizon)
+        blocks.append(scheduled)
+    
+    if budget_df is not None and not budget_df.empty:
+        dates = future_dates[
+            (future_dates.dayofweek < 5) & ~future_dates.strftime('%Y-%m-%d').isin(HOLIDAYS)
+        ]
+        budgeted = budget_df[['location', 'modality']].assign(_order=np.arange(len(budget_df)))
+        budgeted = pd.DataFrame({'date': dates}).merge(budgeted, how='cross')
+        # Skip combos already scheduled that day
+        taken = scheduled[['date', 'location', 'modality']].drop_duplicates().assign(_taken=True)
+        budgeted = budgeted.merge(taken, on=['date', 'location', 'modality'], how='left')
+        budgeted = budgeted[budgeted['_taken'].isna()].drop(columns='_taken')
+        budgeted['scheduled_count'] = np.nan
+        budgeted['_block'] = 1
+        blocks.append(budgeted)
+    
+    rows = pd.concat(blocks, ignore_index=True) if blocks else pd.DataFrame()
+    if rows.empty:
+        return pd.DataFrame()
+    
+    # -------------------------------------------------
+    # Encode; drop combos unseen in training
+    # -------------------------------------------------
+    rows['location_encoded'] = _encode(location_encoder, rows['location'])
+    rows['modality_encoded'] = _encode(modality_encoder, rows['modality'])
+    unknown = rows['location_encoded'].isna() | rows['modality_encoded'].isna()
+    for location, modality in rows.loc[unknown, ['location', 'modality']].drop_duplicates().itertuples(index=False):
+        print(f"Warning: '{location}' or '{modality}' not in training data. Skipping.")
+    rows = rows[~unknown].reset_index(drop=True)
+    if rows.empty:
+        return pd.DataFrame()
+    
+    dates = pd.DatetimeIndex(rows['date'])
+    dow = dates.dayofweek.to_numpy()
+    holiday = dates.strftime('%Y-%m-%d').isin(HOLIDAYS)
+    is_weekend = dow >= 5
+    from_budget = rows['_block'].to_numpy() == 1
+    
+    # -------------------------------------------------
+    # One predict call for the whole horizon
+    # -------------------------------------------------
+    features = pd.DataFrame(
+        np.column_stack([
+            dow,
+            dates.month,
+            dates.dayofyear,
+            rows['location_encoded'].astype(int),
+            rows['modality_encoded'].astype(int),
+        ]),
+        columns=feature_names,
+    )
+    pred_additional_raw = np.maximum(0, np.rint(model.predict(features)))
+    
+    if dow_effects:
+        dow_factors = np.array([dow_effects.get(d, 1.0) for d in range(7)]) / max(dow_effects.values())
+    else:
+        dow_factors = np.ones(7)
+    pred_additional = np.trunc(pred_additional_raw * dow_factors[dow]).astype(int)
+    
+    # -------------------------------------------------
+    # Capacity and budget via merges
+    # -------------------------------------------------
+    keys = ['location', 'modality']
+    rows = rows.merge(_first_match(capacity_df, keys, 'max_capacity'), on=keys, how='left')
+    max_capacity = rows['max_capacity'].fillna(np.inf).to_numpy(dtype=float)
+    
+    if budget_df is not None:
+        rows = rows.merge(_first_match(budget_df, keys, 'budget_count'), on=keys, how='left')
+        budget = rows['budget_count'].to_numpy(dtype=float)
+    else:
+        budget = np.full(len(rows), np.nan)
+    
+    # Scheduled rows: budget is 0 on weekends (and when no budget file)
+    budget = np.where(~from_budget & (is_weekend | (budget_df is None)), 0.0, budget)
+    has_budget = ~np.isnan(budget)
+    budget_cap = np.trunc(np.nan_to_num(budget) * 1.1)
+    
+    # -------------------------------------------------
+    # Caps and holiday / weekend rules
+    # -------------------------------------------------
+    scheduled_count = rows['scheduled_count'].to_numpy(dtype=float)
+    
+    capped = np.minimum(scheduled_count + pred_additional, max_capacity)
+    sched_total = np.where(has_budget, np.minimum(capped, budget_cap), capped)
+    sched_total = np.where(holiday, scheduled_count, sched_total)
+    sched_total = np.where(scheduled_count == 0, 0, sched_total)
+    
+    # Budgeted-but-unscheduled: ensure some volume, capped at capacity and 10% above budget
+    budget_total = np.minimum(np.minimum(np.maximum(1, pred_additional), max_capacity), budget_cap)
+    
+    total_predicted = np.where(from_budget, budget_total, sched_total)
+    if np.all(np.mod(total_predicted, 1) == 0):
+        total_predicted = total_predicted.astype(int)
+    variance = total_predicted - np.nan_to_num(budget)
+    
+    # Present values keep the dtype of the frames they came from
+    sched_dtype = scheduled_df['scheduled_count'].dtype if scheduled_df is not None else None
+    budget_dtype = budget_df['budget_count'].dtype if budget_df is not None else int
+    variance_dtype = np.result_type(total_predicted.dtype, budget_dtype)
+    
+    predictions = pd.DataFrame({
+        'date': dates.strftime('%Y-%m-%d'),
+        'location': rows['location'],
+        'modality': rows['modality'],
+        'scheduled_count': _with_na(rows['scheduled_count'], ~from_budget, sched_dtype),
+        'predicted_additional': pred_additional,
+        'max_capacity': _with_na(rows['max_capacity'], np.isfinite(max_capacity), capacity_df['max_capacity'].dtype),
+        'total_predicted': total_predicted,
+        'budget_count': _with_na(budget, has_budget, budget_dtype),
+        'variance': _with_na(variance, has_budget, variance_dtype),
+        'is_holiday': holiday,
+        '_date': dates,
+        '_block': rows['_block'],
+        '_order': rows['_order'],
+    })
+    
+    # Same row order as the per-day loop: date, scheduled first, input order
+    predictions = predictions.sort_values(['_date', '_block', '_order'], kind='stable')
+    return predictions[PREDICTION_COLUMNS].reset_index(drop=True)
 
 def print_daily_summary(predictions):
     """Print a summary of total scheduled, predicted, budget, and variance per day"""
@@ -311,11 +358,15 @@ if __name__ == "__main__":
             historical_csv, scheduled_csv, budget_csv
         )
         
+        # Fitted models are reused until the training data changes or they age out
+        registry = ModelRegistry(max_age_days=7)
+        training_cols = ['day_of_week', 'month', 'day_of_year', 'location_encoded', 'modality_encoded', 'exam_count']
+        
         # Evaluate Linear Regression
-        linear_model, feature_names = train_and_evaluate_model(hist_df, model_type='linear')
+        linear_model, feature_names = train_with_registry(registry, 'linear', hist_df[training_cols])
         
         # Evaluate Random Forest (optional comparison)
-        rf_model, _ = train_and_evaluate_model(hist_df, model_type='random_forest')
+        rf_model, _ = train_with_registry(registry, 'random_forest', hist_df[training_cols])
         
         # Use Linear Regression for predictions (can switch to rf_model if preferred)
         model = linear_model
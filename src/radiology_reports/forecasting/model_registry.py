@@ -0,0 +1,129 @@
+# src/radiology_reports/forecasting/model_registry.py
+"""
+On-disk registry of fitted per-(location, modality) models.
+
+Entries are keyed by (location, modality, model type, hyperparameters,
+hash of the training slice). A combo is retrained only when its data or
+parameters changed, or when the stored model is older than max_age_days;
+otherwise the pickled model (sklearn, Prophet, SARIMA — anything that
+pickles) is loaded from disk.
+
+Layout: <root>/<model_type>/<location>__<modality>__<digest>.pkl
+Older entries for the same combo are removed when a new one is stored.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROOT = Path("model_registry")
+
+
+def _safe(name) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", str(name))
+
+
+def slice_digest(data: pd.DataFrame, params: Optional[dict] = None) -> str:
+    """
+    Stable hash of a training slice (values, column names/order) plus
+    hyperparameters. Index is ignored, so re-sliced frames hash the same.
+    """
+    h = hashlib.sha256()
+    h.update(json.dumps(params or {}, sort_keys=True, default=str).encode())
+    h.update(json.dumps([str(c) for c in data.columns]).encode())
+    h.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:20]
+
+
+class ModelRegistry:
+    """
+    max_age_days: models trained longer ago than this are stale (None = never).
+    """
+
+    def __init__(self, root=DEFAULT_ROOT, max_age_days: Optional[float] = None):
+        self.root = Path(root)
+        self.max_age_days = max_age_days
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------------------------------
+    # PATHS
+    # -------------------------------------------------
+    def _prefix(self, location, modality) -> str:
+        return f"{_safe(location)}__{_safe(modality)}__"
+
+    def path(self, location, modality, model_type, digest) -> Path:
+        return self.root / _safe(model_type) / f"{self._prefix(location, modality)}{digest}.pkl"
+
+    # -------------------------------------------------
+    # LOOKUP / STORE
+    # -------------------------------------------------
+    def get(self, location, modality, model_type, params, data: pd.DataFrame):
+        """Cached model for this slice, or None if missing or stale."""
+        path = self.path(location, modality, model_type, slice_digest(data, params))
+        if not path.exists():
+            self.misses += 1
+            return None
+
+        try:
+            with path.open("rb") as fh:
+                entry = pickle.load(fh)
+        except Exception as e:
+            logger.warning(f"Unreadable registry entry {path.name}: {e}")
+            self.misses += 1
+            return None
+
+        if self.max_age_days is not None:
+            if datetime.now() - entry["trained_at"] > timedelta(days=self.max_age_days):
+                self.misses += 1
+                return None
+
+        self.hits += 1
+        return entry["model"]
+
+    def put(self, location, modality, model_type, params, data: pd.DataFrame, model) -> Path:
+        """Store model for this slice (atomic write) and drop older entries for the combo."""
+        path = self.path(location, modality, model_type, slice_digest(data, params))
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        entry = {
+            "model": model,
+            "trained_at": datetime.now(),
+            "location": location,
+            "modality": modality,
+            "model_type": model_type,
+            "params": params,
+            "rows": len(data),
+        }
+        fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as fh:
+            pickle.dump(entry, fh, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+
+        for old in path.parent.glob(f"{self._prefix(location, modality)}*.pkl"):
+            if old != path:
+                old.unlink(missing_ok=True)
+        return path
+
+    def get_or_train(self, location, modality, model_type, params, data: pd.DataFrame,
+                     train: Callable[[pd.DataFrame], object]):
+        """Load the cached model, or train(data), store and return it."""
+        model = self.get(location, modality, model_type, params, data)
+        if model is None:
+            model = train(data)
+            if model is not None:
+                self.put(location, modality, model_type, params, data, model)
+        return model
@@ -0,0 +1,264 @@
+# src/radiology_reports/forecasting/pickup_curve.py
+"""
+Schedule pickup curves: how much of a DOS's final volume is already on the
+schedule N days out (the "days out" analysis in docs/forecast_notes.txt).
+
+For every SCHEDULED snapshot of a finished DOS we know
+    days_out = dos − inserted, scheduled = snapshot volume,
+    final    = completed DAILY units for the DOS.
+Curves are pooled sums held as dense arrays of shape
+    (days_out, weekday, location, modality)
+so the fill ratio is sum(scheduled) / sum(final) per cell. Sums make
+updates incremental: each DOS is folded in once, SETTLE_DAYS after it
+(so late-loaded DAILY completions have landed), and only the new DOS are
+queried on later runs (state is saved as .npz).
+
+Nowcast: final ≈ latest scheduled / fill ratio for its (days_out, weekday,
+location, modality). Sparse cells fall back to the network-wide curve
+for that days_out and weekday.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, timedelta
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE = Path("output") / "pickup_curves.npz"
+MAX_DAYS_OUT = 30
+# A DOS is folded in only this many days after it: DAILY for yesterday is
+# often not fully loaded, and folded DOS are never revised.
+SETTLE_DAYS = 3
+
+
+class PickupCurves:
+    """
+    sched / final / n: (MAX_DAYS_OUT + 1, 7, locations, modalities)
+    through: last DOS folded into the curves
+    """
+
+    def __init__(self, max_days_out: int = MAX_DAYS_OUT):
+        self.max_days_out = max_days_out
+        self.locations: List[str] = []
+        self.modalities: List[str] = []
+        shape = (max_days_out + 1, 7, 0, 0)
+        self.sched = np.zeros(shape)
+        self.final = np.zeros(shape)
+        self.n = np.zeros(shape, dtype=np.int64)
+        self.through: Optional[date] = None
+
+    # -------------------------------------------------
+    # KEYS
+    # -------------------------------------------------
+    def _codes(self, values: pd.Series, names: List[str], axis: int) -> np.ndarray:
+        """Map labels to indices, growing the arrays for unseen labels (no NULLs)."""
+        new = sorted(set(values.unique()) - set(names))
+        if new:
+            names.extend(new)
+            pad = [(0, 0)] * 4
+            pad[axis] = (0, len(new))
+            self.sched = np.pad(self.sched, pad)
+            self.final = np.pad(self.final, pad)
+            self.n = np.pad(self.n, pad)
+        lookup = {name: i for i, name in enumerate(names)}
+        return values.map(lookup).to_numpy()
+
+    # -------------------------------------------------
+    # INCREMENTAL UPDATE
+    # -------------------------------------------------
+    def add(self, snapshots: pd.DataFrame, completed: pd.DataFrame) -> int:
+        """
+        Fold finished DOS into the curves.
+        snapshots: dos, location, modality, inserted, volume
+        completed: dos, location, modality, units (missing = 0 done)
+        Returns the number of observations added.
+        """
+        if snapshots.empty:
+            return 0
+
+        keyed = snapshots[["location", "modality"]].notna().all(axis=1)
+        if not keyed.all():
+            logger.warning(f"Pickup curves: {int((~keyed).sum())} snapshot rows with no location/modality skipped")
+            snapshots = snapshots[keyed]
+
+        final = completed.groupby(["dos", "location", "modality"], as_index=False)["units"].sum()
+        obs = snapshots.merge(final, on=["dos", "location", "modality"], how="left")
+        obs["units"] = obs["units"].fillna(0.0)
+
+        dos = pd.to_datetime(obs["dos"])
+        days_out = (dos - pd.to_datetime(obs["inserted"])).dt.days.to_numpy()
+        keep = (days_out >= 0) & (days_out <= self.max_days_out)
+        obs = obs[keep]
+        if obs.empty:
+            return 0
+
+        loc = self._codes(obs["location"], self.locations, axis=2)
+        mod = self._codes(obs["modality"], self.modalities, axis=3)
+        idx = (days_out[keep], dos[keep].dt.weekday.to_numpy(), loc, mod)
+
+        np.add.at(self.sched, idx, obs["volume"].to_numpy(dtype=float))
+        np.add.at(self.final, idx, obs["units"].to_numpy(dtype=float))
+        np.add.at(self.n, idx, 1)
+
+        last = max(obs["dos"])
+        self.through = last if self.through is None else max(self.through, last)
+        return len(obs)
+
+    # -------------------------------------------------
+    # CURVES
+    # -------------------------------------------------
+    def fill_ratio(self, min_obs: int = 3) -> np.ndarray:
+        """
+        sum(scheduled) / sum(final) per cell; cells with fewer than min_obs
+        observations use the network curve for the same days_out/weekday.
+        NaN where neither has data.
+        """
+        with np.errstate(divide="ignore", invalid="ignore"):
+            cell = np.where(self.final > 0, self.sched / self.final, np.nan)
+            net_sched = self.sched.sum(axis=(2, 3), keepdims=True)
+            net_final = self.final.sum(axis=(2, 3), keepdims=True)
+            network = np.where(net_final > 0, net_sched / net_final, np.nan)
+        return np.where((self.n >= min_obs) & np.isfinite(cell) & (cell > 0), cell,
+                        np.broadcast_to(network, cell.shape))
+
+    def curve_frame(self, min_obs: int = 3) -> pd.DataFrame:
+        """Long curves: days_out, weekday, location, modality, fill_ratio, observations."""
+        ratio = self.fill_ratio(min_obs)
+        d, w, l, m = np.indices(ratio.shape).reshape(4, -1)
+        frame = pd.DataFrame({
+            "days_out": d,
+            "weekday": w,
+            "location": np.asarray(self.locations, dtype=object)[l] if self.locations else [],
+            "modality": np.asarray(self.modalities, dtype=object)[m] if self.modalities else [],
+            "fill_ratio": ratio.ravel(),
+            "observations": self.n.ravel(),
+        })
+        return frame[frame["observations"] > 0].reset_index(drop=True)
+
+    # -------------------------------------------------
+    # NOWCAST
+    # -------------------------------------------------
+    def nowcast(self, snapshots: pd.DataFrame, as_of: Optional[date] = None, min_obs: int = 3) -> pd.DataFrame:
+        """
+        Final-volume nowcast per (dos, location, modality) from the latest
+        snapshot inserted on or before as_of (default: latest available).
+        """
+        snaps = snapshots
+        if as_of is not None:
+            snaps = snaps[snaps["inserted"] <= as_of]
+        latest = (
+            snaps.sort_values("inserted")
+            .groupby(["dos", "location", "modality"], as_index=False)
+            .last()
+        )
+        if latest.empty:
+            return latest.assign(days_out=[], fill_ratio=[], nowcast=[])
+
+        dos = pd.to_datetime(latest["dos"])
+        days_out = np.clip((dos - pd.to_datetime(latest["inserted"])).dt.days.to_numpy(), 0, self.max_days_out)
+        weekday = dos.dt.weekday.to_numpy()
+
+        loc_lookup = {name: i for i, name in enumerate(self.locations)}
+        mod_lookup = {name: i for i, name in enumerate(self.modalities)}
+        loc = latest["location"].map(loc_lookup).to_numpy(dtype=float)
+        mod = latest["modality"].map(mod_lookup).to_numpy(dtype=float)
+        known = ~np.isnan(loc) & ~np.isnan(mod)
+
+        ratio = self.fill_ratio(min_obs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            net = self.sched.sum(axis=(2, 3)) / self.final.sum(axis=(2, 3))
+        fill = net[days_out, weekday]  # unseen location/modality: network curve
+        if known.any():
+            fill[known] = ratio[days_out[known], weekday[known],
+                                loc[known].astype(int), mod[known].astype(int)]
+        fill = np.where(np.isfinite(fill) & (fill > 0), fill, 1.0)
+
+        volume = latest["volume"].to_numpy(dtype=float)
+        return latest.assign(days_out=days_out, fill_ratio=fill, nowcast=volume / fill)
+
+    # -------------------------------------------------
+    # PERSISTENCE
+    # -------------------------------------------------
+    def save(self, path=DEFAULT_STATE) -> None:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        np.savez_compressed(
+            path,
+            sched=self.sched,
+            final=self.final,
+            n=self.n,
+            locations=np.asarray(self.locations, dtype=str),
+            modalities=np.asarray(self.modalities, dtype=str),
+            through=np.asarray(self.through.isoformat() if self.through else ""),
+            max_days_out=np.asarray(self.max_days_out),
+        )
+
+    @classmethod
+    def load(cls, path=DEFAULT_STATE) -> "PickupCurves":
+        with np.load(path, allow_pickle=False) as data:
+            curves = cls(int(data["max_days_out"]))
+            curves.sched = data["sched"]
+            curves.final = data["final"]
+            curves.n = data["n"]
+            curves.locations = [str(x) for x in data["locations"]]
+            curves.modalities = [str(x) for x in data["modalities"]]
+            through = str(data["through"])
+        curves.through = date.fromisoformat(through) if through else None
+        return curves
+
+
+def update_curves(
+    curves: PickupCurves,
+    through: Optional[date] = None,
+    history_days: int = 365,
+    settle_days: int = SETTLE_DAYS,
+) -> PickupCurves:
+    """
+    Fold every settled DOS after curves.through (or the last history_days
+    on a fresh build) up to `through` into the curves, with one snapshot
+    query and one completions query. `through` is capped (and defaults) to
+    settle_days before yesterday, so DOS whose completions may still be
+    loading are left for a later run.
+    """
+    from radiology_reports.data.workload import get_completed_units_for_pickup, get_scheduled_history
+
+    settled = date.today() - timedelta(days=1 + settle_days)
+    through = min(through, settled) if through else settled
+    start = curves.through + timedelta(days=1) if curves.through else through - timedelta(days=history_days)
+    if start > through:
+        return curves
+
+    added = curves.add(get_scheduled_history(start, through), get_completed_units_for_pickup(start, through))
+    curves.through = max(curves.through or through, through)
+    logger.info(f"Pickup curves: {added} observations added for DOS {start} to {through}")
+    return curves
+
+
+def load_or_build(
+    path=DEFAULT_STATE,
+    through: Optional[date] = None,
+    history_days: int = 365,
+    settle_days: int = SETTLE_DAYS,
+) -> PickupCurves:
+    """Saved curves brought up to date (built from scratch if none saved)."""
+    path = Path(path)
+    curves = PickupCurves.load(path) if path.exists() else PickupCurves()
+    update_curves(curves, through=through, history_days=history_days, settle_days=settle_days)
+    curves.save(path)
+    return curves
+
+
+def nowcast_upcoming(curves: PickupCurves, days: int = 10, start: Optional[date] = None,
+                     min_obs: int = 3) -> pd.DataFrame:
+    """Nowcast final volume for DOS start .. start + days − 1 (default from today)."""
+    from radiology_reports.data.workload import get_scheduled_history
+
+    start = start or date.today()
+    snapshots = get_scheduled_history(start, start + timedelta(days=days - 1))
+    return curves.nowcast(snapshots, min_obs=min_obs)
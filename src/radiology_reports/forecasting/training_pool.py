@@ -0,0 +1,106 @@
+# src/radiology_reports/forecasting/training_pool.py
+"""
+Per-(location, modality) model training across a process pool.
+
+The experiment scripts used to build combos = [(hist_ts, loc, mod), ...]
+and pool.map them, so the full history frame was pickled to a worker for
+every combo and each worker filtered it again. Here history is split by
+combo once, each task ships only its own slice, and tasks are dispatched
+longest series first so the slowest fits start early and the pool does
+not idle on one straggler at the end.
+
+Train functions keep the legacy signature, train_fn((ts_data, loc, mod))
+-> ((loc, mod), result); they simply receive a frame holding one combo.
+
+With a ModelRegistry, combos whose slice and parameters are unchanged
+(and whose model is within the age policy) are loaded from disk and only
+the rest are sent to the pool.
+"""
+
+from __future__ import annotations
+
+import logging
+from multiprocessing import Pool, cpu_count
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+Combo = Tuple[str, str]
+TrainFn = Callable[[tuple], tuple]
+
+
+def split_by_combo(
+    ts: pd.DataFrame,
+    keys: Sequence[str] = ("location", "modality"),
+    min_rows: int = 0,
+) -> List[Tuple[Combo, pd.DataFrame]]:
+    """
+    One (combo, slice) per key group, longest slice first (ties by combo).
+    Groups with fewer than min_rows rows are dropped.
+    """
+    slices = [
+        (combo, group.reset_index(drop=True))
+        for combo, group in ts.groupby(list(keys), sort=True)
+        if len(group) >= min_rows
+    ]
+    slices.sort(key=lambda item: -len(item[1]))
+    return slices
+
+
+def train_by_combo(
+    train_fn: TrainFn,
+    ts: pd.DataFrame,
+    processes: Optional[int] = None,
+    min_rows: int = 0,
+    keys: Sequence[str] = ("location", "modality"),
+    registry=None,
+    model_type: Optional[str] = None,
+    params: Optional[dict] = None,
+) -> Dict[Combo, object]:
+    """
+    Run train_fn for every combo in ts and return {combo: result} in
+    combo order. processes=1 trains in-process (no pool, easier to debug).
+
+    registry: optional ModelRegistry; model_type defaults to train_fn's name.
+    Results shaped (None, ...) — the scripts' "fit failed" value — are not cached.
+    """
+    slices = split_by_combo(ts, keys=keys, min_rows=min_rows)
+    model_type = model_type or train_fn.__name__
+
+    results = []
+    if registry is not None:
+        pending = []
+        for combo, group in slices:
+            cached = registry.get(*combo, model_type, params, group)
+            if cached is None:
+                pending.append((combo, group))
+            else:
+                results.append((combo, cached))
+        logger.info(f"Model registry: {len(results)} cached, {len(pending)} to train.")
+        slices = pending
+
+    tasks = [(group, *combo) for combo, group in slices]
+    processes = min(processes or cpu_count(), max(len(tasks), 1))
+
+    logger.info(f"Training {len(tasks)} combos using {processes} processes...")
+
+    if processes == 1:
+        trained = [train_fn(task) for task in tasks]
+    else:
+        # chunksize=1 keeps the longest-first dispatch order
+        with Pool(processes=processes) as pool:
+            trained = list(pool.imap_unordered(train_fn, tasks, chunksize=1))
+
+    if registry is not None:
+        groups = dict(slices)
+        for combo, result in trained:
+            if _fitted(result):
+                registry.put(*combo, model_type, params, groups[tuple(combo)], result)
+
+    return dict(sorted(results + trained, key=lambda item: item[0]))
+
+
+def _fitted(result) -> bool:
+    return result is not None and not (isinstance(result, tuple) and result and result[0] is None)
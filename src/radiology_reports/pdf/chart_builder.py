@@ -6,7 +6,6 @@ Chart Builder — Creates monthly volume bar chart
 from __future__ import annotations
 
 from pathlib import Path
-import matplotlib.pyplot as plt
 
 from radiology_reports.pdf.styles import REPORT_TITLE
 
@@ -23,6 +22,8 @@ def build_monthly_chart(chart_data: Dict[str, Any]) -> Path | None:
     if this_daily.empty and last_daily.empty:
         return None
 
+    import matplotlib.pyplot as plt  # deferred: only needed when a chart is drawn
+
     plt.figure(figsize=(11, 5))
     days = range(1, 32)
     this_vals = [this_daily.get(d, 0) for d in days]
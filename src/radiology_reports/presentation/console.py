@@ -17,10 +17,23 @@ def render_daily_capacity(
 ) -> str:
     """
     Render the Daily Capacity Utilization Report to console.
+    """
+    report_text = format_daily_capacity(result, audience)
+    print(report_text, end="")
+
+    return report_text
+
+
+def format_daily_capacity(
+    result: DailyCapacityResult,
+    audience: str = "scheduling",
+) -> str:
+    """
+    Daily Capacity Utilization Report text (not printed).
 
     CRITICAL:
-    - Output format MUST remain stable for scheduling
-    - Email renderer parses this text verbatim
+    - Output format MUST remain stable for scheduling (golden outputs)
+    - The scheduling email embeds this text verbatim
     - audience controls depth ONLY
     """
 
@@ -204,7 +217,4 @@ def render_daily_capacity(
 
     out.write("=" * 70 + "\n")
 
-    report_text = out.getvalue()
-    print(report_text, end="")
-
-    return report_text
+    return out.getvalue()
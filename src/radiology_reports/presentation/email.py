@@ -1,26 +1,145 @@
-import smtplib
+from concurrent.futures import Future
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
+from radiology_reports.capacity_reporting.capacity_models import DailyCapacityResult
+from radiology_reports.presentation.console import format_daily_capacity
 from radiology_reports.utils.config import config
 from radiology_reports.utils.logger import get_logger
+from radiology_reports.utils.mail_queue import SmtpSettings, deliver
+from radiology_reports.utils.tracing import span
 
 log = get_logger(__name__)
 
 
-def send_executive_capacity_email(
+# ==================================================
+# Template (compiled once per process)
+# ==================================================
+_STATUS_COLORS = (
+    ("OVER CAPACITY", "#e74c3c"),
+    ("AT CAPACITY", "#27ae60"),
+    ("UNDER CAPACITY (GAP)", "#3498db"),
+    ("UNDER (GAP)", "#3498db"),
+)
+
+_EXECUTIVE_EMAIL_TEMPLATE = """
+    <html>
+    <body style="font-family: Calibri, Arial, sans-serif; line-height:1.6; color:#333;">
+      <h2 style="color:#2c3e50;">Daily Radiology Capacity Report</h2>
+      <p><strong>DOS ({{ dos }}) forecast:</strong></br>
+      <strong>Schedule Snapshot As Of:</strong> {{ snapshot_date }}</p>
+
+      <div style="background:#f8f9fa;padding:15px;border-left:6px solid #3498db;margin:20px 0;">
+        <p><strong>Network Utilization:</strong>
+           <span style="font-size:1.2em;">{{ utilization }}</span>
+        </p>
+        <p><strong>Status:</strong>
+          <span style="color:#e74c3c;"><strong>{{ over_count }} sites OVER CAPACITY</strong></span> •
+          <span style="color:#27ae60;">AT CAPACITY</span> •
+          <span style="color:#3498db;">UNDER</span>
+        </p>
+      </div>
+    {% if audience == "scheduling" %}
+        <p style="color:#7f8c8d;font-size:90%;">
+          <em>Full location and modality tables below for reference.</em>
+        </p>
+
+        <pre style="background:#f5f5f5;padding:15px;border:1px solid #eee;
+                    font-size:10pt;font-family:Consolas;line-height:1.3;">
+{{ report_text | status_colors }}
+        </pre>
+        {% else %}
+        <div style="background:#fff3cd;padding:15px;border-left:6px solid #f39c12;margin:20px 0;">
+          <p><strong>Execution Summary (Prior Day)</strong></p>
+          <p>Scheduled Weighted: {{ scheduled_weighted }}</p>
+          <p>Completed Weighted: {{ completed_weighted }}</p>
+          <p>Execution Delta: {{ execution_delta }}</p>
+          <p style="color:#7f8c8d;font-size:90%;">
+            Scheduling operated within capacity targets; variance reflects same-day operational factors.
+          </p>
+        </div>
+        {% endif %}
+      <hr style="border:0;border-top:1px solid #eee;margin:40px 0;">
+      <p style="color:#95a5a6;font-size:85%;">
+        Automated • Radiology Operations
+      </p>
+    </body>
+    </html>
+    """
+
+
+def _status_colors(text: str) -> str:
+    for status, color in _STATUS_COLORS:
+        text = text.replace(
+            status, f'<span style="color:{color};font-weight:bold;">{status}</span>'
+        )
+    return text
+
+
+@lru_cache(maxsize=None)
+def _executive_email_template():
+    # jinja2 is imported on first use; the text-only CLIs never pay for it
+    from jinja2 import Environment
+
+    env = Environment(autoescape=False, keep_trailing_newline=True)
+    env.filters["status_colors"] = _status_colors
+    return env.from_string(_EXECUTIVE_EMAIL_TEMPLATE)
+
+
+def _render(audience: str, **context) -> Tuple[str, str]:
+    subject = f"Capacity Alert – {context['over_count']} Sites Over ({context['utilization']})"
+    html = _executive_email_template().render(audience=audience, **context)
+    return subject, html
+
+
+# ==================================================
+# Renderers
+# ==================================================
+def render_executive_capacity_email(
+    result: DailyCapacityResult,
+    audience: str = "scheduling",
+    report_text: Optional[str] = None,
+) -> Tuple[str, str]:
+    """
+    Executive HTML capacity email (subject, html) straight from the result.
+
+    The scheduling audience embeds the console report; pass report_text
+    when it was already rendered, otherwise it is formatted here (not
+    printed). The ops audience needs no console text at all.
+    """
+    s = result.summary
+    if audience == "scheduling" and report_text is None:
+        report_text = format_daily_capacity(result)
+
+    completed = s.network_completed_weighted is not None
+    return _render(
+        audience,
+        dos=s.start_date,
+        snapshot_date=result.snapshot_date or "Unknown",
+        utilization=f"{s.network_utilization_pct}%",
+        over_count=s.sites_over,
+        scheduled_weighted=f"{s.network_scheduled_weighted:.2f}",
+        completed_weighted=f"{s.network_completed_weighted:.2f}" if completed else "N/A",
+        execution_delta=(
+            f"{s.execution_delta_weighted:+.2f} weighted ({s.execution_delta_pct_points:+.1f} pts)"
+            if completed
+            else "N/A"
+        ),
+        report_text=report_text or "",
+    )
+
+
+def build_executive_capacity_email(
     report_text: str,
-    recipients: List[str],
     audience: str = "scheduling",
-) -> None:
+) -> Tuple[str, str]:
     """
-    Legacy-accurate executive HTML capacity email.
+    Legacy executive HTML capacity email from console text: (subject, html).
 
-    IMPORTANT:
-    - report_text MUST be the full console output
-    - This function intentionally parses text (legacy behavior)
-    - audience controls content depth ONLY
+    Kept for callers that only have the console output; prefer
+    render_executive_capacity_email(result). Parses text (legacy behavior).
     """
 
     lines = report_text.splitlines()
@@ -65,92 +184,31 @@ def send_executive_capacity_email(
     except Exception as e:
         log.warning(f"Failed to parse metrics for email subject/body: {e}")
 
-    subject = f"Capacity Alert – {over_count} Sites Over ({utilization})"
-
-    # --------------------------------------------------
-    # Apply color replacements to FULL report text
-    # --------------------------------------------------
-    colored_report = (
-        report_text
-        .replace(
-            "OVER CAPACITY",
-            '<span style="color:#e74c3c;font-weight:bold;">OVER CAPACITY</span>',
-        )
-        .replace(
-            "AT CAPACITY",
-            '<span style="color:#27ae60;font-weight:bold;">AT CAPACITY</span>',
-        )
-        .replace(
-            "UNDER CAPACITY (GAP)",
-            '<span style="color:#3498db;font-weight:bold;">UNDER CAPACITY (GAP)</span>',
-        )
-        .replace(
-            "UNDER (GAP)",
-            '<span style="color:#3498db;font-weight:bold;">UNDER (GAP)</span>',
-        )
+    return _render(
+        audience,
+        dos=dos,
+        snapshot_date=snapshot_date,
+        utilization=utilization,
+        over_count=over_count,
+        scheduled_weighted=scheduled_weighted,
+        completed_weighted=completed_weighted,
+        execution_delta=execution_delta,
+        report_text=report_text,
     )
 
-    # --------------------------------------------------
-    # Build HTML email
-    # --------------------------------------------------
-    html = f"""
-    <html>
-    <body style="font-family: Calibri, Arial, sans-serif; line-height:1.6; color:#333;">
-      <h2 style="color:#2c3e50;">Daily Radiology Capacity Report</h2>
-      <p><strong>DOS ({dos}) forecast:</strong></br>
-      <strong>Schedule Snapshot As Of:</strong> {snapshot_date}</p>
 
-      <div style="background:#f8f9fa;padding:15px;border-left:6px solid #3498db;margin:20px 0;">
-        <p><strong>Network Utilization:</strong>
-           <span style="font-size:1.2em;">{utilization}</span>
-        </p>
-        <p><strong>Status:</strong>
-          <span style="color:#e74c3c;"><strong>{over_count} sites OVER CAPACITY</strong></span> •
-          <span style="color:#27ae60;">AT CAPACITY</span> •
-          <span style="color:#3498db;">UNDER</span>
-        </p>
-      </div>
+def send_executive_capacity_email(
+    result: DailyCapacityResult,
+    recipients: List[str],
+    audience: str = "scheduling",
+    report_text: Optional[str] = None,
+) -> Future:
     """
-
-    # ==================================================
-    # Scheduling audience — ORIGINAL BEHAVIOR (UNCHANGED)
-    # ==================================================
-    if audience == "scheduling":
-        html += f"""
-        <p style="color:#7f8c8d;font-size:90%;">
-          <em>Full location and modality tables below for reference.</em>
-        </p>
-
-        <pre style="background:#f5f5f5;padding:15px;border:1px solid #eee;
-                    font-size:10pt;font-family:Consolas;line-height:1.3;">
-{colored_report}
-        </pre>
-        """
-
-    # ==================================================
-    # Ops audience — DOWNSIZED + EXECUTION SUMMARY
-    # ==================================================
-    else:
-        html += f"""
-        <div style="background:#fff3cd;padding:15px;border-left:6px solid #f39c12;margin:20px 0;">
-          <p><strong>Execution Summary (Prior Day)</strong></p>
-          <p>Scheduled Weighted: {scheduled_weighted}</p>
-          <p>Completed Weighted: {completed_weighted}</p>
-          <p>Execution Delta: {execution_delta}</p>
-          <p style="color:#7f8c8d;font-size:90%;">
-            Scheduling operated within capacity targets; variance reflects same-day operational factors.
-          </p>
-        </div>
-        """
-
-    html += """
-      <hr style="border:0;border-top:1px solid #eee;margin:40px 0;">
-      <p style="color:#95a5a6;font-size:85%;">
-        Automated • Radiology Operations
-      </p>
-    </body>
-    </html>
+    Send the executive HTML capacity email rendered from the result.
+    Delivery is queued (utils/mail_queue.py); returns the delivery Future.
     """
+    with span("render.email_html"):
+        subject, html = render_executive_capacity_email(result, audience, report_text)
 
     msg = MIMEMultipart("alternative")
     msg["From"] = config.SENDER_EMAIL
@@ -158,13 +216,13 @@ def send_executive_capacity_email(
     msg["Subject"] = subject
     msg.attach(MIMEText(html, "html"))
 
-    try:
-        with smtplib.SMTP(config.SMTP_SERVER, config.SMTP_PORT) as server:
-            server.sendmail(config.SENDER_EMAIL, recipients, msg.as_string())
-        log.info(
-            f"Executive capacity report sent to: {', '.join(recipients)} "
-            f"(audience={audience})"
-        )
-    except Exception:
-        log.error("Failed to send executive capacity email", exc_info=True)
-        raise
+    future = deliver(
+        SmtpSettings(config.SMTP_SERVER, config.SMTP_PORT, config.SENDER_EMAIL),
+        msg,
+        recipients,
+    )
+    log.info(
+        f"Executive capacity report queued for: {', '.join(recipients)} "
+        f"(audience={audience})"
+    )
+    return future
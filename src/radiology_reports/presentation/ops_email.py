@@ -1,5 +1,7 @@
 # src/radiology_reports/presentation/ops_email.py
 
+from concurrent.futures import Future
+
 from radiology_reports.utils.config import config
 from radiology_reports.utils.email_sender import send_email
 
@@ -10,7 +12,7 @@ OPS_EMAIL_SUBJECT = "Daily Radiology Capacity – OPS (Execution)"
 def send_ops_capacity_email(
     report_text: str,
     recipients: list[str],
-) -> None:
+) -> Future:
     """
     Send OPS Daily Radiology Capacity Execution email.
     Plain text for v1. HTML styling intentionally deferred.
@@ -18,7 +20,7 @@ def send_ops_capacity_email(
     if not recipients:
         raise ValueError("OPS_RECIPIENTS is empty; cannot send OPS email")
 
-    send_email(
+    return send_email(
         subject=OPS_EMAIL_SUBJECT,
         body=report_text,
         recipients=recipients,
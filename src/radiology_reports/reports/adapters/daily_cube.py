@@ -0,0 +1,172 @@
+# src/radiology_reports/reports/adapters/daily_cube.py
+"""
+Cumulative location × modality × day cube of DAILY units.
+
+cum[l, m, d] = units for (location l, modality m) from cube start through
+day d. Any period total is then a prefix-sum difference:
+
+    total(first, last) = cum[last] - cum[first - 1]
+
+so MTD for any day is a lookup, and the next day's DAILY rows are appended
+in place (one new column) instead of re-summing the month.
+
+Pure computation:
+- No SQL
+- No ReportLab
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, List
+
+import numpy as np
+import pandas as pd
+
+
+UNIT_KEYS = ["LocationName", "ProcedureCategory"]
+
+# Prefix-sum differences of float units are rounded before adapters int() them
+_ROUND_DECIMALS = 6
+
+
+class DailyUnitsCube:
+    """
+    Growable prefix-sum cube.
+
+    Two parallel cumulative arrays are kept:
+    - units: SUM(Unit)
+    - rows:  number of source rows (so a cell with SUM(Unit) = 0 is still
+             reported, exactly like the per-day SQL result)
+    """
+
+    def __init__(self, start: date):
+        self.start = start
+        self.locations: List[str] = []
+        self.modalities: List[str] = []
+        self._loc_idx: Dict[str, int] = {}
+        self._mod_idx: Dict[str, int] = {}
+
+        self._days = 0
+        self._units = np.zeros((0, 0, 0), dtype="float64")
+        self._rows = np.zeros((0, 0, 0), dtype="int64")
+
+    @classmethod
+    def from_frame(cls, start: date, end: date, df: pd.DataFrame) -> "DailyUnitsCube":
+        cube = cls(start)
+        cube.append(df, through=end)
+        return cube
+
+    # -------------------------------------------------
+    # SHAPE
+    # -------------------------------------------------
+    @property
+    def end(self) -> date:
+        return self.start + timedelta(days=self._days - 1)
+
+    def covers(self, first: date, last: date) -> bool:
+        return self.start <= first and last <= self.end
+
+    def _add_labels(self, names, labels: List[str], index: Dict[str, int]) -> None:
+        for name in names:
+            if name not in index:
+                index[name] = len(labels)
+                labels.append(name)
+
+    def _reserve(self, days: int) -> None:
+        """
+        Grow the buffers to fit the current axes and `days` day columns.
+        Day capacity doubles so daily appends are amortized O(1) copies.
+        """
+        L, M, cap = self._units.shape
+        need_l, need_m = len(self.locations), len(self.modalities)
+        new_cap = cap if days <= cap else max(days, cap * 2, 32)
+
+        if (need_l, need_m, new_cap) == (L, M, cap):
+            return
+
+        units = np.zeros((need_l, need_m, new_cap), dtype="float64")
+        rows = np.zeros((need_l, need_m, new_cap), dtype="int64")
+        units[:L, :M, : self._days] = self._units[:, :, : self._days]
+        rows[:L, :M, : self._days] = self._rows[:, :, : self._days]
+        self._units, self._rows = units, rows
+
+    # -------------------------------------------------
+    # IN-PLACE APPEND
+    # -------------------------------------------------
+    def append(self, df: pd.DataFrame, through: date) -> None:
+        """
+        Append the days (end, through] from DAILY rows
+        (ScheduleStartDate, LocationName, ProcedureCategory, Unit).
+        Days with no rows are appended as zero activity.
+        """
+        first_new = self.start + timedelta(days=self._days)
+        n_new = (through - first_new).days + 1
+        if n_new <= 0:
+            return
+
+        df = df.dropna(subset=UNIT_KEYS)
+        days = pd.to_datetime(df["ScheduleStartDate"]).dt.date
+
+        outside = (days < first_new) | (days > through)
+        if outside.any():
+            raise ValueError(
+                f"Rows outside {first_new}..{through} cannot be appended to the cube"
+            )
+
+        self._add_labels(df["LocationName"].unique(), self.locations, self._loc_idx)
+        self._add_labels(df["ProcedureCategory"].unique(), self.modalities, self._mod_idx)
+        self._reserve(self._days + n_new)
+
+        L, M = len(self.locations), len(self.modalities)
+        li = df["LocationName"].map(self._loc_idx).to_numpy(dtype="int64")
+        mi = df["ProcedureCategory"].map(self._mod_idx).to_numpy(dtype="int64")
+        di = np.array([(d - first_new).days for d in days], dtype="int64")
+
+        inc_units = np.zeros((L, M, n_new), dtype="float64")
+        inc_rows = np.zeros((L, M, n_new), dtype="int64")
+        np.add.at(inc_units, (li, mi, di), df["Unit"].to_numpy(dtype="float64"))
+        np.add.at(inc_rows, (li, mi, di), 1)
+
+        lo, hi = self._days, self._days + n_new
+        self._units[:, :, lo:hi] = np.cumsum(inc_units, axis=2)
+        self._rows[:, :, lo:hi] = np.cumsum(inc_rows, axis=2)
+        if lo:
+            self._units[:, :, lo:hi] += self._units[:, :, lo - 1 : lo]
+            self._rows[:, :, lo:hi] += self._rows[:, :, lo - 1 : lo]
+        self._days = hi
+
+    # -------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------
+    def _prefix(self, arr: np.ndarray, day: date) -> np.ndarray:
+        offset = (day - self.start).days
+        if offset < 0:
+            return np.zeros(arr.shape[:2], dtype=arr.dtype)
+        return arr[:, :, offset]
+
+    def total(self, first: date, last: date) -> pd.DataFrame:
+        """
+        Units per (LocationName, ProcedureCategory) over [first, last].
+        """
+        if not self.covers(first, last):
+            raise KeyError(f"{first}..{last} is outside cube {self.start}..{self.end}")
+
+        before = first - timedelta(days=1)
+        units = self._prefix(self._units, last) - self._prefix(self._units, before)
+        rows = self._prefix(self._rows, last) - self._prefix(self._rows, before)
+
+        li, mi = np.nonzero(rows)
+        return pd.DataFrame(
+            {
+                "LocationName": [self.locations[i] for i in li],
+                "ProcedureCategory": [self.modalities[i] for i in mi],
+                "Unit": np.round(units[li, mi], _ROUND_DECIMALS),
+            }
+        )
+
+    def daily(self, day: date) -> pd.DataFrame:
+        return self.total(day, day)
+
+    def mtd(self, day: date) -> pd.DataFrame:
+        return self.total(day.replace(day=1), day)
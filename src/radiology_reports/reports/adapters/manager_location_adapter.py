@@ -4,14 +4,10 @@ from datetime import date
 import pandas as pd
 import calendar
 
-from radiology_reports.data.workload import (
-    get_data_by_date,
-    get_budget_daily_volume,
-    get_units_by_range,
-    get_budget_mtd,
-    get_active_locations,   # ✅ NEW
+from radiology_reports.reports.adapters.workload_source import (
+    WorkloadSource,
+    PrefetchedWorkloadSource,
 )
-
 from radiology_reports.reports.models.location_report import (
     LocationReport,
     PeriodMetrics,
@@ -19,22 +15,30 @@ from radiology_reports.reports.models.location_report import (
     Status,
 )
 
-from radiology_reports.utils.businessdays import is_business_day, get_business_days
+from radiology_reports.utils.businessdays import is_business_day
+
 
+def build_manager_location_reports(
+    target_date: date,
+    source: WorkloadSource | None = None,
+) -> list[LocationReport]:
+    """
+    source: where workload/budget data comes from. Defaults to a cube over
+    the target month (DAILY and MTD from one query); range runs pass a
+    shared PrefetchedWorkloadSource.
+    """
+    source = source or PrefetchedWorkloadSource(target_date, target_date)
 
-def build_manager_location_reports(target_date: date) -> list[LocationReport]:
-    df_daily = get_data_by_date(target_date)
+    df_daily = source.daily_units(target_date)
 
     month_start = target_date.replace(day=1)
-    df_mtd = get_units_by_range(month_start, target_date)
+    df_mtd = source.mtd_units(target_date)
 
     # ✅ AUTHORITATIVE LOCATION UNIVERSE
-    locations = sorted(
-        get_active_locations()["LocationName"].tolist()
-    )
+    locations = source.active_locations()
 
     if is_business_day(target_date):
-        daily_budget_df = get_budget_daily_volume(target_date.year, target_date.month)
+        daily_budget_df = source.budget_daily(target_date.year, target_date.month)
     else:
         daily_budget_df = pd.DataFrame(columns=["LocationName", "ProcedureCategory", "Unit"])
 
@@ -44,13 +48,16 @@ def build_manager_location_reports(target_date: date) -> list[LocationReport]:
         calendar.monthrange(target_date.year, target_date.month)[1],
     )
 
-    business_days_elapsed = get_business_days(month_start, target_date)
-    business_days_total = get_business_days(month_start, month_end)
+    business_days_elapsed = source.business_days(month_start, target_date)
+    business_days_total = source.business_days(month_start, month_end)
 
-    mtd_budget_df = get_budget_mtd(
+    # MTD budget is paced on each site's own days open (operating calendar)
+    operating_days = source.operating_days_mtd(target_date)
+    mtd_budget_df = source.budget_mtd(
         year=target_date.year,
         month=target_date.month,
         businessdays=business_days_elapsed,
+        through=target_date,
     )
 
     reports: list[LocationReport] = []
@@ -167,6 +174,7 @@ def build_manager_location_reports(target_date: date) -> list[LocationReport]:
             delta=mtd_delta,
             status=mtd_status,
             modalities=mtd_rows,
+            operating_days_elapsed=float(operating_days.get(location, business_days_elapsed)),
         )
 
         reports.append(
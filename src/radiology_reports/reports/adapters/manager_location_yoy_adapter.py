@@ -1,15 +1,14 @@
 # src/radiology_reports/reports/adapters/manager_location_yoy_adapter.py
 
-from datetime import date, timedelta
+from datetime import date
 import calendar
 
-from radiology_reports.data.workload import (
-    get_data_by_date,
-    get_units_by_range,
-    get_active_locations,
+from radiology_reports.reports.adapters.workload_source import (
+    WorkloadSource,
+    PrefetchedWorkloadSource,
+    calendar_same_date_last_year as _calendar_same_date_last_year,
+    same_weekday_last_year as _same_weekday_last_year,
 )
-
-from radiology_reports.utils.businessdays import get_business_days
 from radiology_reports.reports.models.location_report_yoy import (
     LocationReportYoY,
     PeriodMetricsYoY,
@@ -18,26 +17,18 @@ from radiology_reports.reports.models.location_report_yoy import (
 )
 
 
-def _calendar_same_date_last_year(target_date: date) -> date:
-    """
-    Calendar-aligned date last year (used for MTD YoY).
-    Handles Feb 29 safely.
-    """
-    try:
-        return target_date.replace(year=target_date.year - 1)
-    except ValueError:
-        return date(target_date.year - 1, target_date.month, target_date.day - 1)
-
-
-def _same_weekday_last_year(target_date: date) -> date:
+def build_manager_location_yoy_reports(
+    target_date: date,
+    source: WorkloadSource | None = None,
+) -> list[LocationReportYoY]:
     """
-    Operational YoY comparison.
-    Same weekday last year = 52 weeks back.
+    source: where workload data comes from. Defaults to cubes over the
+    target month and its prior-year window; range runs pass a shared
+    PrefetchedWorkloadSource.
     """
-    return target_date - timedelta(days=364)
-
+    source = source or PrefetchedWorkloadSource(target_date, target_date)
+    source.load_comparison()
 
-def build_manager_location_yoy_reports(target_date: date) -> list[LocationReportYoY]:
     # =====================================================
     # DATE RESOLUTION (POLICY-DRIVEN)
     # =====================================================
@@ -49,19 +40,18 @@ def build_manager_location_yoy_reports(target_date: date) -> list[LocationReport
     # =====================================================
     # DATA LOADS
     # =====================================================
-    df_daily_curr = get_data_by_date(target_date)
-    df_daily_prev = get_data_by_date(prev_date_daily)
+    df_daily_curr = source.daily_units(target_date)
+    df_daily_prev = source.daily_units(prev_date_daily)
 
     month_start_curr = target_date.replace(day=1)
-    month_start_prev = prev_date_mtd.replace(day=1)
 
-    df_mtd_curr = get_units_by_range(month_start_curr, target_date)
-    df_mtd_prev = get_units_by_range(month_start_prev, prev_date_mtd)
+    df_mtd_curr = source.mtd_units(target_date)
+    df_mtd_prev = source.mtd_units(prev_date_mtd)
 
     # =====================================================
     # AUTHORITATIVE LOCATION UNIVERSE
     # =====================================================
-    locations = sorted(get_active_locations()["LocationName"].tolist())
+    locations = source.active_locations()
 
     month_end = date(
         target_date.year,
@@ -69,8 +59,8 @@ def build_manager_location_yoy_reports(target_date: date) -> list[LocationReport
         calendar.monthrange(target_date.year, target_date.month)[1],
     )
 
-    business_days_elapsed = get_business_days(month_start_curr, target_date)
-    business_days_total = get_business_days(month_start_curr, month_end)
+    business_days_elapsed = source.business_days(month_start_curr, target_date)
+    business_days_total = source.business_days(month_start_curr, month_end)
 
     reports: list[LocationReportYoY] = []
 
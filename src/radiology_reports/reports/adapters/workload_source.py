@@ -0,0 +1,232 @@
+# src/radiology_reports/reports/adapters/workload_source.py
+"""
+Workload sources for the manager adapters.
+
+WorkloadSource           -> single-date loads straight from the data layer
+PrefetchedWorkloadSource -> cumulative daily cubes (current + comparison
+                            year): one aggregated query per window, MTD as a
+                            prefix-sum lookup
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from radiology_reports.data.workload import (
+    get_data_by_date,
+    get_units_by_range,
+    get_daily_units_by_range,
+    get_budget_daily_volume,
+    get_budget_mtd,
+    budget_days,
+    get_active_locations,
+)
+from radiology_reports.reports.adapters.daily_cube import DailyUnitsCube
+from radiology_reports.utils.businessdays import get_business_calendar
+from radiology_reports.utils.operating_calendar import get_operating_calendar
+from radiology_reports.utils.tracing import span
+
+
+def calendar_same_date_last_year(target_date: date) -> date:
+    """
+    Calendar-aligned date last year (used for MTD YoY).
+    Handles Feb 29 safely.
+    """
+    try:
+        return target_date.replace(year=target_date.year - 1)
+    except ValueError:
+        return date(target_date.year - 1, target_date.month, target_date.day - 1)
+
+
+def same_weekday_last_year(target_date: date) -> date:
+    """
+    Operational YoY comparison.
+    Same weekday last year = 52 weeks back.
+    """
+    return target_date - timedelta(days=364)
+
+
+def iter_dates(start_date: date, end_date: date):
+    current = start_date
+    while current <= end_date:
+        yield current
+        current += timedelta(days=1)
+
+
+# -------------------------------------------------
+# SINGLE-DATE (DEFAULT)
+# -------------------------------------------------
+class WorkloadSource:
+    """
+    Default source: every call goes to the data layer.
+    Business days come from the process-wide holiday calendar.
+    """
+
+    def daily_units(self, target_date: date) -> pd.DataFrame:
+        return get_data_by_date(target_date)
+
+    def mtd_units(self, target_date: date) -> pd.DataFrame:
+        return get_units_by_range(target_date.replace(day=1), target_date)
+
+    def active_locations(self) -> List[str]:
+        return sorted(get_active_locations()["LocationName"].tolist())
+
+    def budget_daily(self, year: int, month: int) -> pd.DataFrame:
+        return get_budget_daily_volume(year, month)
+
+    def budget_mtd(
+        self,
+        year: int,
+        month: int,
+        businessdays: int,
+        through: Optional[date] = None,
+    ) -> pd.DataFrame:
+        """
+        Budget × days open MTD. With `through`, each location uses its own
+        operating calendar; otherwise the global businessdays count.
+        """
+        return get_budget_mtd(
+            year=year,
+            month=month,
+            businessdays=businessdays,
+            days_by_location=self.operating_days_mtd(through) if through else None,
+        )
+
+    def operating_days_mtd(self, through: date) -> pd.Series:
+        return get_operating_calendar().mtd(through)
+
+    def load_comparison(self) -> None:
+        """Prior-year data is queried on demand; nothing to prefetch."""
+
+    def business_days(self, start: date, end: date) -> int:
+        return get_business_calendar().count(start, end)
+
+
+# -------------------------------------------------
+# CUBE-BACKED (RANGE OR SINGLE DATE)
+# -------------------------------------------------
+class PrefetchedWorkloadSource(WorkloadSource):
+    """
+    Cube-backed source for one or more report dates.
+
+    - Current window [month start of start_date, end_date] is loaded in ONE
+      aggregated query into a cumulative DailyUnitsCube
+    - Prior-year comparison window gets its own cube (load_comparison)
+    - DAILY and MTD are prefix-sum lookups; later days are appended to the
+      cubes in place (extend_to) instead of re-summing the month
+    - Reference data (locations, monthly budget) is loaded once
+
+    Dates the cubes cannot reach fall back to live queries.
+    """
+
+    def __init__(self, start_date: date, end_date: date):
+        self.start_date = start_date
+        self.end_date = end_date
+
+        self._current = self._load_cube(start_date.replace(day=1), end_date)
+        self._comparison: Optional[DailyUnitsCube] = None
+
+        self._locations: Optional[List[str]] = None
+        self._budget: Dict[Tuple[int, int], pd.DataFrame] = {}
+
+    # ---------- cubes ----------
+    @staticmethod
+    def _load_cube(start: date, end: date) -> DailyUnitsCube:
+        with span("data.workload_cube"):
+            return DailyUnitsCube.from_frame(start, end, get_daily_units_by_range(start, end))
+
+    @staticmethod
+    def _comparison_window(start_date: date, end_date: date) -> Tuple[date, date]:
+        prev_mtd_start = calendar_same_date_last_year(start_date).replace(day=1)
+        prev_daily_start = same_weekday_last_year(start_date)
+        prev_end = max(
+            calendar_same_date_last_year(end_date),
+            same_weekday_last_year(end_date),
+        )
+        return min(prev_mtd_start, prev_daily_start), prev_end
+
+    @staticmethod
+    def _grow(cube: DailyUnitsCube, through: date) -> None:
+        if through > cube.end:
+            first_new = cube.end + timedelta(days=1)
+            with span("data.workload_cube_extend"):
+                cube.append(get_daily_units_by_range(first_new, through), through=through)
+
+    def load_comparison(self) -> None:
+        """
+        Prefetch the prior-year window used by the YoY adapter:
+        same weekday last year (DAILY) and calendar-aligned month (MTD).
+        """
+        if self._comparison is None:
+            self._comparison = self._load_cube(
+                *self._comparison_window(self.start_date, self.end_date)
+            )
+
+    def extend_to(self, end_date: date) -> None:
+        """
+        Append DAILY rows after the current end date to the cubes in place.
+        """
+        if end_date <= self.end_date:
+            return
+
+        self.end_date = end_date
+        self._grow(self._current, end_date)
+        if self._comparison is not None:
+            self._grow(
+                self._comparison,
+                self._comparison_window(self.start_date, end_date)[1],
+            )
+
+    def _cube_for(self, first: date, last: date) -> Optional[DailyUnitsCube]:
+        for cube in (self._current, self._comparison):
+            if cube is not None and cube.start <= first <= cube.end + timedelta(days=1):
+                if last > cube.end:
+                    if cube is self._current:
+                        self.extend_to(last)
+                    else:
+                        self._grow(cube, last)
+                return cube
+        return None
+
+    # ---------- workload ----------
+    def daily_units(self, target_date: date) -> pd.DataFrame:
+        cube = self._cube_for(target_date, target_date)
+        if cube is None:
+            return super().daily_units(target_date)
+        return cube.daily(target_date)
+
+    def mtd_units(self, target_date: date) -> pd.DataFrame:
+        cube = self._cube_for(target_date.replace(day=1), target_date)
+        if cube is None:
+            return super().mtd_units(target_date)
+        return cube.mtd(target_date)
+
+    # ---------- reference data ----------
+    def active_locations(self) -> List[str]:
+        if self._locations is None:
+            self._locations = super().active_locations()
+        return self._locations
+
+    def budget_daily(self, year: int, month: int) -> pd.DataFrame:
+        key = (year, month)
+        if key not in self._budget:
+            self._budget[key] = super().budget_daily(year, month)
+        return self._budget[key].copy()
+
+    def budget_mtd(
+        self,
+        year: int,
+        month: int,
+        businessdays: int,
+        through: Optional[date] = None,
+    ) -> pd.DataFrame:
+        df = self.budget_daily(year, month)
+        if through is None:
+            df["Unit"] = df["Unit"] * businessdays
+        else:
+            days = budget_days(df["LocationName"], businessdays, self.operating_days_mtd(through))
+            df["Unit"] = df["Unit"] * days
+        return df
@@ -28,6 +28,7 @@ class PeriodMetrics:
     delta: Optional[int]
     status: Status
     modalities: List[ModalityMetrics]
+    operating_days_elapsed: Optional[float] = None  # site's own days open (budget pacing)
 
 @dataclass
 class LocationReport:
@@ -53,7 +53,7 @@ def build_manager_location_elements(location: LocationReport):
     # DAILY SUMMARY
     # ======================
     daily = location.daily
-    daily_style = STATUS_THEME[daily.status]
+    daily_style = STATUS_THEME[daily.status.value]
     elements.append(
         Paragraph(
             f"<b>DAILY</b><br/>"
@@ -109,7 +109,7 @@ def build_manager_location_elements(location: LocationReport):
     )
     STATUS_COL = 4
     for row_idx, modality in enumerate(daily.modalities, start=1):
-        style = STATUS_THEME[modality.status]
+        style = STATUS_THEME[modality.status.value]
         daily_style_tbl.add(
             "BACKGROUND",
             (STATUS_COL, row_idx),
@@ -123,11 +123,15 @@ def build_manager_location_elements(location: LocationReport):
     # MTD SUMMARY
     # ======================
     mtd = location.mtd
-    mtd_style = STATUS_THEME[mtd.status]
+    mtd_style = STATUS_THEME[mtd.status.value]
+    days_note = f"Business Days: {mtd.business_days_elapsed}"
+    if mtd.operating_days_elapsed is not None and mtd.operating_days_elapsed != mtd.business_days_elapsed:
+        # budget is paced on the site's own open days, not the network count
+        days_note += f" · Site Days Open: {mtd.operating_days_elapsed:g}"
     elements.append(Spacer(1, 16))
     elements.append(
         Paragraph(
-            f"<b>MONTH-TO-DATE</b> (Business Days: {mtd.business_days_elapsed})<br/>"
+            f"<b>MONTH-TO-DATE</b> ({days_note})<br/>"
             f"<b>MTD Status:</b> {mtd_style.label} "
             f'<font color="{mtd_style.legend_color}">●</font>',
             styles["Normal"],
@@ -179,7 +183,7 @@ def build_manager_location_elements(location: LocationReport):
         ]
     )
     for row_idx, modality in enumerate(mtd.modalities, start=1):
-        style = STATUS_THEME[modality.status]
+        style = STATUS_THEME[modality.status.value]
         mtd_style_tbl.add(
             "BACKGROUND",
             (STATUS_COL, row_idx),
@@ -200,14 +204,14 @@ def build_manager_location_elements(location: LocationReport):
     )
     legend = (
         "<b>Status Legend:</b> "
-        f'<font color="{STATUS_THEME[Status.GREEN].legend_color}">●</font> '
-        f'GREEN = {STATUS_THEME[Status.GREEN].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.YELLOW].legend_color}">●</font> '
-        f'YELLOW = {STATUS_THEME[Status.YELLOW].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.RED].legend_color}">●</font> '
-        f'RED = {STATUS_THEME[Status.RED].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.INFO].legend_color}">●</font> '
-        f'INFO = {STATUS_THEME[Status.INFO].label}'
+        f'<font color="{STATUS_THEME[Status.GREEN.value].legend_color}">●</font> '
+        f'GREEN = {STATUS_THEME[Status.GREEN.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.YELLOW.value].legend_color}">●</font> '
+        f'YELLOW = {STATUS_THEME[Status.YELLOW.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.RED.value].legend_color}">●</font> '
+        f'RED = {STATUS_THEME[Status.RED.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.INFO.value].legend_color}">●</font> '
+        f'INFO = {STATUS_THEME[Status.INFO.value].label}'
         "<br/>"
         "Daily budget applies to business days only (Mon–Fri). "
         "Saturday exam volume is included; budget is not applied."
@@ -47,7 +47,7 @@ def build_manager_summary_page(reports):
     else:
         status = Status.RED
 
-    style = STATUS_THEME[status]
+    style = STATUS_THEME[status.value]
 
     elements.append(
         Paragraph(
@@ -125,7 +125,7 @@ def build_manager_summary_page(reports):
             "BACKGROUND",
             (STATUS_COL, idx),
             (STATUS_COL, idx),
-            STATUS_THEME[r.mtd.status].fill_color,
+            STATUS_THEME[r.mtd.status.value].fill_color,
         )
 
     tbl.setStyle(tbl_style)
@@ -139,14 +139,14 @@ def build_manager_summary_page(reports):
 
     legend = (
         "<b>Status Legend:</b> "
-        f'<font color="{STATUS_THEME[Status.GREEN].legend_color}">●</font> '
-        f'GREEN = {STATUS_THEME[Status.GREEN].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.YELLOW].legend_color}">●</font> '
-        f'YELLOW = {STATUS_THEME[Status.YELLOW].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.RED].legend_color}">●</font> '
-        f'RED = {STATUS_THEME[Status.RED].label} &nbsp;&nbsp; '
-        f'<font color="{STATUS_THEME[Status.INFO].legend_color}">●</font> '
-        f'INFO = {STATUS_THEME[Status.INFO].label}'
+        f'<font color="{STATUS_THEME[Status.GREEN.value].legend_color}">●</font> '
+        f'GREEN = {STATUS_THEME[Status.GREEN.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.YELLOW.value].legend_color}">●</font> '
+        f'YELLOW = {STATUS_THEME[Status.YELLOW.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.RED.value].legend_color}">●</font> '
+        f'RED = {STATUS_THEME[Status.RED.value].label} &nbsp;&nbsp; '
+        f'<font color="{STATUS_THEME[Status.INFO.value].legend_color}">●</font> '
+        f'INFO = {STATUS_THEME[Status.INFO.value].label}'
         "<br/>"
         "Daily budget applies to business days only (Mon–Fri). "
         "Saturday exam volume is included; budget is not applied."
@@ -15,6 +15,14 @@ from radiology_reports.reports.pdf.manager_location_yoy_page import (
     build_manager_location_yoy_elements,
 )
 
+from radiology_reports.reports.pdf.render_cache import (
+    RenderManifest,
+    report_fingerprint,
+    combined_fingerprint,
+)
+
+from radiology_reports.reports.pdf.streaming import build_streaming
+
 # ✅ NEW: summary page import
 from radiology_reports.reports.pdf.manager_summary_yoy_page import (
     build_manager_summary_yoy_page,
@@ -22,16 +30,27 @@ from radiology_reports.reports.pdf.manager_summary_yoy_page import (
 
 
 # -------------------------------------------------
-# ONE PDF PER LOCATION (UNCHANGED)
+# ONE PDF PER LOCATION (CONTENT-HASH CACHED)
 # -------------------------------------------------
 def run_manager_pdf_yoy_report(
     target_date: date,
     output_root: Path | str,
+    force: bool = False,
+    reports=None,
 ):
+    """
+    Render one PDF per location.
+
+    Locations whose report model hash matches the manifest (and whose PDF
+    still exists) are not re-rendered unless force=True. Pass reports to
+    reuse models already built for target_date.
+    """
     output_root = Path(output_root)
     output_root.mkdir(parents=True, exist_ok=True)
 
-    reports = build_manager_location_yoy_reports(target_date)
+    manifest = RenderManifest(output_root)
+    if reports is None:
+        reports = build_manager_location_yoy_reports(target_date)
     generated = []
 
     for report in reports:
@@ -42,23 +61,46 @@ def run_manager_pdf_yoy_report(
         )
 
         pdf_path = output_root / filename
+        fingerprint = report_fingerprint(report)
 
-        build_manager_location_yoy_page(
-            location=report,
-            output_path=str(pdf_path),
-        )
+        if force or not manifest.is_fresh(pdf_path, fingerprint):
+            build_manager_location_yoy_page(
+                location=report,
+                output_path=str(pdf_path),
+            )
+            manifest.record(pdf_path, fingerprint)
 
         generated.append(pdf_path)
 
+    manifest.save()
     return generated
 
 
+# -------------------------------------------------
+# COMBINED PDF SECTIONS
+# -------------------------------------------------
+def _combined_sections(reports):
+    """
+    Yield the combined document one section at a time:
+    PAGE 1 — management summary, then each location's detail pages.
+    """
+    yield build_manager_summary_yoy_page(reports)
+
+    for idx, report in enumerate(reports):
+        section = build_manager_location_yoy_elements(report)
+        if idx < len(reports) - 1:
+            section.append(PageBreak())
+        yield section
+
+
 # -------------------------------------------------
 # COMBINED PDF (ALL LOCATIONS) — WITH SUMMARY PAGE
 # -------------------------------------------------
 def run_manager_combined_yoy_pdf(
     target_date: date,
     output_root: Path | str,
+    force: bool = False,
+    reports=None,
 ):
     output_root = Path(output_root)
     output_root.mkdir(parents=True, exist_ok=True)
@@ -68,7 +110,14 @@ def run_manager_combined_yoy_pdf(
         / f"Manager_Daily_YoY_Report_ALL_LOCATIONS_{target_date.isoformat()}.pdf"
     )
 
-    reports = build_manager_location_yoy_reports(target_date)
+    if reports is None:
+        reports = build_manager_location_yoy_reports(target_date)
+
+    # Summary + every location page unchanged -> reuse the combined PDF
+    manifest = RenderManifest(output_root)
+    fingerprint = combined_fingerprint(report_fingerprint(r) for r in reports)
+    if not force and manifest.is_fresh(combined_path, fingerprint):
+        return combined_path
 
     doc = SimpleDocTemplate(
         str(combined_path),
@@ -79,21 +128,10 @@ def run_manager_combined_yoy_pdf(
         bottomMargin=36,
     )
 
-    elements = []
-
-    # ============================
-    # PAGE 1 — MANAGEMENT SUMMARY
-    # ============================
-    elements.extend(build_manager_summary_yoy_page(reports))
-
-    # ============================
-    # LOCATION DETAIL PAGES
-    # ============================
-    for idx, report in enumerate(reports):
-        elements.extend(build_manager_location_yoy_elements(report))
-        if idx < len(reports) - 1:
-            elements.append(PageBreak())
+    # Summary first, then one location section at a time (streamed)
+    build_streaming(doc, _combined_sections(reports))
 
-    doc.build(elements)
+    manifest.record(combined_path, fingerprint)
+    manifest.save()
 
     return combined_path
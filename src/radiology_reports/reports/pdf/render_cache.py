@@ -0,0 +1,132 @@
+# src/radiology_reports/reports/pdf/render_cache.py
+"""
+Content-hash render cache for manager PDFs.
+
+Each location report model is hashed in a stable way and the hash is
+stored next to the generated PDF in a small JSON manifest. A rerun for the
+same date only re-renders the PDFs whose model hash changed.
+
+Pure bookkeeping:
+- No SQL
+- No ReportLab
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Dict, Iterable
+
+
+MANIFEST_NAME = ".render_manifest.json"
+
+# Bump when page layout changes so cached PDFs are re-rendered.
+RENDER_VERSION = 1
+
+
+# -------------------------------------------------
+# Stable hashing
+# -------------------------------------------------
+def _normalize(value):
+    """
+    Convert a report model into plain, order-stable JSON data.
+
+    Modality lists are built from set iteration in the adapters, so their
+    order changes between processes; they are sorted here by modality name.
+    """
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _normalize(getattr(value, f.name))
+            for f in dataclasses.fields(value)
+        }
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, float):
+        return round(value, 10)
+    if isinstance(value, (list, tuple)):
+        items = [_normalize(v) for v in value]
+        if all(isinstance(i, dict) and "modality" in i for i in items):
+            items.sort(key=lambda i: str(i["modality"]))
+        return items
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    if hasattr(value, "item"):  # numpy scalars
+        return value.item()
+    return value
+
+
+def report_fingerprint(report) -> str:
+    """
+    Stable SHA-256 of a LocationReport / LocationReportYoY (or a list of them).
+    """
+    payload = {
+        "render_version": RENDER_VERSION,
+        "type": type(report).__name__,
+        "data": _normalize(report),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+def combined_fingerprint(fingerprints: Iterable[str]) -> str:
+    """
+    Hash of an ordered sequence of per-location hashes (combined PDF key).
+    """
+    digest = hashlib.sha256()
+    for fp in fingerprints:
+        digest.update(fp.encode("ascii"))
+    return digest.hexdigest()
+
+
+# -------------------------------------------------
+# Manifest
+# -------------------------------------------------
+class RenderManifest:
+    """
+    filename -> content hash, persisted as JSON in the output directory.
+    """
+
+    def __init__(self, output_root: Path | str):
+        self.output_root = Path(output_root)
+        self.path = self.output_root / MANIFEST_NAME
+        self._entries: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        if not self.path.exists():
+            return {}
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            # Corrupt manifest -> behave as a cold cache
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def is_fresh(self, pdf_path: Path, fingerprint: str) -> bool:
+        """
+        True when pdf_path exists and was rendered from the same content.
+        """
+        return (
+            pdf_path.exists()
+            and self._entries.get(pdf_path.name) == fingerprint
+        )
+
+    def record(self, pdf_path: Path, fingerprint: str) -> None:
+        self._entries[pdf_path.name] = fingerprint
+
+    def save(self) -> None:
+        # Drop entries whose PDFs were removed (e.g. by cleanup_old_files)
+        entries = {
+            name: fp
+            for name, fp in self._entries.items()
+            if (self.output_root / name).exists()
+        }
+        tmp = self.path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entries, indent=2, sort_keys=True), encoding="utf-8")
+        tmp.replace(self.path)
+        self._entries = entries
@@ -0,0 +1,50 @@
+# src/radiology_reports/reports/pdf/streaming.py
+"""
+Section-at-a-time flowable streaming for large combined PDFs.
+
+ReportLab's doc.build() consumes its story from the front of the list
+(flowables[0] / del flowables[0]). SectionStream is a list that refills
+itself from a generator of sections only when it runs empty, so only the
+section being laid out is held in memory; drawn sections are released as
+soon as their pages are emitted.
+
+One doc.build() call is still made, so page numbers run continuously and
+section order (summary first) is exactly the generator order.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Iterator, List
+
+
+class SectionStream(list):
+    """
+    Story list fed lazily from an iterable of flowable sections.
+    """
+
+    def __init__(self, sections: Iterable[List]):
+        super().__init__()
+        self._sections: Iterator[List] = iter(sections)
+
+    def _refill(self) -> None:
+        while not list.__len__(self):
+            try:
+                section = next(self._sections)
+            except StopIteration:
+                return
+            self.extend(section)
+
+    def __len__(self) -> int:
+        self._refill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._refill()
+        return list.__getitem__(self, index)
+
+
+def build_streaming(doc, sections: Iterable[List]) -> None:
+    """
+    doc.build() over sections produced one at a time.
+    """
+    doc.build(SectionStream(sections))
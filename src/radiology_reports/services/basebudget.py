@@ -1,164 +1,116 @@
+# src/radiology_reports/services/basebudget.py
+"""
+Base budget loaders (SQLite).
+
+Import has no side effects:
+- The SQLite database is opened on first query
+- Year / month / quarter filters run in SQL
+- Each distinct query result is cached for the life of the process
+- CSV exports open their file only when called
+"""
 import os
-import csv
-import datetime
-from datetime import timedelta
-from calendar import monthrange
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.backends.backend_pdf import PdfPages
-import pandas as pd
-import numpy as np
 import sqlite3
+from functools import lru_cache
+
+import pandas as pd
 
 
-#os.chdir('')
-cur_path = os.getcwd()
 app_path = os.path.dirname(os.path.abspath(__file__))
 #network_path = r'\\server4.rrc.center\public\dashboards\dailyreport'
-#os.chdir(network_path)
-conn = sqlite3.connect('Daily_SQLite3.db')
-c = conn.cursor() # The database will be saved in the location where your 'py' file is saved
+DB_PATH = 'Daily_SQLite3.db'  # relative to the working directory, as before
+output_file = os.path.join(app_path, 'output', 'basebudget.csv')
+
+
+@lru_cache(maxsize=1)
+def _connection():
+  return sqlite3.connect(DB_PATH, check_same_thread=False)
+
+@lru_cache(maxsize=None)
+def _cached_query(sql, params):
+  return pd.read_sql_query(sql, _connection(), params=params)
+
+def _query(sql, params=()):
+  # Callers add/modify columns, so hand out a copy of the cached frame
+  return _cached_query(sql, tuple(params)).copy()
+
+def _write_csv(df):
+  os.makedirs(os.path.dirname(output_file), exist_ok=True)
+  df.to_csv(output_file, sep=',', mode='w+')
+
+
+BUDGET_SQL = '''SELECT Location as LocationName,Modality as ProcedureCategory,Year,Month,ProjectedVolume as Unit
+            FROM basebudget'''
+
+DAILY_BUDGET_SQL = '''SELECT Location as LocationName,Modality as ProcedureCategory,Year,Month,
+            ProjectedDailyVolume as Unit,Locations.Region
+            FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName
+            WHERE Year = ? AND Month = ?'''
+
 
-output_file= os.path.join(app_path,r'output\basebudget.csv')
-f = open(output_file,'w+',newline='')
+class BaseBudget:
 
-class BaseBudget: 
-   
   def __init__(self,month,year):
     self.month = int(month)
     self.year = int(year)
 
   #Location,Modality,Month,Year,ProjectedVolume,Days,ProjectedDailyVolume
   def monthbasebudgetcsv(self):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedVolume FROM basebudget''')
-    #c.execute('''SELECT Location,Modality,Year,Month,ProjectedDailyVolume FROM basebudget''') #uncmoment for ProjectedDailyVolume
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit'])
-  
-    basebudgetdf = df.copy(deep=False)
+    basebudgetdf = _query(BUDGET_SQL)
     basebudgetdf['Month'] = basebudgetdf['Year'].map(str) + '-' + basebudgetdf['Month'].map(str)
     basebudgetdf['Quarter'] = pd.PeriodIndex(pd.to_datetime(basebudgetdf['Month']),freq='Q')
-  
-    basebudgetdf.to_csv(f,sep=',',mode='w+',line_terminator=None)
-    #return basebudgetdf
+
+    _write_csv(basebudgetdf)
 
   def getmonthbasebudgetdf(self):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedVolume FROM basebudget''')
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit'])
-  
-    basebudgetdf = df.copy(deep=False)
-    basebudgetdf = basebudgetdf[basebudgetdf['Year'] == self.year]
-    basebudgetdf = basebudgetdf[basebudgetdf['Month'] == self.month]
-    #basebudgetdf['Year'] = 'basebudget'  #'{}/{} basebudget'.format(input_month,input_year)
-  
+    basebudgetdf = _query(BUDGET_SQL + ' WHERE Year = ? AND Month = ?', (self.year, self.month))
+
     print(basebudgetdf)
     return basebudgetdf
-    
+
   def getquarterbasebudgetdf(self,iquarter):
-    c.execute('''SELECT Location,Modality,Year,Year||"-"||Month,ProjectedVolume,Locations.Region 
-              FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName''')
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit','Region'])
-    df['Quarter'] = pd.to_datetime(df['Month']).dt.quarter
-    basebudgetdf = df.copy(deep=False)
-  
-    basebudgetdf = basebudgetdf[basebudgetdf['Year'] == self.year]
-    basebudgetdf = basebudgetdf[basebudgetdf['Quarter'] == iquarter]
+    basebudgetdf = _query('''SELECT Location as LocationName,Modality as ProcedureCategory,Year,
+              Year||"-"||Month as Month,ProjectedVolume as Unit,Locations.Region
+              FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName
+              WHERE Year = ? AND (CAST(Month AS INTEGER) - 1) / 3 + 1 = ?''', (self.year, int(iquarter)))
+    basebudgetdf['Quarter'] = pd.to_datetime(basebudgetdf['Month']).dt.quarter
     basebudgetdf['Year'] = 'BaseBudget'  #'{}/{} basebudget'.format(input_month,input_year)
-    basebudgetdf['Unit'] = basebudgetdf['Unit']
-  
-    #print(basebudgetdf)
-    return basebudgetdf 
+
+    return basebudgetdf
 
   def dailybasebudget(self):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedVolume FROM basebudget''')
-    #c.execute('''SELECT Location,Year,Month,ProjectedDailyVolume FROM basebudget''') #uncmoment for ProjectedDailyVolume
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit'])
-  
-    basebudgetdf = df.copy(deep=False)
-    basebudgetdf['Month'] = basebudgetdf['Year'].map(str) + '-' + basebudgetdf['Month'].map(str)
-    basebudgetdf['Quarter'] = pd.PeriodIndex(pd.to_datetime(basebudgetdf['Month']),freq='Q')
-  
-    basebudgetdf.to_csv(f,sep=',',mode='w+',line_terminator=None)
-    #return basebudgetdf
+    self.monthbasebudgetcsv()
 
   def getbasebudgetdf(self):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedDailyVolume,Locations.Region 
-            FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName''')
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit','Region'])
-  
-    basebudgetdf = df.copy(deep=False)
-    basebudgetdf = basebudgetdf[basebudgetdf['Year'] == self.year]
-    basebudgetdf = basebudgetdf[basebudgetdf['Month'] == self.month]
+    basebudgetdf = _query(DAILY_BUDGET_SQL, (self.year, self.month))
     basebudgetdf['Year'] = 'BaseBudget'  #'{}/{} basebudget'.format(input_month,input_year)
-  
-    #print(basebudgetdf)
+
     return basebudgetdf
 
   def getbasebudgetvolume(self):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedDailyVolume,Locations.Region 
-            FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName''')
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit','Region'])
-  
-    basebudgetdf = df.copy(deep=False)
-    basebudgetdf = basebudgetdf[basebudgetdf['Year'] == self.year]
-    basebudgetdf = basebudgetdf[basebudgetdf['Month'] == self.month]
-    return basebudgetdf['Unit']
+    return _query(DAILY_BUDGET_SQL, (self.year, self.month))['Unit']
 
   def getMTDbasebudget(self,businessdays):
-    c.execute('''SELECT Location,Modality,Year,Month,ProjectedDailyVolume,Locations.Region 
-            FROM basebudget INNER JOIN LOCATIONS on basebudget.Location = Locations.LocationName''')
-    df = pd.DataFrame(c.fetchall(), columns=['LocationName','ProcedureCategory','Year','Month','Unit','Region'])
-    
-    basebudgetdf = df.copy(deep=False)
-    basebudgetdf = basebudgetdf[basebudgetdf['Year'] == self.year]
-    basebudgetdf = basebudgetdf[basebudgetdf['Month'] == self.month]
+    basebudgetdf = _query(DAILY_BUDGET_SQL, (self.year, self.month))
     basebudgetdf['Year'] = 'BaseBudget'  #'{}/{} basebudget'.format(input_month,input_year)
     basebudgetdf['Unit'] = basebudgetdf['Unit'] * businessdays
-  
-    #print(basebudgetdf)
+
     return basebudgetdf
 
-  def getYTDbasebudget(self,year):
-    c.execute(f'''SELECT b.MONTH,b.YEAR,b.Location,l.Region,b.Modality,
-b.ProjectedDailyVolume,d.Days,Sum(ProjectedDailyVolume * d.Days) as basebudget
-FROM basebudget b
-
-INNER JOIN Locations l ON b.Location = l.LocationName
-
-INNER JOIN (
-
-SELECT Mnth,Yr,LocationName,Count(*) as Days
-FROM (
-  SELECT Daily.ScheduleStartDate,strftime('%m',Daily.ScheduleStartDate) as Mnth,
-    strftime('%Y',Daily.ScheduleStartDate) as Yr, Daily.LocationName
-  FROM DAILY
-  WHERE --NO SATURDAY
-    (strftime('%Y',ScheduleStartDate) = "{year}" and strftime('%w',Daily.ScheduleStartDate) != "6")
-  GROUP BY Daily.ScheduleStartDate, strftime('%m',Daily.ScheduleStartDate),
-    strftime('%Y',Daily.ScheduleStartDate),LocationName)
-GROUP BY Mnth,Yr,LocationName) d
-
-ON b.Month = d.Mnth AND b.Year = d.Yr AND b.Location = d.LocationName
-
-LEFT JOIN (
-
-SELECT strftime('%m',Daily.ScheduleStartDate) as Mnth,
-  strftime('%Y',Daily.ScheduleStartDate) as Yr, Daily.LocationName,Daily.ProcedureCategory,
-  Sum(Unit) as Volume
-FROM DAILY
-WHERE --NO SATURDAY
-  (strftime('%Y',ScheduleStartDate) = "{year}"
-  AND ProcedureCategory != "E&M CODES" AND ProcedureCategory != "ENHANCED SRVC")
-
-GROUP BY strftime('%m',Daily.ScheduleStartDate),
-  strftime('%Y',Daily.ScheduleStartDate),LocationName,ProcedureCategory
-) dv
-
-ON b.Month = dv.Mnth AND b.Year = dv.Yr AND b.Location = dv.LocationName AND b.Modality = dv.ProcedureCategory
-
-WHERE b.YEAR = "{year}"
-GROUP BY b.MONTH,b.YEAR,b.Location,b.Modality''')
-    df = pd.DataFrame(c.fetchall(), columns=['Month','Year','LocationName','Region','ProcedureCategory','ProjectDailyVolume','Days','Unit'])
-    
-    return df
+  def getYTDbasebudget(self,year,through=None):
+    # Days open come from the per-location operating calendar
+    # (open weekdays, holidays, half days) instead of counting DAILY dates.
+    from radiology_reports.utils.operating_calendar import get_ytd_operating_days
+
+    df = _query('''SELECT b.Month,b.Year,b.Location as LocationName,l.Region,
+            b.Modality as ProcedureCategory,b.ProjectedDailyVolume as ProjectDailyVolume
+            FROM basebudget b INNER JOIN Locations l ON b.Location = l.LocationName
+            WHERE b.Year = ?''', (int(year),))
+    df['Month'] = df['Month'].astype(int)
+
+    days = get_ytd_operating_days(int(year), through=through)
+    df = df.merge(days[['Month','LocationName','Days']], on=['Month','LocationName'], how='inner')
+    df['Unit'] = df['ProjectDailyVolume'] * df['Days']
+
+    return df[['Month','Year','LocationName','Region','ProcedureCategory','ProjectDailyVolume','Days','Unit']]
 #bt = basebudget()
-#bt.dailybasebudget()
\ No newline at end of file
+#bt.dailybasebudget()
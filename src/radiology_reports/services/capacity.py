@@ -14,23 +14,52 @@ and produces unified per-location analytics:
     - delta scheduled -> completed
     - delta completed -> capacity
     - status
+
+Frames may cover many DOS: when scheduled/completed carry a "dos" column
+the summary is per (dos, location) — one tidy row per day and site, the
+same rows a single-day run would give for each day — and capacity (per
+location) applies to every day.
 """
 
+import numpy as np
 import pandas as pd
 
 
+def classify_status(completed_wu, capacity_wu) -> np.ndarray:
+    """NO CAP / OVER (>105%) / AT (>=95%) / UNDER CAPACITY, as arrays."""
+    completed_wu = np.asarray(completed_wu, dtype=float)
+    capacity_wu = np.asarray(capacity_wu, dtype=float)
+    has_cap = capacity_wu != 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = completed_wu / np.where(has_cap, capacity_wu, 1)
+    return np.select(
+        [~has_cap, ratio > 1.05, ratio >= 0.95],
+        ["NO CAP", "OVER CAPACITY", "AT CAPACITY"],
+        default="UNDER CAPACITY",
+    )
+
+
 def compute_capacity_summary(
     scheduled_df: pd.DataFrame,
     completed_df: pd.DataFrame,
     capacity_df: pd.DataFrame
 ) -> pd.DataFrame:
 
+    multi_day = "dos" in scheduled_df.columns
+    if multi_day != ("dos" in completed_df.columns):
+        raise ValueError("scheduled_df and completed_df must both have a 'dos' column, or neither")
+    keys = ["dos", "location"] if multi_day else ["location"]
+
+    # Empty read_sql results come back as object columns
+    scheduled_df = scheduled_df.astype({"weighted_units": float})
+    completed_df = completed_df.astype({"weighted_units": float})
+
     # ---------------------------------------------------------
-    # Aggregate scheduled weighted units per location
+    # Aggregate scheduled weighted units per location (and day)
     # ---------------------------------------------------------
     sched = (
         scheduled_df
-        .groupby("location")["weighted_units"]
+        .groupby(keys)["weighted_units"]
         .sum()
         .rename("scheduled_wu")
     )
@@ -40,7 +69,7 @@ def compute_capacity_summary(
     # ---------------------------------------------------------
     comp = (
         completed_df
-        .groupby("location")["weighted_units"]
+        .groupby(keys)["weighted_units"]
         .sum()
         .rename("completed_wu")
     )
@@ -51,10 +80,22 @@ def compute_capacity_summary(
     cap = capacity_df.set_index("location")["capacity_weighted_90th"]
     cap.name = "capacity_wu"
 
+    if multi_day:
+        # Same capacity for every DOS in the frames
+        days = sorted(set(sched.index.get_level_values("dos")) | set(comp.index.get_level_values("dos")))
+        cap = (
+            pd.DataFrame({"dos": days})
+            .merge(cap.reset_index(), how="cross")
+            .set_index(keys)["capacity_wu"]
+        )
+
     # ---------------------------------------------------------
     # Join all 3
     # ---------------------------------------------------------
     df = pd.concat([sched, comp, cap], axis=1).fillna(0)
+    if multi_day:
+        # Group by day, keeping each day's rows in single-day order
+        df = df.iloc[df.index.get_level_values("dos").argsort(kind="stable")]
 
     # % of capacity (safe division: avoid inf / NaN when capacity_wu == 0)
     df["scheduled_pct"] = (df["scheduled_wu"] / df["capacity_wu"] * 100).where(df["capacity_wu"] > 0, 0).round(1)
@@ -65,16 +106,6 @@ def compute_capacity_summary(
     df["delta_comp_cap"] = (df["completed_wu"] - df["capacity_wu"]).round(2)
 
     # status classification
-    def classify(row):
-        if row["capacity_wu"] == 0:
-            return "NO CAP"
-        ratio = row["completed_wu"] / row["capacity_wu"]
-        if ratio > 1.05:
-            return "OVER CAPACITY"
-        if ratio >= 0.95:
-            return "AT CAPACITY"
-        return "UNDER CAPACITY"
-
-    df["status"] = df.apply(classify, axis=1)
+    df["status"] = classify_status(df["completed_wu"], df["capacity_wu"])
 
     return df.reset_index()
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
 from datetime import datetime, timedelta
 from typing import Dict, Any, List
 import calendar
+import numpy as np
 import pandas as pd
 
 from radiology_reports.data.workload import (
@@ -14,6 +17,32 @@ from radiology_reports.data.workload import (
 from radiology_reports.services.budget import Budget
 
 
+MODALITY_ORDER = [
+    "CT SCANS", "DEXA", "DIAGNOSTIC", "MAM D", "MAMMOGRAPHY",
+    "MRI", "NUCLEAR MED", "PET SCAN", "SPECIALS", "ULTRASOUND"
+]
+
+
+def _load_concurrently(*loaders):
+    """
+    Run independent data loads (each opens its own connection) in parallel.
+    Each runs in a copy of the caller's context (trace spans, daily_run's
+    per-job stdout capture).
+    """
+    with ThreadPoolExecutor(max_workers=len(loaders)) as pool:
+        futures = [pool.submit(copy_context().run, loader) for loader in loaders]
+        return [f.result() for f in futures]
+
+
+def _status_bands(pct: np.ndarray, has_pct: np.ndarray) -> np.ndarray:
+    """green at >= +5%, red at <= -5%, yellow otherwise (and when no prior)."""
+    return np.select(
+        [~has_pct, pct >= 5, pct <= -5],
+        ["yellow", "green", "red"],
+        default="yellow",
+    )
+
+
 class DailyReportingService:
     def __init__(self, target_date: str | datetime | None = None):
         if target_date is None:
@@ -39,48 +68,54 @@ class DailyReportingService:
         - Budget variance (Actual - Budget)
         """
 
-        df_actual = get_data_by_date(self.target_date)
-        df_last   = get_data_by_date(self.target_date - timedelta(days=364))
-
         budget = Budget(self.target_date.month, self.target_date.year)
-        df_budget = budget.getbudgetdf()
+        df_actual, df_last, df_budget = _load_concurrently(
+            lambda: get_data_by_date(self.target_date),
+            lambda: get_data_by_date(self.target_date - timedelta(days=364)),
+            budget.getbudgetdf,
+        )
 
-        actual_pivot = self._pivot_volume(df_actual)
-        last_pivot   = self._pivot_volume(df_last)
-        budget_pivot = self._pivot_volume(df_budget)
+        if df_actual.empty:
+            return {key: self._pivot_volume(df_actual) for key in ("actual", "yoy", "budget")}
 
-        yoy_variance = actual_pivot - last_pivot
-        budget_variance = actual_pivot - budget_pivot
+        # One shared (modality × location) grid for all three datasets, so
+        # the variances line up cell for cell (a location missing from one
+        # dataset counts 0 instead of turning its column into NaN)
+        locations = sorted(
+            set().union(*(df["LocationName"].unique() for df in (df_actual, df_last, df_budget) if not df.empty))
+        )
+        actual_pivot, last_pivot, budget_pivot = (
+            self._matrix(self._pivot_grid(df, locations, MODALITY_ORDER).T, locations)
+            for df in (df_actual, df_last, df_budget)
+        )
 
         return {
             "actual": actual_pivot,
-            "yoy": yoy_variance,
-            "budget": budget_variance
+            "yoy": actual_pivot - last_pivot,
+            "budget": actual_pivot - budget_pivot,
         }
 
     # ============================================================
-    # EXISTING / LEGACY METHODS (UNCHANGED)
+    # PIVOTS
     # ============================================================
 
     def _pivot_volume(self, df: pd.DataFrame) -> pd.DataFrame:
         if df.empty:
             return pd.DataFrame({"Message": ["No data available"]})
 
-        pivot = (
-            df.groupby(["ProcedureCategory", "LocationName"])["Unit"]
-              .sum()
-              .unstack(fill_value=0)
-        )
-
-        modality_order = [
-            "CT SCANS", "DEXA", "DIAGNOSTIC", "MAM D", "MAMMOGRAPHY",
-            "MRI", "NUCLEAR MED", "PET SCAN", "SPECIALS", "ULTRASOUND"
-        ]
+        locations = sorted(df["LocationName"].unique())
+        return self._matrix(self._pivot_grid(df, locations, MODALITY_ORDER).T, locations)
 
-        pivot = pivot.reindex(modality_order, fill_value=0)
+    @staticmethod
+    def _matrix(grid: np.ndarray, locations) -> pd.DataFrame:
+        """(modality × location) grid as a report matrix with Total row and Total Result column."""
+        pivot = pd.DataFrame(
+            grid,
+            index=pd.Index(MODALITY_ORDER, name="ProcedureCategory"),
+            columns=pd.Index(locations, name="LocationName"),
+        )
         pivot.loc["Total"] = pivot.sum()
         pivot["Total Result"] = pivot.sum(axis=1)
-
         return pivot.astype(int)
 
     # ============================================================
@@ -93,53 +128,47 @@ class DailyReportingService:
         Shows all modalities (alphabetical) with YoY comparison.
         """
 
-        df_this = get_data_by_date(self.target_date)
-        df_last = get_data_by_date(self.target_date - timedelta(days=364))
+        df_this, df_last = _load_concurrently(
+            lambda: get_data_by_date(self.target_date),
+            lambda: get_data_by_date(self.target_date - timedelta(days=364)),
+        )
 
         if df_this.empty:
             return []
 
-        pages = []
-
         locations = sorted(df_this["LocationName"].unique())
         modalities = sorted(df_this["ProcedureCategory"].unique())
 
-        for location in locations:
-            rows = []
-
-            for modality in modalities:
-                curr = df_this.loc[
-                    (df_this["LocationName"] == location) &
-                    (df_this["ProcedureCategory"] == modality),
-                    "Unit"
-                ].sum()
-
-                prev = df_last.loc[
-                    (df_last["LocationName"] == location) &
-                    (df_last["ProcedureCategory"] == modality),
-                    "Unit"
-                ].sum()
-
-                delta = int(curr - prev)
-                pct = (delta / prev * 100) if prev else None
-
-                if pct is None:
-                    status = "yellow"
-                elif pct >= 5:
-                    status = "green"
-                elif pct <= -5:
-                    status = "red"
-                else:
-                    status = "yellow"
-
-                rows.append({
+        # One (location × modality) grid per year instead of a mask scan per cell
+        curr = self._pivot_grid(df_this, locations, modalities)
+        prev = self._pivot_grid(df_last, locations, modalities)
+
+        delta = np.trunc(curr - prev).astype(int)
+        has_pct = prev != 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct = np.where(has_pct, delta / np.where(has_pct, prev, 1) * 100, np.nan)
+        status = _status_bands(pct, has_pct)
+
+        curr_int = np.trunc(curr).astype(int).tolist()
+        prev_int = np.trunc(prev).astype(int).tolist()
+        delta = delta.tolist()
+        pct_list = pct.tolist()
+        status = status.tolist()
+        has_pct = has_pct.tolist()
+
+        pages = []
+        for i, location in enumerate(locations):
+            rows = [
+                {
                     "modality": modality,
-                    "prev": int(prev),
-                    "curr": int(curr),
-                    "delta": delta,
-                    "pct": pct,
-                    "status": status
-                })
+                    "prev": prev_int[i][j],
+                    "curr": curr_int[i][j],
+                    "delta": delta[i][j],
+                    "pct": pct_list[i][j] if has_pct[i][j] else None,
+                    "status": status[i][j]
+                }
+                for j, modality in enumerate(modalities)
+            ]
 
             pages.append({
                 "location": location,
@@ -147,3 +176,15 @@ class DailyReportingService:
             })
 
         return pages
+
+    @staticmethod
+    def _pivot_grid(df: pd.DataFrame, locations, modalities) -> np.ndarray:
+        """Unit sums as a dense (locations × modalities) array, 0 where absent."""
+        if df.empty:
+            return np.zeros((len(locations), len(modalities)))
+        return (
+            df.groupby(["LocationName", "ProcedureCategory"])["Unit"].sum()
+              .unstack(fill_value=0)
+              .reindex(index=locations, columns=modalities, fill_value=0)
+              .to_numpy(dtype=float)
+        )
@@ -1,8 +1,10 @@
 import logging
+import threading
 import datetime as dt
 from datetime import date
 from calendar import monthrange
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional
 from pandas.tseries.offsets import CustomBusinessDay
 import numpy as np
 import pandas as pd
@@ -36,13 +38,130 @@ def get_holidays() -> List[date]:
         logger.error(f"Error fetching holidays: {e}")
         raise
 
+class BusinessDayCalendar:
+    """
+    Holiday-aware business-day calendar over a multi-year span.
+
+    Built once from a holiday list: a day-by-day business-day flag and its
+    prefix sum, so counts between any two dates are O(1) lookups:
+
+        count(start, end) = prefix[end + 1] - prefix[start]
+
+    All counting methods accept a date or array-like of dates (vectorized).
+    The span grows automatically if a date outside it is requested; lookups
+    hold a lock so a concurrent rebuild can't mix old and new arrays.
+    """
+
+    def __init__(self, holidays: Iterable[date], start: Optional[date] = None, end: Optional[date] = None):
+        self._lock = threading.RLock()
+        self.holidays = np.array(sorted(set(holidays)), dtype="datetime64[D]")
+        self._busdaycal = np.busdaycalendar(holidays=self.holidays)
+
+        today = date.today()
+        start = start or date(today.year - 10, 1, 1)
+        end = end or date(today.year + 5, 12, 31)
+        self._build(np.datetime64(start, "D"), np.datetime64(end, "D"))
+
+    def _build(self, start: np.datetime64, end: np.datetime64) -> None:
+        self.start = start
+        self.end = end
+        days = np.arange(start, end + 1, dtype="datetime64[D]")
+        self._is_bday = np.is_busday(days, busdaycal=self._busdaycal)
+        self._prefix = np.concatenate(([0], np.cumsum(self._is_bday)))
+
+    def _cover(self, *dates) -> None:
+        """Grow the span (to whole years) so it contains every given date."""
+        days = [np.asarray(d, dtype="datetime64[D]") for d in dates]
+        lo = min(d.min() for d in days)
+        hi = max(d.max() for d in days)
+        if lo < self.start or hi > self.end:
+            new_start = min(self.start, lo.astype("datetime64[Y]").astype("datetime64[D]"))
+            new_end = max(self.end, (hi.astype("datetime64[Y]") + 1).astype("datetime64[D]") - 1)
+            self._build(new_start, new_end)
+
+    def _index(self, d) -> np.ndarray:
+        self._cover(d)
+        return (np.asarray(d, dtype="datetime64[D]") - self.start).astype(np.int64)
+
+    @staticmethod
+    def _scalar(value):
+        return int(value) if np.ndim(value) == 0 else value
+
+    # ---------- lookups ----------
+    def is_business_day(self, d):
+        """Weekday and not a holiday."""
+        with self._lock:
+            result = self._is_bday[self._index(d)]
+        return bool(result) if np.ndim(result) == 0 else result
+
+    def count(self, start, end):
+        """Business days in [start, end] inclusive (0 when end < start)."""
+        with self._lock:
+            self._cover(start, end)  # before indexing: growing moves self.start
+            i, j = self._index(start), self._index(end)
+            counts = np.maximum(self._prefix[j + 1] - self._prefix[i], 0)
+        return self._scalar(counts)
+
+    def mtd(self, d):
+        """Business days from the 1st of the month through d."""
+        d = np.asarray(d, dtype="datetime64[D]")
+        month_start = d.astype("datetime64[M]").astype("datetime64[D]")
+        return self.count(month_start, d)
+
+    def ytd(self, d):
+        """Business days from January 1 through d."""
+        d = np.asarray(d, dtype="datetime64[D]")
+        year_start = d.astype("datetime64[Y]").astype("datetime64[D]")
+        return self.count(year_start, d)
+
+    def month_total(self, year, month):
+        """Business days in the whole month (year/month may be arrays)."""
+        year = np.asarray(year, dtype=np.int64)
+        month = np.asarray(month, dtype=np.int64)
+        first = ((year - 1970) * 12 + (month - 1)).astype("datetime64[M]")
+        last = (first + 1).astype("datetime64[D]") - 1
+        return self.count(first.astype("datetime64[D]"), last)
+
+    def dates(self, start: date, end: date) -> pd.DatetimeIndex:
+        """Business dates in [start, end] as a DatetimeIndex."""
+        with self._lock:
+            self._cover(start, end)
+            i, j = self._index(start), self._index(end)
+            offsets = np.nonzero(self._is_bday[i:j + 1])[0] + i
+            return pd.DatetimeIndex(self.start + offsets)
+
+    def months(self, start: date, end: date) -> pd.DataFrame:
+        """Business days per month between start and end (Month, Year index)."""
+        bdays = pd.DataFrame({0: self.dates(start, end)})
+        bdays['Year'] = bdays[0].dt.year
+        bdays['Month'] = bdays[0].dt.month
+        bdays = pd.pivot_table(bdays, index=['Month', 'Year'], values=0, aggfunc='count')
+        bdays.rename(columns={0: 'BusinessDays'}, inplace=True)
+        return bdays
+
+
+_calendar_lock = threading.Lock()
+
+
+@lru_cache(maxsize=1)
+def _business_calendar() -> BusinessDayCalendar:
+    return BusinessDayCalendar(get_holidays())
+
+def get_business_calendar() -> BusinessDayCalendar:
+    """
+    Process-wide calendar built from the Holidays table (queried once, also
+    when several report jobs ask for it at the same time).
+    """
+    with _calendar_lock:
+        return _business_calendar()
+
 def get_business_days(start: date, end: date, holidays: Optional[List[date]] = None) -> int:
     """
     Calculates the number of business days between start and end, excluding holidays.
     """
     try:
         if holidays is None:
-            holidays = get_holidays()
+            return get_business_calendar().count(start, end)
         bdc = np.busdaycalendar(holidays=np.array(holidays, dtype='datetime64[D]'))
         freq = CustomBusinessDay(calendar=bdc)
         bdays = pd.bdate_range(start, end, freq=freq)
@@ -56,30 +175,21 @@ def get_mtd_business_days(end_date: date) -> int:
     """
     Gets business days month-to-date up to end_date.
     """
-    month_start = end_date.replace(day=1)
-    return get_business_days(month_start, end_date)
+    return get_business_calendar().mtd(end_date)
 
 def get_ytd_business_days(end_date: date) -> pd.DatetimeIndex:
     """
     Gets business days year-to-date up to end_date.
     """
     year_start = end_date.replace(month=1, day=1)
-    return pd.bdate_range(year_start, end_date, freq=CustomBusinessDay(calendar=np.busdaycalendar(holidays=get_holidays())))
+    return get_business_calendar().dates(year_start, end_date)
 
 def get_months_business_days(start: date, end: date) -> pd.DataFrame:
     """
     Gets business days per month between start and end.
     """
     try:
-        holidays = get_holidays()
-        bdc = np.busdaycalendar(holidays=np.array(holidays, dtype='datetime64[D]'))
-        freq = CustomBusinessDay(calendar=bdc)
-        bdays = pd.DataFrame(pd.bdate_range(start, end, freq=freq))
-        bdays['Year'] = pd.to_datetime(bdays[0]).dt.year
-        bdays['Month'] = pd.to_datetime(bdays[0]).dt.month
-        bdays = pd.pivot_table(bdays, index=['Month', 'Year'], values=0, aggfunc='count')
-        bdays.rename(columns={0: 'BusinessDays'}, inplace=True)
-        return bdays
+        return get_business_calendar().months(start, end)
     except Exception as e:
         logger.error(f"Error calculating monthly business days: {e}")
         raise
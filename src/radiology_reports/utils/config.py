@@ -49,9 +49,14 @@ class Config:
         except (socket.timeout, socket.gaierror, OSError, Exception):
             return False
 
+    # Set by pin_server(): skip the per-connection probe (shared in-process runs)
+    _pinned_server = None
+
     @property
     def DB_SERVER(self) -> str:
         """Auto-pick the reachable server"""
+        if self._pinned_server:
+            return self._pinned_server
         if self.DB_SERVER_PROD and self._can_connect_to(self.DB_SERVER_PROD):
             print(f"Connected to PRODUCTION server: {self.DB_SERVER_PROD}")
             return self.DB_SERVER_PROD
@@ -59,6 +64,15 @@ class Config:
             print(f"Using LOCAL server: {self.DB_SERVER_LOCAL}")
             return self.DB_SERVER_LOCAL
 
+    def pin_server(self) -> str:
+        """Probe once and reuse the answer until unpin_server()."""
+        self._pinned_server = None
+        self._pinned_server = self.DB_SERVER
+        return self._pinned_server
+
+    def unpin_server(self) -> None:
+        self._pinned_server = None
+
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
         return (
@@ -1,33 +1,53 @@
 # src/radiology_reports/utils/email_sender.py
 
 import logging
-import smtplib
+from concurrent.futures import Future
 from email.message import EmailMessage
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Union
 
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from radiology_reports.utils.mail_queue import SmtpSettings, deliver
 
 logger = logging.getLogger(__name__)
 
 
-class EmailConfig(BaseSettings):
+@lru_cache(maxsize=None)
+def _email_config_class():
     """
-    Configuration model for email settings, loaded from environment variables.
-    Validates required fields and provides defaults where appropriate.
+    EmailConfig is defined on first access: pydantic-settings costs more to
+    import than most runs spend sending mail, and the OPS path never uses it.
     """
-    model_config = SettingsConfigDict(
-        env_file=".env",
-        env_ignore_empty=True,
-        extra="ignore",
-    )
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    class EmailConfig(BaseSettings):
+        """
+        Configuration model for email settings, loaded from environment variables.
+        Validates required fields and provides defaults where appropriate.
+        """
+        model_config = SettingsConfigDict(
+            env_file=".env",
+            env_ignore_empty=True,
+            extra="ignore",
+        )
+
+        smtp_server: str
+        smtp_port: int = 25
+        sender_email: str
+        smtp_user: Optional[str] = None
+        smtp_password: Optional[str] = None
+        default_recipients: str
+
+    EmailConfig.__module__ = __name__
+    EmailConfig.__qualname__ = "EmailConfig"
+    return EmailConfig
+
 
-    smtp_server: str
-    smtp_port: int = 25
-    sender_email: str
-    smtp_user: Optional[str] = None
-    smtp_password: Optional[str] = None
-    default_recipients: str
+def __getattr__(name):
+    # `from radiology_reports.utils.email_sender import EmailConfig` still works
+    if name == "EmailConfig":
+        return _email_config_class()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def _extract_email_settings(config) -> dict:
@@ -35,8 +55,9 @@ def _extract_email_settings(config) -> dict:
     Normalize email settings from either EmailConfig (pydantic)
     or utils.config.Config (global singleton).
     """
-    # EmailConfig path (existing behavior)
-    if isinstance(config, EmailConfig):
+    # EmailConfig path (existing behavior); checked by shape so the
+    # OPS path doesn't have to build the pydantic class
+    if hasattr(config, "smtp_server"):
         return {
             "smtp_server": config.smtp_server,
             "smtp_port": config.smtp_port,
@@ -63,12 +84,13 @@ def send_email(
     recipients: List[str],
     attachments: Optional[List[Path]] = None,
     html_body: Optional[str] = None,
-) -> None:
+) -> Future:
     """
     Sends an email with the specified subject, body, recipients, optional attachments,
     and optional HTML body.
 
     Compatible with both EmailConfig and utils.config.Config.
+    Delivery is queued (utils/mail_queue.py); returns the delivery Future.
     """
     settings = _extract_email_settings(config)
 
@@ -100,20 +122,14 @@ def send_email(
                 filename=path.name,
             )
 
-    try:
-        with smtplib.SMTP(settings["smtp_server"], settings["smtp_port"]) as server:
-            if settings["smtp_user"] and settings["smtp_password"]:
-                server.login(settings["smtp_user"], settings["smtp_password"])
-            server.send_message(msg)
-
-        logger.info(
-            "Email sent successfully to: %s",
-            ", ".join(recipients),
-        )
-
-    except smtplib.SMTPException as e:
-        logger.error("SMTP error occurred: %s", e)
-        raise
-    except Exception as e:
-        logger.error("Unexpected error sending email: %s", e)
-        raise
+    return deliver(
+        SmtpSettings(
+            server=settings["smtp_server"],
+            port=settings["smtp_port"],
+            sender=settings["sender_email"],
+            user=settings["smtp_user"],
+            password=settings["smtp_password"],
+        ),
+        msg,
+        recipients,
+    )
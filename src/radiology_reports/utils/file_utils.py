@@ -3,16 +3,32 @@
 import os
 from datetime import datetime, timedelta
 import logging
-from pydantic_settings import BaseSettings, SettingsConfigDict
+from functools import lru_cache
 
-class AppConfig(BaseSettings):
-    model_config = SettingsConfigDict(env_file='.env', env_ignore_empty=True, extra='ignore')
+@lru_cache(maxsize=None)
+def get_app_config():
+    """
+    AppConfig (report_retention_days from .env), built on first use so
+    importing cleanup_old_files doesn't pull in pydantic-settings.
+    """
+    from pydantic_settings import BaseSettings, SettingsConfigDict
+
+    class AppConfig(BaseSettings):
+        model_config = SettingsConfigDict(env_file='.env', env_ignore_empty=True, extra='ignore')
+
+        report_retention_days: int = 30
 
-    report_retention_days: int = 30
+    return AppConfig()
 
-# In cleanup_old_files
-config = AppConfig()
-retention_days = config.report_retention_days
+def __getattr__(name):
+    # Former module-level globals, now resolved lazily
+    if name == "config":
+        return get_app_config()
+    if name == "retention_days":
+        return get_app_config().report_retention_days
+    if name == "AppConfig":
+        return type(get_app_config())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 logger = logging.getLogger(__name__)
 
@@ -1,20 +1,47 @@
 # utils/logger.py
+"""
+Shared logging setup.
+
+Loggers from get_logger() put records on an in-memory queue; a single
+QueueListener thread formats them and does the file / console I/O, so a
+log call in a hot loop never waits on disk. The listener starts with the
+first record and is drained and stopped at exit; forked child processes
+have no listener and write to the handlers synchronously.
+
+Set LOG_FORMAT=json for JSON lines in the log file (console stays text).
+Every record carries the run id (RUN_ID from the environment, else a new
+one per process); log_stage() adds per-stage timings.
+"""
+import atexit
+import copy
+import json
 import logging
+import logging.handlers
 import os
+import queue
+import threading
+import time
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from dotenv import load_dotenv
 
+from radiology_reports.utils.tracing import span
+
 load_dotenv()
 
 # Resolve radiology_reports package root
 PACKAGE_ROOT = Path(__file__).resolve().parents[1]
 
 LOG_DIR = PACKAGE_ROOT / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
 # Get config from .env (with safe defaults)
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
 LOG_FILE = os.getenv("LOG_FILE", LOG_DIR / "capacity_reporting.log")
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+
+# One id per run, shared with child processes that inherit the environment
+RUN_ID = os.getenv("RUN_ID") or uuid.uuid4().hex[:12]
 
 # Create formatter
 formatter = logging.Formatter(
@@ -22,16 +49,106 @@ formatter = logging.Formatter(
     datefmt="%Y-%m-%d %H:%M:%S"
 )
 
+class JsonLineFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, source, run id, message, stage timings."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "file": record.filename,
+            "line": record.lineno,
+            "run_id": getattr(record, "run_id", RUN_ID),
+            "msg": record.getMessage(),
+        }
+        for key in ("stage", "duration_ms"):
+            if hasattr(record, key):
+                entry[key] = getattr(record, key)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry["exc"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+class _DeferredFileHandler(logging.FileHandler):
+    """Creates the log directory and opens the file on the first record, not at import."""
+
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
 # File handler
-file_handler = logging.FileHandler(LOG_FILE, encoding="utf-8")
+file_handler = _DeferredFileHandler(LOG_FILE, encoding="utf-8", delay=True)
 file_handler.setLevel(LOG_LEVEL)
-file_handler.setFormatter(formatter)
+file_handler.setFormatter(JsonLineFormatter() if LOG_FORMAT == "json" else formatter)
 
 # Console handler (for local runs)
 console_handler = logging.StreamHandler()
 console_handler.setLevel("INFO")  # Always show INFO+ in console
 console_handler.setFormatter(formatter)
 
+# -------------------------------------------------
+# Background writer
+# -------------------------------------------------
+_listener_lock = threading.Lock()
+_listener = None
+_owner_pid = os.getpid()
+
+def _start_listener() -> None:
+    """Start the writer thread (once, on the first record)."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = logging.handlers.QueueListener(
+                queue_handler.queue, file_handler, console_handler, respect_handler_level=True
+            )
+            _listener.start()
+
+def shutdown_logging() -> None:
+    """Drain queued records, stop the writer thread and flush the handlers (runs at exit)."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None and os.getpid() == _owner_pid:
+            _listener.stop()
+        _listener = None
+    for handler in (file_handler, console_handler):
+        handler.flush()
+
+atexit.register(shutdown_logging)
+
+class _BackgroundQueueHandler(logging.handlers.QueueHandler):
+    """
+    Enqueues records (tagged with the run id); formatting and I/O happen on
+    the listener thread. Forked workers have no listener and may exit
+    without running atexit, so they write synchronously instead.
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if os.getpid() != _owner_pid:
+            record = self.prepare(record)
+            for handler in (file_handler, console_handler):
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        if _listener is None:
+            _start_listener()
+        super().emit(record)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Copy with the message merged on the caller's thread. Unlike
+        QueueHandler.prepare, exc_info is kept (not folded into msg), so
+        the writer's formatters render tracebacks (JSON "exc" field).
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.run_id = RUN_ID
+        return record
+
+queue_handler = _BackgroundQueueHandler(queue.SimpleQueue())
+
 def get_logger(name: str = "radiology_reports") -> logging.Logger:
     """Return a configured logger instance."""
     logger = logging.getLogger(name)
@@ -39,7 +156,27 @@ def get_logger(name: str = "radiology_reports") -> logging.Logger:
     
     # Avoid duplicate handlers if called multiple times
     if not logger.handlers:
-        logger.addHandler(file_handler)
-        logger.addHandler(console_handler)
+        logger.addHandler(queue_handler)
     
-    return logger
\ No newline at end of file
+    return logger
+
+@contextmanager
+def log_stage(stage: str, logger: logging.Logger | None = None):
+    """
+    Time a block and log it with `stage` and `duration_ms` attached
+    (fields in JSON lines; part of the message in text logs). The block
+    is also a tracing span, so it shows up in --profile trees.
+    """
+    logger = logger or get_logger()
+    start = time.perf_counter()
+    try:
+        with span(stage):
+            yield
+    except Exception:
+        ms = round((time.perf_counter() - start) * 1000, 1)
+        logger.error("Stage %s failed after %.1f ms", stage, ms,
+                     extra={"stage": stage, "duration_ms": ms}, stacklevel=3)
+        raise
+    ms = round((time.perf_counter() - start) * 1000, 1)
+    logger.info("Stage %s completed in %.1f ms", stage, ms,
+                extra={"stage": stage, "duration_ms": ms}, stacklevel=3)
@@ -0,0 +1,260 @@
+# src/radiology_reports/utils/mail_queue.py
+"""
+Outbound mail delivery for the report jobs.
+
+Messages are handed to a background worker instead of being sent inline,
+so a report run keeps rendering while the relay accepts mail:
+
+- consecutive messages for the same relay share one SMTP session (login
+  once); the session is closed after MAIL_LINGER_SECONDS idle
+- transient failures (connection errors, 4xx replies) are retried with
+  exponential backoff on a fresh session; permanent ones (5xx, refused
+  recipients) fail the message straight away. A retry is scheduled for
+  its due time, so other queued mail keeps going out during the backoff
+- every submit returns a Future; drain_mail() waits for outstanding mail
+  and raises if any of it failed, so the CLIs still exit non-zero when
+  delivery fails
+- anything still queued at interpreter exit is delivered before the
+  process ends (atexit)
+
+MAIL_ASYNC=0 makes every send wait for its own delivery (previous
+behaviour). The SMTP connection comes from `smtp_factory`, so a MailQueue
+can be pointed at a local SMTP stand-in or a fake session object
+(scripts/verify_mail_queue.py does both).
+"""
+
+from __future__ import annotations
+
+import atexit
+import heapq
+import itertools
+import logging
+import os
+import queue
+import smtplib
+import threading
+import time
+from concurrent.futures import Future, wait
+from dataclasses import dataclass, field
+from email.message import Message
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from radiology_reports.utils.tracing import span
+
+logger = logging.getLogger(__name__)
+
+SMTP_TIMEOUT_SECONDS = 60
+EXIT_FLUSH_SECONDS = 300
+
+
+def mail_async_enabled() -> bool:
+    return os.getenv("MAIL_ASYNC", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+@dataclass(frozen=True)
+class SmtpSettings:
+    server: str
+    port: int = 25
+    sender: str = ""
+    user: Optional[str] = None
+    password: Optional[str] = None
+
+
+@dataclass
+class _Outgoing:
+    settings: SmtpSettings
+    msg: Message
+    recipients: Tuple[str, ...]
+    future: Future = field(default_factory=Future)
+    attempts: int = 0
+
+
+def default_smtp_factory(settings: SmtpSettings) -> smtplib.SMTP:
+    return smtplib.SMTP(settings.server, settings.port, timeout=SMTP_TIMEOUT_SECONDS)
+
+
+def _retryable(exc: BaseException) -> bool:
+    """Connection problems and 4xx replies are worth another try; 5xx are not."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return False
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 400 <= exc.smtp_code < 500
+    return isinstance(exc, (smtplib.SMTPServerDisconnected, smtplib.SMTPConnectError, OSError))
+
+
+# =====================================================
+# Queue + worker
+# =====================================================
+class MailQueue:
+    def __init__(
+        self,
+        smtp_factory: Callable[[SmtpSettings], object] = default_smtp_factory,
+        max_attempts: int = 3,
+        backoff_seconds: float = 2.0,
+        linger_seconds: Optional[float] = None,
+    ):
+        self.smtp_factory = smtp_factory
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self.linger_seconds = (
+            float(os.getenv("MAIL_LINGER_SECONDS", "2")) if linger_seconds is None else linger_seconds
+        )
+        self._queue: "queue.Queue[_Outgoing]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending: List[Future] = []
+        self._thread: Optional[threading.Thread] = None
+        # (due, seq, item) for messages waiting out a backoff; worker thread only
+        self._retries: List[Tuple[float, int, _Outgoing]] = []
+        self._seq = itertools.count()
+
+    def submit(self, settings: SmtpSettings, msg: Message, recipients: Sequence[str]) -> Future:
+        """Queue one message; the Future resolves once the relay accepted it."""
+        item = _Outgoing(settings, msg, tuple(recipients))
+        with self._lock:
+            self._pending.append(item.future)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="mail-queue", daemon=True)
+                self._thread.start()
+        self._queue.put(item)
+        return item.future
+
+    def flush(self, timeout: Optional[float] = None) -> List[BaseException]:
+        """Wait for queued mail; returns failures not reported by an earlier flush."""
+        with self._lock:
+            pending = list(self._pending)
+        done, _ = wait(pending, timeout=timeout)
+        with self._lock:
+            self._pending = [f for f in self._pending if f not in done]
+        return [f.exception() for f in done if f.exception() is not None]
+
+    def discard(self, future: Future) -> None:
+        """Stop tracking a future whose outcome the caller already handled."""
+        with self._lock:
+            self._pending = [f for f in self._pending if f is not future]
+
+    # -------------------------------------------------
+    # Worker thread
+    # -------------------------------------------------
+    def _next(self, idle_timeout: Optional[float]) -> Optional[_Outgoing]:
+        """
+        Next message to send: a retry whose backoff is over, else new mail.
+        None once idle_timeout passes with nothing to send.
+        """
+        while True:
+            now = time.monotonic()
+            if self._retries and self._retries[0][0] <= now:
+                return heapq.heappop(self._retries)[2]
+            timeout = self._retries[0][0] - now if self._retries else None
+            if idle_timeout is not None:
+                timeout = idle_timeout if timeout is None else min(timeout, idle_timeout)
+            try:
+                return self._queue.get(timeout=timeout)
+            except queue.Empty:
+                if not self._retries or self._retries[0][0] > time.monotonic():
+                    return None
+
+    def _run(self) -> None:
+        session, current = None, None
+        while True:
+            item = self._next(self.linger_seconds if session else None)
+            if item is None:
+                session, current = self._close(session), None
+                continue
+
+            if session is not None and current != item.settings:
+                session, current = self._close(session), None
+            try:
+                with span("deliver.smtp"):
+                    if session is None:
+                        session, current = self._open(item.settings), item.settings
+                    session.send_message(
+                        item.msg,
+                        from_addr=item.settings.sender,
+                        to_addrs=list(item.recipients),
+                    )
+                item.future.set_result(None)
+                logger.info("Email '%s' sent to: %s", item.msg["Subject"], ", ".join(item.recipients))
+            except Exception as exc:
+                # the session may be unusable after any error: start fresh
+                session, current = self._close(session), None
+                self._retry_or_fail(item, exc)
+
+    def _open(self, settings: SmtpSettings):
+        session = self.smtp_factory(settings)
+        if settings.user and settings.password:
+            session.login(settings.user, settings.password)
+        return session
+
+    @staticmethod
+    def _close(session) -> None:
+        if session is None:
+            return None
+        try:
+            session.quit()
+        except Exception:
+            try:
+                session.close()
+            except Exception:
+                pass
+        return None
+
+    def _retry_or_fail(self, item: _Outgoing, exc: Exception) -> None:
+        item.attempts += 1
+        if _retryable(exc) and item.attempts < self.max_attempts:
+            delay = self.backoff_seconds * 2 ** (item.attempts - 1)
+            logger.warning(
+                "Email '%s' attempt %s failed (%s); retrying in %.0fs",
+                item.msg["Subject"], item.attempts, exc, delay,
+            )
+            heapq.heappush(self._retries, (time.monotonic() + delay, next(self._seq), item))
+            return
+        logger.error("Email '%s' to %s failed: %s", item.msg["Subject"], ", ".join(item.recipients), exc)
+        item.future.set_exception(exc)
+
+
+# =====================================================
+# Process-wide queue
+# =====================================================
+_default: Optional[MailQueue] = None
+_default_lock = threading.Lock()
+
+
+def mail_queue() -> MailQueue:
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = MailQueue()
+        return _default
+
+
+def deliver(settings: SmtpSettings, msg: Message, recipients: Sequence[str]) -> Future:
+    """
+    Send msg through the process-wide queue. With MAIL_ASYNC=0 this waits
+    for delivery and raises on failure; otherwise see drain_mail().
+    """
+    future = mail_queue().submit(settings, msg, recipients)
+    if not mail_async_enabled():
+        try:
+            future.result()
+        finally:
+            mail_queue().discard(future)
+    return future
+
+
+def drain_mail(timeout: Optional[float] = None) -> None:
+    """Wait for outstanding mail; RuntimeError if any of it failed."""
+    if _default is None:
+        return
+    with span("deliver.wait"):
+        failures = _default.flush(timeout)
+    if failures:
+        raise RuntimeError(f"{len(failures)} email(s) failed to send: {failures[0]}")
+
+
+def _flush_at_exit() -> None:
+    if _default is not None:
+        for exc in _default.flush(EXIT_FLUSH_SECONDS):
+            logger.error("Undelivered email at exit: %s", exc)
+
+
+atexit.register(_flush_at_exit)
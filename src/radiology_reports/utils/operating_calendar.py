@@ -0,0 +1,286 @@
+# src/radiology_reports/utils/operating_calendar.py
+"""
+Per-location operating-day calendar for budget pacing.
+
+Each location gets a day weight over a multi-year span:
+- 1.0 on weekdays the site is open
+- 0.5 on half days (get_half_days)
+- 0.0 on holidays and weekdays the site is closed
+- 0.0 outside the site's active span, when one is given (YTD: before a
+  site's first or after its last DAILY date of the year)
+
+Weights are prefix-summed per location, so "days open" for every location
+over any date range is one vectorized lookup. Budget MTD/YTD is then
+ProjectedDailyVolume × days open, computed with array multiplication
+instead of per-month DAILY day-count subqueries.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from radiology_reports.data.workload import get_location_open_dates
+from radiology_reports.utils.businessdays import get_business_calendar, get_half_days
+
+logger = logging.getLogger(__name__)
+
+# Budget pacing has never counted Saturdays (legacy YTD day-count queries)
+BUDGET_IGNORED_WEEKDAYS = (5,)
+BUSINESS_WEEKDAYS = (0, 1, 2, 3, 4)
+
+# Concurrent report jobs share the cached calendars: build each once
+_build_lock = threading.Lock()
+
+
+def _weekday(days: np.ndarray) -> np.ndarray:
+    # 1970-01-01 was a Thursday (weekday 3)
+    return (days.astype(np.int64) + 3) % 7
+
+
+class LocationOperatingCalendar:
+    """
+    open_weekdays: LocationName -> weekdays open (Mon=0 .. Sun=6)
+    active_spans:  LocationName -> (first, last) date the site is counted
+                   open; sites without one are open over the whole span
+    """
+
+    def __init__(
+        self,
+        open_weekdays: Dict[str, Iterable[int]],
+        holidays: Iterable[date] = (),
+        half_days: Iterable = (),
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        active_spans: Optional[Dict[str, Tuple[date, date]]] = None,
+    ):
+        today = date.today()
+        self.start = np.datetime64(start or date(today.year - 10, 1, 1), "D")
+        self.end = np.datetime64(end or date(today.year + 5, 12, 31), "D")
+
+        self.locations = sorted(open_weekdays)
+        self.open_weekdays = {loc: sorted(set(open_weekdays[loc])) for loc in self.locations}
+
+        mask = np.zeros((len(self.locations), 7), dtype=bool)
+        for i, loc in enumerate(self.locations):
+            mask[i, self.open_weekdays[loc]] = True
+
+        days = np.arange(self.start, self.end + 1, dtype="datetime64[D]")
+        day_weight = np.ones(len(days))
+        day_weight[np.isin(days, np.asarray(list(half_days), dtype="datetime64[D]"))] = 0.5
+        day_weight[np.isin(days, np.asarray(list(holidays), dtype="datetime64[D]"))] = 0.0
+
+        weights = mask[:, _weekday(days)] * day_weight
+        if active_spans:
+            spans = [active_spans.get(loc, (self.start, self.end)) for loc in self.locations]
+            first = np.array([s[0] for s in spans], dtype="datetime64[D]")[:, None]
+            last = np.array([s[1] for s in spans], dtype="datetime64[D]")[:, None]
+            weights = weights * ((days >= first) & (days <= last))
+        self._prefix = np.concatenate(
+            (np.zeros((len(self.locations), 1)), np.cumsum(weights, axis=1)),
+            axis=1,
+        )
+
+    # -------------------------------------------------
+    # BUILD FROM HISTORY
+    # -------------------------------------------------
+    @classmethod
+    def from_open_dates(
+        cls,
+        open_dates: pd.DataFrame,
+        holidays: Iterable[date] = (),
+        half_days: Iterable = (),
+        min_share: float = 0.5,
+        ignore_weekdays: Iterable[int] = BUDGET_IGNORED_WEEKDAYS,
+        clip_to_active: bool = False,
+        **span,
+    ) -> "LocationOperatingCalendar":
+        """
+        Infer open weekdays from (LocationName, ScheduleStartDate) rows: a
+        weekday is open when the site had activity on at least min_share of
+        that weekday's non-holiday dates between its own first and last
+        active dates (so new or temporarily closed sites aren't diluted by
+        the whole history window). Sites with no inferred weekday fall back
+        to business days (Mon-Fri). With clip_to_active, days outside each
+        site's first/last active date count 0.
+        """
+        holidays = list(holidays)
+        dates = pd.to_datetime(open_dates["ScheduleStartDate"]).dt.normalize()
+        if dates.empty:
+            return cls({}, holidays, half_days, **span)
+
+        seen_dates = (
+            pd.DataFrame({"LocationName": open_dates["LocationName"], "Date": dates})
+            .dropna()
+            .drop_duplicates()
+        )
+
+        # non-holiday dates of each weekday inside each site's active span
+        spans = seen_dates.groupby("LocationName")["Date"].agg(["min", "max"])
+        first = spans["min"].to_numpy(dtype="datetime64[D]")
+        last = spans["max"].to_numpy(dtype="datetime64[D]") + 1
+        holiday_days = np.asarray(holidays, dtype="datetime64[D]")
+        available = pd.DataFrame(
+            {
+                weekday: np.busday_count(
+                    first, last, weekmask=[int(d == weekday) for d in range(7)], holidays=holiday_days
+                )
+                for weekday in range(7)
+            },
+            index=spans.index,
+        ).stack()
+
+        seen = (
+            seen_dates.assign(Weekday=lambda d: d["Date"].dt.weekday)
+            .groupby(["LocationName", "Weekday"])
+            .size()
+        )
+        share = seen / available.reindex(seen.index).to_numpy()
+
+        ignored = set(ignore_weekdays)
+        open_weekdays: Dict[str, set] = {
+            loc: set() for loc in open_dates["LocationName"].dropna().unique()
+        }
+        for (loc, weekday), value in share.items():
+            if value >= min_share and weekday not in ignored:
+                open_weekdays[loc].add(int(weekday))
+
+        for loc, weekdays in open_weekdays.items():
+            if not weekdays:
+                logger.warning(f"No open weekdays inferred for {loc}; using business days.")
+                weekdays.update(BUSINESS_WEEKDAYS)
+
+        active_spans = None
+        if clip_to_active:
+            active_spans = {
+                loc: (row["min"].date(), row["max"].date()) for loc, row in spans.iterrows()
+            }
+        return cls(open_weekdays, holidays, half_days, active_spans=active_spans, **span)
+
+    # -------------------------------------------------
+    # LOOKUPS
+    # -------------------------------------------------
+    def _index(self, d) -> int:
+        d = np.datetime64(d, "D")
+        if d < self.start or d > self.end:
+            raise ValueError(f"{d} is outside the operating calendar span")
+        return int((d - self.start).astype(np.int64))
+
+    def days_open(self, start: date, end: date) -> pd.Series:
+        """Days open per location in [start, end] (half days count 0.5)."""
+        i, j = self._index(start), self._index(end)
+        days = np.maximum(self._prefix[:, j + 1] - self._prefix[:, i], 0)
+        return pd.Series(days, index=pd.Index(self.locations, name="LocationName"), name="Days")
+
+    def mtd(self, d: date) -> pd.Series:
+        return self.days_open(d.replace(day=1), d)
+
+    def ytd(self, d: date) -> pd.Series:
+        return self.days_open(d.replace(month=1, day=1), d)
+
+    def monthly(self, year: int, through: Optional[date] = None) -> pd.DataFrame:
+        """
+        Days open per (Month, Year, LocationName) for the year, counted
+        through `through` (months after it are omitted).
+        """
+        through = np.datetime64(through or date(year, 12, 31), "D")
+        firsts = np.arange(f"{year}-01", f"{year + 1}-01", dtype="datetime64[M]")
+        firsts = firsts[firsts.astype("datetime64[D]") <= through]
+        if len(firsts) == 0:
+            return pd.DataFrame(columns=["Month", "Year", "LocationName", "Days"])
+
+        starts = firsts.astype("datetime64[D]")
+        ends = np.minimum((firsts + 1).astype("datetime64[D]") - 1, through)
+        i = (starts - self.start).astype(np.int64)
+        j = (ends - self.start).astype(np.int64)
+        days = self._prefix[:, j + 1] - self._prefix[:, i]  # (locations, months)
+
+        months = firsts.astype(int) % 12 + 1
+        return pd.DataFrame(
+            {
+                "Month": np.tile(months, len(self.locations)),
+                "Year": year,
+                "LocationName": np.repeat(self.locations, len(months)),
+                "Days": days.ravel(),
+            }
+        )
+
+
+def _holidays_and_half_days(first_year: int, last_year: int):
+    business = get_business_calendar()
+    half_days = get_half_days(pd.DataFrame({"Year": range(first_year, last_year + 1)}))
+    return business.holidays, half_days
+
+
+def get_operating_calendar(lookback_days: int = 182) -> LocationOperatingCalendar:
+    """
+    Process-wide calendar inferred from the last `lookback_days` of DAILY.
+    Current open weekdays, used for MTD pacing; YTD uses
+    get_ytd_operating_days, inferred from each year's own history.
+    """
+    with _build_lock:
+        return _operating_calendar(lookback_days)
+
+
+@lru_cache(maxsize=1)
+def _operating_calendar(lookback_days: int) -> LocationOperatingCalendar:
+    end = date.today() - timedelta(days=1)
+    start = end - timedelta(days=lookback_days)
+
+    business = get_business_calendar()
+    first_year = int(str(business.start)[:4])
+    last_year = int(str(business.end)[:4])
+    holidays, half_days = _holidays_and_half_days(first_year, last_year)
+
+    calendar = LocationOperatingCalendar.from_open_dates(
+        get_location_open_dates(start, end),
+        holidays=holidays,
+        half_days=half_days,
+        start=date(first_year, 1, 1),
+        end=date(last_year, 12, 31),
+    )
+    logger.info(f"Operating calendar built for {len(calendar.locations)} locations.")
+    return calendar
+
+
+def get_year_operating_calendar(year: int, through: date) -> LocationOperatingCalendar:
+    """
+    Calendar for one year, inferred from that year's DAILY dates through
+    `through`. Days before a site's first or after its last active date of
+    the year count 0, and sites with no DAILY rows that year are absent
+    (as with the legacy distinct-date counts).
+    """
+    with _build_lock:
+        return _year_operating_calendar(year, through)
+
+
+@lru_cache(maxsize=None)
+def _year_operating_calendar(year: int, through: date) -> LocationOperatingCalendar:
+    holidays, half_days = _holidays_and_half_days(year, year)
+    return LocationOperatingCalendar.from_open_dates(
+        get_location_open_dates(date(year, 1, 1), through),
+        holidays=holidays,
+        half_days=half_days,
+        clip_to_active=True,
+        start=date(year, 1, 1),
+        end=date(year, 12, 31),
+    )
+
+
+def get_ytd_operating_days(year: int, through: Optional[date] = None) -> pd.DataFrame:
+    """
+    Days open per (Month, Year, LocationName) for budget/forecast YTD.
+    Defaults to counting through yesterday (or year end for past years);
+    months with no open days are dropped, as the DAILY day-count joins did.
+    """
+    if through is None:
+        through = min(date(year, 12, 31), date.today() - timedelta(days=1))
+
+    days = get_year_operating_calendar(year, through).monthly(year, through=through)
+    return days[days["Days"] > 0].reset_index(drop=True)
@@ -0,0 +1,375 @@
+# src/radiology_reports/utils/run_metrics.py
+"""
+Per-run performance history for the scheduled report jobs.
+
+Each CLI run is wrapped in recorded_run(job), which appends one row to a
+local SQLite store (default output/run_metrics.db, RUN_METRICS_DB to
+override) with:
+- wall time and exit status (failed runs are kept, with the error)
+- stage timings from the tracing spans (data.* / compute.* / render.* / deliver.*)
+- database query and row counts (connections from data.workload)
+- bytes written: files under the job's output folders, plus stdout
+
+When RUN_METRICS_TEXTFILE is set, the latest run per job is also written
+there in Prometheus text format (for node_exporter's textfile collector).
+RUN_METRICS=0 turns recording off. Recording never fails a report: store
+errors are logged and swallowed.
+
+cli/report_perf.py reads the store for p50 / p95 trends and regressions.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from radiology_reports.utils.tracing import collect, flatten
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_METRICS_DB = Path("output") / "run_metrics.db"
+PROM_PREFIX = "radiology_reports"
+
+
+def metrics_enabled() -> bool:
+    return os.getenv("RUN_METRICS", "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def default_db_path() -> Path:
+    return Path(os.getenv("RUN_METRICS_DB") or DEFAULT_METRICS_DB)
+
+
+@dataclass
+class RunRecord:
+    job: str
+    run_id: str
+    started_at: datetime
+    duration_ms: float = 0.0
+    exit_code: int = 0
+    error: Optional[str] = None
+    queries: int = 0
+    rows: int = 0
+    output_bytes: int = 0
+    stdout_bytes: int = 0
+    stages: Dict[str, Tuple[float, int]] = field(default_factory=dict)
+
+
+# =====================================================
+# Query / row counters
+# =====================================================
+class _Counters:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.queries = 0
+        self.rows = 0
+
+    def add(self, queries: int = 0, rows: int = 0) -> None:
+        with self.lock:
+            self.queries += queries
+            self.rows += rows
+
+
+_active: Optional[_Counters] = None
+
+
+class _CountingCursor:
+    """DB-API cursor proxy counting executes and fetched rows."""
+
+    def __init__(self, cursor, counters: _Counters):
+        self._cursor = cursor
+        self._counters = counters
+
+    def execute(self, *args, **kwargs):
+        self._counters.add(queries=1)
+        self._cursor.execute(*args, **kwargs)
+        return self
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._counters.add(rows=len(rows))
+        return rows
+
+    def fetchmany(self, *args):
+        rows = self._cursor.fetchmany(*args)
+        self._counters.add(rows=len(rows))
+        return rows
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        if row is not None:
+            self._counters.add(rows=1)
+        return row
+
+    def __iter__(self):
+        for row in self._cursor:
+            self._counters.add(rows=1)
+            yield row
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class _CountingConnection:
+    """DB-API connection proxy whose cursors are counted."""
+
+    def __init__(self, conn, counters: _Counters):
+        self._conn = conn
+        self._counters = counters
+
+    def cursor(self, *args, **kwargs):
+        return _CountingCursor(self._conn.cursor(*args, **kwargs), self._counters)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def instrument_connection(conn):
+    """Count queries and rows on conn while a run is being recorded (else conn as is)."""
+    counters = _active
+    return conn if counters is None else _CountingConnection(conn, counters)
+
+
+class _CountingStream:
+    """stdout wrapper counting bytes written by the report."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self.bytes = 0
+
+    def write(self, text):
+        self.bytes += len(text.encode("utf-8", errors="replace"))
+        return self._stream.write(text)
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _output_bytes(paths: Iterable, since: float) -> int:
+    """Size of files under paths modified at or after `since` (epoch seconds)."""
+    total = 0
+    for root in paths:
+        root = Path(root)
+        files = [root] if root.is_file() else (root.rglob("*") if root.is_dir() else [])
+        for f in files:
+            try:
+                st = f.stat()
+            except OSError:
+                continue
+            if f.is_file() and st.st_mtime >= since:
+                total += st.st_size
+    return total
+
+
+# =====================================================
+# Store
+# =====================================================
+class RunMetricsStore:
+    """SQLite tables: runs (one row per run) and stages (per run and stage path)."""
+
+    def __init__(self, path=None):
+        self.path = Path(path) if path else default_db_path()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS runs (
+                       id INTEGER PRIMARY KEY AUTOINCREMENT,
+                       run_id TEXT NOT NULL,
+                       job TEXT NOT NULL,
+                       started_at TEXT NOT NULL,
+                       duration_ms REAL NOT NULL,
+                       exit_code INTEGER NOT NULL,
+                       error TEXT,
+                       queries INTEGER NOT NULL,
+                       rows INTEGER NOT NULL,
+                       output_bytes INTEGER NOT NULL,
+                       stdout_bytes INTEGER NOT NULL)"""
+            )
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS stages (
+                       run INTEGER NOT NULL REFERENCES runs(id),
+                       stage TEXT NOT NULL,
+                       duration_ms REAL NOT NULL,
+                       calls INTEGER NOT NULL,
+                       PRIMARY KEY (run, stage))"""
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS runs_job_started ON runs (job, started_at)")
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def record(self, run: RunRecord) -> int:
+        with self._connect() as conn:
+            cur = conn.execute(
+                "INSERT INTO runs (run_id, job, started_at, duration_ms, exit_code, error, "
+                "queries, rows, output_bytes, stdout_bytes) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (run.run_id, run.job, run.started_at.isoformat(timespec="seconds"), run.duration_ms,
+                 run.exit_code, run.error, run.queries, run.rows, run.output_bytes, run.stdout_bytes),
+            )
+            run_pk = cur.lastrowid
+            conn.executemany(
+                "INSERT INTO stages VALUES (?, ?, ?, ?)",
+                [(run_pk, stage, ms, calls) for stage, (ms, calls) in run.stages.items()],
+            )
+        return run_pk
+
+    def runs(self, job: Optional[str] = None, since: Optional[datetime] = None):
+        """Runs as a DataFrame (started_at parsed), oldest first."""
+        import pandas as pd
+
+        sql, params = "SELECT * FROM runs WHERE 1 = 1", []
+        if job:
+            sql, params = sql + " AND job = ?", params + [job]
+        if since:
+            sql, params = sql + " AND started_at >= ?", params + [since.isoformat(timespec="seconds")]
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql + " ORDER BY started_at, id", conn, params=params)
+        df["started_at"] = pd.to_datetime(df["started_at"])
+        return df
+
+    def stages(self, job: Optional[str] = None, since: Optional[datetime] = None):
+        """Stage rows joined to their run (job, started_at, exit_code), oldest first."""
+        import pandas as pd
+
+        sql = ("SELECT r.id AS run, r.job, r.started_at, r.exit_code, s.stage, s.duration_ms, s.calls "
+               "FROM stages s JOIN runs r ON r.id = s.run WHERE 1 = 1")
+        params: List = []
+        if job:
+            sql, params = sql + " AND r.job = ?", params + [job]
+        if since:
+            sql, params = sql + " AND r.started_at >= ?", params + [since.isoformat(timespec="seconds")]
+        with self._connect() as conn:
+            df = pd.read_sql_query(sql + " ORDER BY r.started_at, r.id", conn, params=params)
+        df["started_at"] = pd.to_datetime(df["started_at"])
+        return df
+
+    def latest(self) -> Tuple[List[sqlite3.Row], List[tuple]]:
+        """Latest run per job plus its last success time and stages."""
+        with self._connect() as conn:
+            conn.row_factory = sqlite3.Row
+            runs = conn.execute(
+                """SELECT r.*,
+                          (SELECT MAX(started_at) FROM runs ok
+                            WHERE ok.job = r.job AND ok.exit_code = 0) AS last_success
+                   FROM runs r
+                   WHERE r.id = (SELECT MAX(id) FROM runs x WHERE x.job = r.job)
+                   ORDER BY r.job"""
+            ).fetchall()
+            stages = conn.execute(
+                "SELECT run, stage, duration_ms FROM stages WHERE run IN (%s)"
+                % ",".join("?" * len(runs)),
+                [r["id"] for r in runs],
+            ).fetchall() if runs else []
+        return runs, stages
+
+
+# =====================================================
+# Prometheus textfile
+# =====================================================
+def _label(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", " ")
+
+
+def _epoch(iso: Optional[str]) -> Optional[float]:
+    return datetime.fromisoformat(iso).timestamp() if iso else None
+
+
+def export_prometheus(store: RunMetricsStore, path) -> Path:
+    """Write the latest run of every job as Prometheus gauges (atomic replace)."""
+    runs, stages = store.latest()
+    job_of = {r["id"]: r["job"] for r in runs}
+
+    metrics = [
+        ("run_duration_seconds", "Wall time of the latest run", lambda r: r["duration_ms"] / 1000),
+        ("run_exit_code", "Exit code of the latest run (0 = success)", lambda r: r["exit_code"]),
+        ("run_timestamp_seconds", "Start time of the latest run", lambda r: _epoch(r["started_at"])),
+        ("last_success_timestamp_seconds", "Start time of the latest successful run",
+         lambda r: _epoch(r["last_success"])),
+        ("run_queries", "Database queries in the latest run", lambda r: r["queries"]),
+        ("run_rows", "Database rows fetched in the latest run", lambda r: r["rows"]),
+        ("run_output_bytes", "Bytes of files written by the latest run", lambda r: r["output_bytes"]),
+        ("run_stdout_bytes", "Bytes printed by the latest run", lambda r: r["stdout_bytes"]),
+    ]
+
+    lines = []
+    for name, help_text, value in metrics:
+        lines += [f"# HELP {PROM_PREFIX}_{name} {help_text}", f"# TYPE {PROM_PREFIX}_{name} gauge"]
+        for r in runs:
+            v = value(r)
+            if v is not None:
+                lines.append(f'{PROM_PREFIX}_{name}{{job="{_label(r["job"])}"}} {v}')
+
+    name = f"{PROM_PREFIX}_stage_duration_seconds"
+    lines += [f"# HELP {name} Stage wall time in the latest run", f"# TYPE {name} gauge"]
+    for run_pk, stage, ms in stages:
+        lines.append(f'{name}{{job="{_label(job_of[run_pk])}",stage="{_label(stage)}"}} {ms / 1000}')
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+    return path
+
+
+# =====================================================
+# Recording
+# =====================================================
+@contextmanager
+def recorded_run(job: str, outputs: Iterable = (), store: Optional[RunMetricsStore] = None):
+    """
+    Record the enclosed run of `job` (see module docstring). Yields the
+    RunRecord, or None when recording is off. Exceptions are recorded as
+    a failed run and re-raised; callers that turn errors into a return
+    code can also set record.exit_code / record.error themselves.
+    """
+    global _active
+    if not metrics_enabled():
+        yield None
+        return
+
+    from radiology_reports.utils.logger import RUN_ID
+
+    run = RunRecord(job=job, run_id=RUN_ID, started_at=datetime.now())
+    since = time.time() - 1  # mtime resolution
+    counters, previous = _Counters(), _active
+    stdout = _CountingStream(sys.stdout)
+    _active, sys.stdout = counters, stdout
+    start = time.perf_counter()
+    root = None
+    try:
+        with collect(job) as root:
+            yield run
+    except SystemExit as exc:
+        code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+        run.exit_code, run.error = code, None if code == 0 else str(exc.code)
+        raise
+    except BaseException as exc:
+        run.exit_code = 130 if isinstance(exc, KeyboardInterrupt) else 1
+        run.error = f"{type(exc).__name__}: {exc}"[:500]
+        raise
+    finally:
+        run.duration_ms = (time.perf_counter() - start) * 1000
+        _active = previous
+        if sys.stdout is stdout:
+            sys.stdout = stdout._stream
+        run.queries, run.rows = counters.queries, counters.rows
+        run.stdout_bytes = stdout.bytes
+        try:
+            run.stages = flatten(root) if root is not None else {}
+            run.output_bytes = _output_bytes(outputs, since)
+            store = store or RunMetricsStore()
+            store.record(run)
+            textfile = os.getenv("RUN_METRICS_TEXTFILE")
+            if textfile:
+                export_prometheus(store, textfile)
+        except Exception as exc:
+            logger.warning("Run metrics not recorded for %s: %s", job, exc)
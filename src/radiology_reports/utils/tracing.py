@@ -0,0 +1,198 @@
+# src/radiology_reports/utils/tracing.py
+"""
+Lightweight stage tracing for the report CLIs.
+
+Pipeline stages are wrapped in named spans:
+
+    data.*      database / prefetch loads
+    compute.*   adapters and domain use cases
+    render.*    console text, PDFs, email bodies / HTML
+    deliver.*   SMTP
+
+Spans cost almost nothing outside a recorded run (collect(), used by
+--profile and the run-metrics store). `--profile` prints
+the span tree (same-named siblings merged, with call counts) to stderr
+when the run ends; `--profile=cprofile` also writes a cProfile .prof
+file for the run (open with snakeviz or `python -m pstats`).
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROFILE_MODES = ("tree", "cprofile")
+DEFAULT_PROFILE_DIR = Path("output") / "profiles"
+
+
+@dataclass
+class Span:
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    duration: Optional[float] = None
+    children: List["Span"] = field(default_factory=list)
+
+    @property
+    def ms(self) -> float:
+        end = self.start + self.duration if self.duration is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+
+_current: ContextVar[Optional[Span]] = ContextVar("radiology_reports_span", default=None)
+_root: Optional[Span] = None
+
+
+# =====================================================
+# Spans
+# =====================================================
+@contextmanager
+def span(name: str):
+    """
+    Time a stage as a child of the enclosing span. A no-op outside a
+    recorded run. Spans opened on worker threads attach to the run root.
+    """
+    parent = _current.get() or _root
+    if parent is None:
+        yield None
+        return
+
+    s = Span(name)
+    parent.children.append(s)
+    token = _current.set(s)
+    try:
+        yield s
+    finally:
+        s.duration = time.perf_counter() - s.start
+        _current.reset(token)
+
+
+def traced(name: str):
+    """Decorator form of span()."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+@contextmanager
+def collect(run_name: str):
+    """
+    Record every span opened in the block under a root span and yield it.
+    Inside an already-recorded run the existing root is shared.
+    """
+    global _root
+    if _root is not None:
+        yield _root
+        return
+
+    _root = Span(run_name)
+    token = _current.set(_root)
+    try:
+        yield _root
+    finally:
+        _root.duration = time.perf_counter() - _root.start
+        _current.reset(token)
+        _root = None
+
+
+# =====================================================
+# Span tree
+# =====================================================
+def _merge(spans: List[Span]) -> List[tuple]:
+    """Group same-named siblings: [(name, total_ms, count, children)] in first-seen order."""
+    groups: Dict[str, list] = {}
+    for s in spans:
+        g = groups.setdefault(s.name, [0.0, 0, []])
+        g[0] += s.ms
+        g[1] += 1
+        g[2].extend(s.children)
+    return [(name, ms, n, kids) for name, (ms, n, kids) in groups.items()]
+
+
+def flatten(root: Span) -> Dict[str, tuple]:
+    """{"parent/child" path: (total ms, calls)} for every stage below the root."""
+    stages: Dict[str, tuple] = {}
+
+    def walk(prefix, children):
+        for name, ms, count, kids in _merge(children):
+            path = f"{prefix}/{name}" if prefix else name
+            stages[path] = (ms, count)
+            walk(path, kids)
+
+    walk("", root.children)
+    return stages
+
+
+def format_tree(root: Span) -> str:
+    """Indented span tree with total ms, share of the run and call counts."""
+    total = root.ms or 1.0
+    lines = [f"{'ms':>10}  {'%run':>6}  stage"]
+
+    def walk(name, ms, count, children, depth):
+        calls = f"  (x{count})" if count > 1 else ""
+        lines.append(f"{ms:10.1f}  {ms / total * 100:5.1f}%  {'  ' * depth}{name}{calls}")
+        for child in _merge(children):
+            walk(*child, depth + 1)
+
+    walk(root.name, root.ms, 1, root.children, 0)
+    return "\n".join(lines)
+
+
+# =====================================================
+# CLI integration
+# =====================================================
+def add_profile_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="tree",
+        choices=PROFILE_MODES,
+        help="Print a stage timing tree to stderr; --profile=cprofile also writes a .prof file.",
+    )
+
+
+@contextmanager
+def profiled(mode: Optional[str], run_name: str, out_dir=DEFAULT_PROFILE_DIR):
+    """
+    Profile the enclosed run. mode None: nothing is recorded. "tree":
+    span tree on stderr. "cprofile": tree plus <out_dir>/<run>_<timestamp>.prof.
+    """
+    if not mode:
+        yield
+        return
+
+    profiler = None
+    if mode == "cprofile":
+        import cProfile
+
+        profiler = cProfile.Profile()
+
+    with collect(run_name) as root:
+        if profiler:
+            profiler.enable()
+        try:
+            yield
+        finally:
+            if profiler:
+                profiler.disable()
+            root.duration = time.perf_counter() - root.start
+
+            print(f"\nPROFILE — {run_name}", file=sys.stderr)
+            print(format_tree(root), file=sys.stderr)
+            if profiler:
+                out_dir = Path(out_dir)
+                out_dir.mkdir(parents=True, exist_ok=True)
+                path = out_dir / f"{run_name.replace('.', '_')}_{datetime.now():%Y%m%d_%H%M%S}.prof"
+                profiler.dump_stats(path)
+                print(f"cProfile stats written to {path}", file=sys.stderr)